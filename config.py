@@ -50,6 +50,9 @@ class Config:
     # 처리 설정
     MAX_RETRIES: int = int(get_config_value("MAX_RETRIES", "3"))
     RETRY_DELAY: int = int(get_config_value("RETRY_DELAY", "2"))
+    # 채점 재시도 대기: min(최대값, 기본값 * 2^시도) * (0.5~1.5 무작위 지터)
+    RETRY_BACKOFF_BASE_SECONDS: float = float(get_config_value("RETRY_BACKOFF_BASE_SECONDS", "0.5"))
+    RETRY_BACKOFF_MAX_SECONDS: float = float(get_config_value("RETRY_BACKOFF_MAX_SECONDS", "30"))
     CHUNK_SIZE: int = int(get_config_value("CHUNK_SIZE", "300"))
     CHUNK_OVERLAP: int = int(get_config_value("CHUNK_OVERLAP", "50"))
     TOP_K_RETRIEVAL: int = int(get_config_value("TOP_K_RETRIEVAL", "3"))
@@ -58,15 +61,59 @@ class Config:
     MAX_DOCS_PER_STUDENT: int = int(os.getenv("MAX_DOCS_PER_STUDENT", "5"))
     CHUNKS_PER_DOC_LIMIT: int = int(os.getenv("CHUNKS_PER_DOC_LIMIT", "300"))
     RAG_PROCESSING_TIMEOUT: int = int(os.getenv("RAG_PROCESSING_TIMEOUT", "60"))
-    EMBEDDING_BATCH_SIZE: int = int(os.getenv("EMBEDDING_BATCH_SIZE", "8"))
+    EMBEDDING_BATCH_SIZE: int = int(os.getenv("EMBEDDING_BATCH_SIZE", "128"))
     ENABLE_INCREMENTAL_CLEANUP: bool = os.getenv("ENABLE_INCREMENTAL_CLEANUP", "true").lower() == "true"
+    # 청크 수가 임계값을 넘으면 Flat 대신 근사 최근접 이웃(IVF-PQ) 인덱스 사용
+    FAISS_ANN_THRESHOLD: int = int(os.getenv("FAISS_ANN_THRESHOLD", "10000"))
+    FAISS_ANN_INDEX_FACTORY: str = os.getenv("FAISS_ANN_INDEX_FACTORY", "OPQ32_128,IVF{nlist}_HNSW32,PQ32")
+    FAISS_ANN_NPROBE: int = int(os.getenv("FAISS_ANN_NPROBE", "16"))
+    # Flat 인덱스 벡터 저장 형식 ("int8": 스칼라 양자화, "fp32": 원본 float32)
+    FAISS_QUANTIZATION: str = os.getenv("FAISS_QUANTIZATION", "int8").lower()
+    # 동일한 참고 자료로 다시 채점할 때 재사용할 FAISS 인덱스 디스크 캐시
+    FAISS_CACHE_ENABLED: bool = os.getenv("FAISS_CACHE_ENABLED", "true").lower() == "true"
+    FAISS_CACHE_DIR: str = os.getenv("FAISS_CACHE_DIR", os.path.join(os.path.expanduser("~"), ".cache", "goe_assess", "faiss"))
+    # 청크 단위 임베딩 디스크 캐시 (참고 자료 조합이 달라져도 이미 임베딩한 청크는 재사용)
+    EMBEDDING_CACHE_ENABLED: bool = os.getenv("EMBEDDING_CACHE_ENABLED", "true").lower() == "true"
+    EMBEDDING_CACHE_PATH: str = os.getenv("EMBEDDING_CACHE_PATH", os.path.join(os.path.expanduser("~"), ".cache", "goe_assess", "embeddings.sqlite3"))
+    # 메모리에 보관할 파일별 임베딩 샤드 수와 업로드 파일 해시 메모 항목 수 (초과 시 오래된 것부터 제거)
+    RAG_SHARD_CACHE_SIZE: int = int(os.getenv("RAG_SHARD_CACHE_SIZE", "32"))
+    RAG_FILE_HASH_MEMO_SIZE: int = int(os.getenv("RAG_FILE_HASH_MEMO_SIZE", "256"))
     
     # 성능 최적화 설정
+    # Gemini에 JSON 본문만 응답하도록 요청 (응답 앞뒤 설명문으로 인한 파싱 실패 및 재시도 방지)
+    GEMINI_JSON_OUTPUT: bool = os.getenv("GEMINI_JSON_OUTPUT", "true").lower() == "true"
+    # 루브릭 접두부를 Gemini 컨텍스트 캐시에 한 번 올려 두고 학생별 부분만 전송 (기본 비활성, 저장 비용 발생)
+    GEMINI_CONTEXT_CACHE_ENABLED: bool = os.getenv("GEMINI_CONTEXT_CACHE_ENABLED", "false").lower() == "true"
+    GEMINI_CONTEXT_CACHE_TTL_SECONDS: int = int(os.getenv("GEMINI_CONTEXT_CACHE_TTL_SECONDS", "3600"))
     API_CACHE_TTL_SECONDS: int = int(os.getenv("API_CACHE_TTL_SECONDS", "300"))
     API_CACHE_MAX_SIZE: int = int(os.getenv("API_CACHE_MAX_SIZE", "100"))
     
     # 배치 처리 설정
     BATCH_PROCESSING_SIZE: int = int(os.getenv("BATCH_PROCESSING_SIZE", "10"))
+    # 서술형 답안을 한 요청에 묶어 채점할 학생 수 (1이면 학생별 요청, 응답 해석 실패 시 절반으로 줄임)
+    PACKED_GRADING_BATCH_SIZE: int = int(os.getenv("PACKED_GRADING_BATCH_SIZE", "1"))
+    # 한 요청에 묶는 답안 글자 수 합계 상한 (모델 컨텍스트의 절반 이하로 유지)
+    PACKED_PROMPT_MAX_CHARS: int = int(os.getenv("PACKED_PROMPT_MAX_CHARS", "20000"))
+    # 동시 채점 시 동시에 진행할 최대 LLM 요청 수 (API 속도 제한 보호)
+    MAX_CONCURRENT_REQUESTS: int = int(os.getenv("MAX_CONCURRENT_REQUESTS", "8"))
+    # model_type="auto"일 때 제공자별 동시 요청 한도 (제공자별 속도 제한에 맞춰 조정)
+    GEMINI_MAX_CONCURRENCY: int = int(os.getenv("GEMINI_MAX_CONCURRENCY", "8"))
+    GROQ_MAX_CONCURRENCY: int = int(os.getenv("GROQ_MAX_CONCURRENCY", "4"))
+    # 제공자별 분당 요청 한도 (토큰 버킷으로 요청 간격 조절, 0이면 제한 없음)
+    GEMINI_REQUESTS_PER_MINUTE: float = float(os.getenv("GEMINI_REQUESTS_PER_MINUTE", "0"))
+    GROQ_REQUESTS_PER_MINUTE: float = float(os.getenv("GROQ_REQUESTS_PER_MINUTE", "0"))
+    # 학생별 채점 결과 체크포인트 파일 (JSONL, 비어 있으면 사용 안 함)
+    # 중단된 채점을 다시 시작할 때 이미 성공한 학생은 API 호출 없이 복원
+    GRADING_CHECKPOINT_PATH: str = os.getenv("GRADING_CHECKPOINT_PATH", "")
+    # 같은 답안/루브릭/모델 조합의 채점 결과 디스크 캐시 (재시도 및 재실행 시 API 재호출 방지)
+    GRADING_CACHE_ENABLED: bool = os.getenv("GRADING_CACHE_ENABLED", "false").lower() == "true"
+    GRADING_CACHE_DIR: str = os.getenv("GRADING_CACHE_DIR", os.path.join(os.path.expanduser("~"), ".cache", "goe_assess", "grading"))
+    GRADING_CACHE_TTL_SECONDS: int = int(os.getenv("GRADING_CACHE_TTL_SECONDS", "3600"))
+    # 뜻이 같은 서술형 답안(패러프레이즈)에 이전 채점 결과 재사용 (같은 루브릭/모델 안에서만, 기본 비활성)
+    SEMANTIC_CACHE_ENABLED: bool = os.getenv("SEMANTIC_CACHE_ENABLED", "false").lower() == "true"
+    SEMANTIC_CACHE_MODEL: str = os.getenv("SEMANTIC_CACHE_MODEL", "sentence-transformers/paraphrase-multilingual-MiniLM-L12-v2")
+    SEMANTIC_CACHE_THRESHOLD: float = float(os.getenv("SEMANTIC_CACHE_THRESHOLD", "0.92"))
+    SEMANTIC_CACHE_MAX_ENTRIES: int = int(os.getenv("SEMANTIC_CACHE_MAX_ENTRIES", "2000"))
     
     @classmethod
     def validate_api_keys(cls) -> dict:
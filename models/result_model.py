@@ -118,19 +118,22 @@ class GradingResult:
             reasoning=reasoning
         )
         self.element_scores.append(element_score)
-        self._calculate_totals()
+        # 전체를 다시 합산하지 않고 새 요소만 더함 (요소를 하나씩 추가할 때 O(n²) 방지)
+        self.total_score += element_score.score
+        self.total_max_score += element_score.max_score
     
     def update_element_score(self, element_name: str, score: int, feedback: str = "", reasoning: str = ""):
         """특정 요소의 점수를 업데이트합니다."""
         for element_score in self.element_scores:
             if element_score.element_name == element_name:
+                previous_score = element_score.score
                 element_score.score = score
                 if feedback:
                     element_score.feedback = feedback
                 if reasoning:
                     element_score.reasoning = reasoning
                 element_score._validate_data()  # 업데이트 후 재검증
-                self._calculate_totals()
+                self.total_score += score - previous_score
                 return
         
         raise ValueError(f"Element '{element_name}' not found in scores")
@@ -177,6 +180,7 @@ class GradingResult:
                     "score": element.score,
                     "max_score": element.max_score,
                     "feedback": element.feedback,
+                    "reasoning": element.reasoning,
                     "percentage": element.percentage
                 }
                 for element in self.element_scores
@@ -211,7 +215,8 @@ class GradingResult:
                 element_name=element_data["element_name"],
                 score=element_data["score"],
                 max_score=element_data["max_score"],
-                feedback=element_data.get("feedback", "")
+                feedback=element_data.get("feedback", ""),
+                reasoning=element_data.get("reasoning", "")
             )
         
         return result
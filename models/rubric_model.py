@@ -3,7 +3,7 @@
 평가 기준, 평가 요소, 루브릭 클래스를 정의합니다.
 """
 from dataclasses import dataclass, field
-from typing import List, Dict
+from typing import Dict, Iterable, List, Tuple
 import json
 
 
@@ -43,6 +43,14 @@ class EvaluationElement:
         self.criteria.append(criteria)
         self._calculate_max_score()
     
+    def add_criteria_bulk(self, pairs: Iterable[Tuple[int, str]]):
+        """여러 평가 기준을 한 번에 추가 (최대 점수는 마지막에 한 번만 계산)"""
+        self.criteria.extend(
+            EvaluationCriteria(score=score, description=description)
+            for score, description in pairs
+        )
+        self._calculate_max_score()
+    
     def update_criteria(self, index: int, score: int, description: str):
         """기존 기준 업데이트 및 최대 점수 재계산"""
         if 0 <= index < len(self.criteria):
@@ -109,6 +117,10 @@ class Rubric:
             "total_max_score": self.total_max_score
         }
     
+    def canonical_json(self) -> str:
+        """키 순서와 공백을 고정한 JSON 문자열 (같은 내용의 루브릭은 항상 같은 문자열)"""
+        return json.dumps(self.to_dict(), ensure_ascii=False, sort_keys=True, separators=(',', ':'))
+    
     @classmethod
     def from_dict(cls, data: Dict) -> 'Rubric':
         """딕셔너리 형식에서 루브릭 생성"""
@@ -116,13 +128,11 @@ class Rubric:
         
         for element_data in data["elements"]:
             element = EvaluationElement(name=element_data["name"])
-            
-            for criteria_data in element_data["criteria"]:
-                element.add_criteria(
-                    score=criteria_data["score"],
-                    description=criteria_data["description"]
-                )
-            
-            rubric.add_element(element)
+            element.add_criteria_bulk(
+                (criteria_data["score"], criteria_data["description"])
+                for criteria_data in element_data["criteria"]
+            )
+            rubric.elements.append(element)
         
+        rubric.update_total_score()
         return rubric
\ No newline at end of file
@@ -6,11 +6,13 @@ from typing import Optional
 from pathlib import Path
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class Student:
     """
     답안 데이터가 포함된 학생을 나타냅니다.
     
+    생성 후에는 변경할 수 없으며, 해시 가능하므로 집합이나 딕셔너리 키로 쓸 수 있습니다.
+    
     Attributes:
         name: 학생 이름
         class_number: 학생 반 번호
@@ -3,16 +3,68 @@
 Excel 파일 업로드 및 형식 검증, PDF/DOCX 문서 내용 추출, 이미지 파일과 학생 이름 매칭 기능을 제공합니다.
 """
 
+import hashlib
+import io
 import os
 import re
-from typing import List, Dict, Optional, Tuple, Any
+from typing import IO, List, Dict, Optional, Tuple, Any, Callable, Union
 from pathlib import Path
+from functools import lru_cache
+from collections import OrderedDict
+import numpy as np
 import pandas as pd
 import docx
+from docx.oxml.ns import qn
 from PyPDF2 import PdfReader
 from models.student_model import Student
 from utils.error_handler import handle_error, ErrorType, ErrorInfo
 
+# Excel 입력: 파일 경로 또는 메모리상의 파일 객체/바이트 (예: Streamlit UploadedFile)
+ExcelSource = Union[str, os.PathLike, IO[bytes], bytes]
+
+# 이름 매칭 시 제거할 문자 (영문, 숫자, 한글 이외)
+_NAME_CLEAN_RE = re.compile(r'[^a-zA-Z0-9가-힣]')
+
+
+@lru_cache(maxsize=4096)
+def _normalize_name(name: str) -> str:
+    """매칭용 이름 정규화 (같은 이름/파일명의 반복 정규화는 캐시로 처리)"""
+    return _NAME_CLEAN_RE.sub('', name.lower().strip())
+
+
+# RapidFuzz가 설치되어 있으면 규칙 기반 매칭 실패 시 유사도 매칭에 사용
+try:
+    from rapidfuzz import fuzz, process as fuzz_process
+except ImportError:
+    fuzz = None
+    fuzz_process = None
+
+# DOCX 본문 순회에 사용하는 WordprocessingML 태그 이름
+_W_P = qn('w:p')
+_W_T = qn('w:t')
+_W_TBL = qn('w:tbl')
+_W_TR = qn('w:tr')
+_W_TC = qn('w:tc')
+
+# PDFium(C++) 기반 pypdfium2가 설치되어 있으면 PDF 텍스트 추출에 사용
+try:
+    import pypdfium2 as pdfium
+except ImportError:
+    pdfium = None
+
+# 대용량 .xlsx는 xlsx2csv로 스트리밍 변환 후 pandas C 파서로 읽음
+try:
+    from xlsx2csv import Xlsx2csv
+except ImportError:
+    Xlsx2csv = None
+
+# Rust 기반 calamine 엔진이 설치되어 있으면 Excel 파싱에 사용
+try:
+    import python_calamine  # noqa: F401
+    _EXCEL_ENGINE: Optional[str] = "calamine"
+except ImportError:
+    _EXCEL_ENGINE = None
+
 
 class FileProcessingError(Exception):
     """파일 처리 관련 예외 클래스"""
@@ -31,6 +83,19 @@ class FileService:
     DESCRIPTIVE_REQUIRED_COLUMNS = ['학생 이름', '반', '답안']
     MAP_REQUIRED_COLUMNS = ['학생 이름', '반']
     
+    # 서술형 답안 최소 길이 (공백 제외 문자 수)
+    MIN_ANSWER_LENGTH = 5
+    
+    # 이름-파일명 유사도 매칭 최소 점수 (RapidFuzz WRatio, 0~100)
+    FUZZY_MATCH_CUTOFF = 85
+    
+    # 이 크기를 넘는 .xlsx는 xlsx2csv 스트리밍 경로로 읽음 (설치된 경우)
+    LARGE_EXCEL_BYTES = 5 * 1024 * 1024
+    
+    # 성공한 Excel 검증 결과 캐시 (프로세스 내 모든 인스턴스가 공유)
+    VALIDATION_CACHE_SIZE = 64
+    _validation_cache: "OrderedDict[Tuple, Dict[str, Any]]" = OrderedDict()
+    
     # 영어 컬럼명 매핑
     COLUMN_MAPPINGS = {
         '학생 이름': ['학생 이름', '이름', 'Student', 'student', 'Student Name', 'student name'],
@@ -91,12 +156,176 @@ class FileService:
         print(f"DEBUG: 매핑 후 최종 컬럼: {list(df_mapped.columns)}")
         return df_mapped
 
-    def validate_excel_format(self, file_path: str, grading_type: str) -> Dict[str, Any]:
+    def _read_excel(
+        self,
+        file_path: Union[str, os.PathLike, IO[bytes]],
+        usecols: Optional[Callable[[Any], bool]] = None,
+        dtype: Optional[type] = None
+    ) -> pd.DataFrame:
+        """
+        Excel 파일을 DataFrame으로 읽기
+        
+        python-calamine이 설치되어 있으면 calamine 엔진을 사용하고, 없으면 .xlsx는
+        openpyxl 읽기 전용 모드로, 그 외 형식은 pandas 기본 엔진으로 읽습니다.
+        
+        Args:
+            file_path: Excel 파일 경로 또는 바이너리 파일 객체
+            usecols: 읽을 컬럼을 고르는 함수 (None이면 전체 컬럼)
+            dtype: 모든 컬럼에 적용할 자료형 (예: str)
+        """
+        if not isinstance(file_path, (str, os.PathLike)):
+            # 메모리상의 파일 객체는 이름의 확장자로 형식을 판단하고 처음부터 읽음
+            file_path.seek(0)
+            is_xlsx = Path(str(getattr(file_path, 'name', ''))).suffix.lower() in ('', '.xlsx')
+            if _EXCEL_ENGINE is None and is_xlsx:
+                return self._read_xlsx_fast(file_path, usecols=usecols, dtype=dtype)
+            return pd.read_excel(file_path, engine=_EXCEL_ENGINE, usecols=usecols, dtype=dtype)
+        
+        is_xlsx = Path(file_path).suffix.lower() == '.xlsx'
+        if is_xlsx and Xlsx2csv is not None and os.path.getsize(file_path) > self.LARGE_EXCEL_BYTES:
+            return self._read_xlsx_streaming(file_path, usecols=usecols, dtype=dtype)
+        if _EXCEL_ENGINE is None and is_xlsx:
+            return self._read_xlsx_fast(file_path, usecols=usecols, dtype=dtype)
+        return pd.read_excel(file_path, engine=_EXCEL_ENGINE, usecols=usecols, dtype=dtype)
+
+    def _read_xlsx_streaming(
+        self,
+        file_path: str,
+        usecols: Optional[Callable[[Any], bool]] = None,
+        dtype: Optional[type] = None
+    ) -> pd.DataFrame:
+        """대용량 .xlsx를 xlsx2csv로 CSV 스트림 변환 후 pandas C 파서로 읽기"""
+        buffer = io.StringIO()
+        Xlsx2csv(file_path, outputencoding='utf-8').convert(buffer, sheetid=1)
+        buffer.seek(0)
+        return pd.read_csv(buffer, usecols=usecols, dtype=dtype)
+
+    def _read_xlsx_fast(
+        self,
+        file_path: Union[str, os.PathLike, IO[bytes]],
+        usecols: Optional[Callable[[Any], bool]] = None,
+        dtype: Optional[type] = None
+    ) -> pd.DataFrame:
+        """
+        openpyxl 읽기 전용 모드로 첫 번째 시트를 값만 읽어 DataFrame 생성
+        
+        셀 객체 트리를 만들지 않고 행 단위로 값만 스트리밍합니다.
+        """
+        import openpyxl
+        
+        workbook = openpyxl.load_workbook(file_path, read_only=True, data_only=True)
+        try:
+            worksheet = workbook.worksheets[0]
+            worksheet.reset_dimensions()
+            rows = list(worksheet.iter_rows(values_only=True))
+        finally:
+            workbook.close()
+        
+        # pandas와 동일하게 끝부분의 완전히 빈 행은 제외
+        while rows and all(value is None for value in rows[-1]):
+            rows.pop()
+        
+        if not rows:
+            return pd.DataFrame()
+        
+        header = [
+            value if value is not None else f"Unnamed: {i}"
+            for i, value in enumerate(rows[0])
+        ]
+        keep = [i for i, column in enumerate(header) if usecols is None or usecols(column)]
+        
+        data = [[row[i] for i in keep] for row in rows[1:]]
+        if dtype is not None:
+            data = [[dtype(value) if value is not None else None for value in row] for row in data]
+        return pd.DataFrame(data, columns=[header[i] for i in keep])
+
+    def _required_column_filter(self, grading_type: str) -> Callable[[Any], bool]:
+        """채점 유형에 필요한 컬럼(영어 별칭 포함)만 통과시키는 usecols 함수 생성"""
+        if grading_type == 'descriptive':
+            required_columns = self.DESCRIPTIVE_REQUIRED_COLUMNS
+        else:
+            required_columns = self.MAP_REQUIRED_COLUMNS
+        
+        accepted_names = {
+            variant
+            for column in required_columns
+            for variant in self.COLUMN_MAPPINGS[column]
+        }
+        return lambda column: str(column).strip() in accepted_names
+
+    def validate_excel_format(self, file_path: ExcelSource, grading_type: str) -> Dict[str, Any]:
+        """
+        Excel 파일 형식 검증 (같은 내용의 성공한 검증 결과는 캐시에서 재사용)
+        
+        file_path에는 경로뿐 아니라 업로드된 파일 객체나 바이트도 넘길 수 있으며,
+        이 경우 임시 파일 없이 메모리에서 바로 읽습니다.
+        """
+        if isinstance(file_path, (bytes, bytearray)):
+            file_path = io.BytesIO(file_path)
+        
+        cache_key = self._validation_cache_key(file_path, grading_type)
+        if cache_key is not None:
+            cached_result = FileService._validation_cache.get(cache_key)
+            if cached_result is not None:
+                FileService._validation_cache.move_to_end(cache_key)
+                # 호출자가 DataFrame을 수정해도 캐시된 원본이 바뀌지 않도록 복사본 반환
+                result = dict(cached_result)
+                result['data'] = cached_result['data'].copy()
+                return result
+        
+        result = self._validate_excel_format_uncached(file_path, grading_type)
+        
+        if cache_key is not None and result.get('success'):
+            cached_result = dict(result)
+            cached_result['data'] = result['data'].copy()
+            FileService._validation_cache[cache_key] = cached_result
+            if len(FileService._validation_cache) > self.VALIDATION_CACHE_SIZE:
+                FileService._validation_cache.popitem(last=False)
+        return result
+
+    def _validation_cache_key(self, file_path: ExcelSource, grading_type: str) -> Optional[Tuple]:
+        """
+        (파일 내용 SHA-256, 파일 형식, 채점 유형) 기반 검증 캐시 키
+        
+        수정 시각 대신 내용으로 판단하므로 클라우드 동기화 폴더처럼 mtime이 바뀌어도
+        내용이 같으면 재사용합니다. 해시를 구할 수 없으면 None.
+        """
+        try:
+            if isinstance(file_path, (str, os.PathLike)):
+                digest = self._content_hash(file_path)
+                source_name = str(file_path)
+            elif hasattr(file_path, 'getbuffer'):
+                digest = hashlib.sha256(file_path.getbuffer()).hexdigest()
+                source_name = str(getattr(file_path, 'name', ''))
+            else:
+                return None
+        except (OSError, ValueError):
+            return None
+        return (digest, Path(source_name).suffix.lower(), grading_type)
+
+    @staticmethod
+    def _content_hash(file_path: Union[str, os.PathLike]) -> str:
+        """파일 내용의 SHA-256 (전체를 메모리로 읽지 않고 스트리밍으로 계산)"""
+        with open(file_path, 'rb') as file:
+            if hasattr(hashlib, 'file_digest'):
+                return hashlib.file_digest(file, 'sha256').hexdigest()
+            # Python 3.10 이하: 고정 크기 블록 단위로 갱신
+            digest = hashlib.sha256()
+            for block in iter(lambda: file.read(1024 * 1024), b''):
+                digest.update(block)
+            return digest.hexdigest()
+
+    def _validate_excel_format_uncached(self, file_path: ExcelSource, grading_type: str) -> Dict[str, Any]:
         """Excel 파일 형식 검증"""
         print(f"DEBUG: validate_excel_format이 grading_type='{grading_type}'로 호출됨")
         
         try:
-            if not os.path.exists(file_path):
+            if not isinstance(file_path, (str, os.PathLike)):
+                if isinstance(file_path, (bytes, bytearray)):
+                    file_path = io.BytesIO(file_path)
+                # 이름이 없는 메모리 버퍼는 .xlsx로 간주
+                file_extension = Path(str(getattr(file_path, 'name', ''))).suffix.lower() or '.xlsx'
+            elif not os.path.exists(file_path):
                 error_info = handle_error(
                     FileNotFoundError(f"파일을 찾을 수 없습니다: {file_path}"),
                     ErrorType.FILE_PROCESSING,
@@ -109,8 +338,9 @@ class FileService:
                     'data': None,
                     'error_info': error_info
                 }
+            else:
+                file_extension = Path(file_path).suffix.lower()
             
-            file_extension = Path(file_path).suffix.lower()
             if file_extension not in self.SUPPORTED_EXCEL_EXTENSIONS:
                 error_info = handle_error(
                     ValueError(f"지원하지 않는 파일 형식: {file_extension}"),
@@ -125,7 +355,15 @@ class FileService:
                     'error_info': error_info
                 }
             
-            df = pd.read_excel(file_path)
+            # 필요한 컬럼만 문자열로 읽어 불필요한 파싱과 자료형 추론을 생략
+            df = self._read_excel(
+                file_path,
+                usecols=self._required_column_filter(grading_type),
+                dtype=str
+            )
+            if len(df.columns) == 0:
+                # 필수 컬럼이 하나도 없으면 정확한 오류 보고를 위해 전체 컬럼을 다시 읽음
+                df = self._read_excel(file_path, dtype=str)
             # Map column names to Korean equivalents
             df_mapped = self._map_column_names(df)
             print(f"DEBUG: Excel file loaded successfully, mapped columns: {list(df_mapped.columns)}")
@@ -212,25 +450,27 @@ class FileService:
                 # Map grading only requires student name and class
                 required_columns = self.MAP_REQUIRED_COLUMNS
             
-            # Check for null values in required columns
-            for col in required_columns:
-                if df[col].isnull().any():
-                    null_rows = df[df[col].isnull()].index.tolist()
-                    error_info = handle_error(
-                        ValueError(f'"{col}" 컬럼에 빈 값이 있습니다. 행 번호: {null_rows}'),
-                        ErrorType.VALIDATION,
-                        context=f"_validate_excel_data: null values in column {col}",
-                        user_context="Excel 데이터 검증"
-                    )
-                    return {
-                        'success': False,
-                        'message': error_info.user_message,
-                        'data': None,
-                        'error_info': error_info
-                    }
+            # Check for null values in required columns (one vectorized pass over all columns)
+            null_mask = df[required_columns].isnull()
+            null_columns = null_mask.columns[null_mask.any().to_numpy()]
+            if len(null_columns) > 0:
+                col = null_columns[0]
+                null_rows = df.index[null_mask[col].to_numpy()].tolist()
+                error_info = handle_error(
+                    ValueError(f'"{col}" 컬럼에 빈 값이 있습니다. 행 번호: {null_rows}'),
+                    ErrorType.VALIDATION,
+                    context=f"_validate_excel_data: null values in column {col}",
+                    user_context="Excel 데이터 검증"
+                )
+                return {
+                    'success': False,
+                    'message': error_info.user_message,
+                    'data': None,
+                    'error_info': error_info
+                }
             
             # Check for duplicate student names
-            duplicate_names = df[df['학생 이름'].duplicated()]['학생 이름'].tolist()
+            duplicate_names = df.loc[df['학생 이름'].duplicated(), '학생 이름'].tolist()
             if duplicate_names:
                 error_info = handle_error(
                     ValueError(f'중복된 학생 이름: {duplicate_names}'),
@@ -247,10 +487,8 @@ class FileService:
             
             # Check answer length for descriptive type
             if grading_type == 'descriptive':
-                short_answers = []
-                for idx, answer in enumerate(df['답안']):
-                    if len(str(answer).strip()) < 5:
-                        short_answers.append(idx + 1)
+                answer_lengths = df['답안'].astype(str).str.strip().str.len().to_numpy()
+                short_answers = (np.flatnonzero(answer_lengths < self.MIN_ANSWER_LENGTH) + 1).tolist()
                 
                 if short_answers:
                     error_info = handle_error(
@@ -286,7 +524,7 @@ class FileService:
                 'error_info': error_info
             }
 
-    def process_student_data(self, excel_file_path: str, grading_type: str, 
+    def process_student_data(self, excel_file_path: ExcelSource, grading_type: str, 
                            image_files: Optional[List[str]] = None) -> Dict[str, Any]:
         """학생 데이터 처리 및 Student 객체 생성"""
         try:
@@ -299,7 +537,16 @@ class FileService:
             
             image_mapping = {}
             if grading_type == 'map' and image_files:
-                match_result = self.match_images_to_students(df['학생 이름'].tolist(), image_files)
+                # 매칭용 이름 정규화를 컬럼 단위로 한 번에 수행
+                normalized_names = (
+                    df['학생 이름'].astype(str).str.lower().str.strip()
+                    .str.replace(_NAME_CLEAN_RE, '', regex=True)
+                )
+                match_result = self.match_images_to_students(
+                    df['학생 이름'].tolist(),
+                    image_files,
+                    normalized_names=normalized_names.tolist()
+                )
                 if not match_result['success']:
                     return match_result
                 image_mapping = match_result['mapping']
@@ -347,26 +594,51 @@ class FileService:
         except Exception as e:
             raise FileProcessingError(f"학생 데이터 처리 중 오류 발생: {str(e)}")
 
-    def match_images_to_students(self, student_names: List[str], image_files: List[str]) -> Dict[str, Any]:
-        """이미지 파일과 학생 이름 매칭"""
+    def match_images_to_students(
+        self,
+        student_names: List[str],
+        image_files: List[str],
+        normalized_names: Optional[List[str]] = None
+    ) -> Dict[str, Any]:
+        """
+        이미지 파일과 학생 이름 매칭
+        
+        Args:
+            student_names: 학생 이름 목록
+            image_files: 이미지 파일 경로 목록
+            normalized_names: student_names와 같은 순서로 미리 정규화된 이름 (없으면 여기서 정규화)
+        """
         try:
+            if normalized_names is None:
+                normalized_names = [self._clean_name_for_matching(name) for name in student_names]
+            
             mapping = {}
             unmatched_students = []
             
-            for student_name in student_names:
-                matched = False
-                student_name_clean = self._clean_name_for_matching(student_name)
-                
-                for image_path in image_files:
-                    image_filename = Path(image_path).stem
-                    image_name_clean = self._clean_name_for_matching(image_filename)
-                    
-                    if self._is_name_match(student_name_clean, image_name_clean):
-                        mapping[student_name] = image_path
-                        matched = True
-                        break
+            # 이미지 파일명은 한 번만 정규화하고, 정확히 일치하는 이름은 해시 조회로 처리
+            cleaned_images = [
+                (self._clean_name_for_matching(Path(image_path).stem), image_path)
+                for image_path in image_files
+            ]
+            exact_index = {}
+            for image_name_clean, image_path in cleaned_images:
+                exact_index.setdefault(image_name_clean, image_path)
+            
+            for student_name, student_name_clean in zip(student_names, normalized_names):
+                image_path = exact_index.get(student_name_clean)
+                if image_path is None:
+                    # 정확히 일치하는 파일이 없을 때만 부분 일치 규칙으로 순차 검색
+                    image_path = next(
+                        (path for image_name_clean, path in cleaned_images
+                         if self._is_name_match(student_name_clean, image_name_clean)),
+                        None
+                    )
+                if image_path is None:
+                    image_path = self._fuzzy_match_image(student_name_clean, cleaned_images)
                 
-                if not matched:
+                if image_path is not None:
+                    mapping[student_name] = image_path
+                else:
                     unmatched_students.append(student_name)
             
             if unmatched_students:
@@ -385,10 +657,33 @@ class FileService:
         except Exception as e:
             raise FileProcessingError(f"이미지 매칭 중 오류 발생: {str(e)}")
 
+    def _fuzzy_match_image(self, student_name_clean: str, cleaned_images: List[Tuple[str, str]]) -> Optional[str]:
+        """
+        RapidFuzz 유사도로 가장 가까운 이미지 파일 찾기
+        
+        Args:
+            student_name_clean: 정규화된 학생 이름
+            cleaned_images: (정규화된 파일명, 파일 경로) 목록
+            
+        Returns:
+            유사도 기준(FUZZY_MATCH_CUTOFF)을 넘는 이미지 경로, 없거나 RapidFuzz 미설치 시 None
+        """
+        if fuzz_process is None or not student_name_clean or not cleaned_images:
+            return None
+        
+        match = fuzz_process.extractOne(
+            student_name_clean,
+            [image_name_clean for image_name_clean, _ in cleaned_images],
+            scorer=fuzz.WRatio,
+            score_cutoff=self.FUZZY_MATCH_CUTOFF
+        )
+        if match is None:
+            return None
+        return cleaned_images[match[2]][1]
+
     def _clean_name_for_matching(self, name: str) -> str:
         """매칭을 위한 이름 정규화"""
-        cleaned = re.sub(r'[^a-zA-Z0-9가-힣]', '', name.lower().strip())
-        return cleaned
+        return _normalize_name(name)
 
     def _is_name_match(self, student_name: str, image_name: str) -> bool:
         """학생 이름과 이미지 파일명 매칭 여부 확인"""
@@ -452,6 +747,12 @@ class FileService:
 
     def _extract_pdf_content(self, file_path: str) -> str:
         """PDF 파일에서 텍스트 내용 추출"""
+        if pdfium is not None:
+            try:
+                return self._extract_pdf_content_pdfium(file_path)
+            except Exception as e:
+                print(f"pypdfium2 추출 실패, PyPDF2로 재시도: {str(e)}")
+        
         try:
             content = ""
             with open(file_path, 'rb') as file:
@@ -472,26 +773,55 @@ class FileService:
         except Exception as e:
             raise FileProcessingError(f"PDF 내용 추출 중 오류: {str(e)}")
 
+    def _extract_pdf_content_pdfium(self, file_path: str) -> str:
+        """pypdfium2로 PDF 텍스트 추출 (페이지 표시 형식은 PyPDF2 경로와 동일)"""
+        page_texts = []
+        pdf = pdfium.PdfDocument(file_path)
+        try:
+            for page_num in range(len(pdf)):
+                page = pdf[page_num]
+                try:
+                    textpage = page.get_textpage()
+                    page_text = textpage.get_text_range()
+                    textpage.close()
+                finally:
+                    page.close()
+                
+                if page_text:
+                    page_texts.append(f"\n--- 페이지 {page_num + 1} ---\n{page_text}")
+        finally:
+            pdf.close()
+        
+        return "".join(page_texts).strip()
+
     def _extract_docx_content(self, file_path: str) -> str:
-        """DOCX 파일에서 텍스트 내용 추출"""
+        """DOCX 파일에서 텍스트 내용 추출 (본문 XML 트리를 한 번만 순회)"""
         try:
             doc = docx.Document(file_path)
-            content = ""
-            
-            for paragraph in doc.paragraphs:
-                if paragraph.text.strip():
-                    content += paragraph.text + "\n"
-            
-            for table in doc.tables:
-                for row in table.rows:
-                    row_text = []
-                    for cell in row.cells:
-                        if cell.text.strip():
-                            row_text.append(cell.text.strip())
-                    if row_text:
-                        content += " | ".join(row_text) + "\n"
-            
-            return content.strip()
+            paragraph_lines = []
+            table_lines = []
+            
+            # python-docx 래퍼 객체를 만들지 않고 본문의 w:p / w:tbl 요소를 직접 순회
+            for child in doc.element.body.iterchildren():
+                if child.tag == _W_P:
+                    text = _docx_paragraph_text(child)
+                    if text.strip():
+                        paragraph_lines.append(text)
+                elif child.tag == _W_TBL:
+                    for row in child.iterchildren(_W_TR):
+                        row_text = []
+                        for cell in row.iterchildren(_W_TC):
+                            cell_text = "\n".join(
+                                _docx_paragraph_text(paragraph)
+                                for paragraph in cell.iterchildren(_W_P)
+                            ).strip()
+                            if cell_text:
+                                row_text.append(cell_text)
+                        if row_text:
+                            table_lines.append(" | ".join(row_text))
+            
+            # 기존과 동일하게 문단 다음에 표 내용을 배치
+            return "\n".join(paragraph_lines + table_lines).strip()
             
         except Exception as e:
             raise FileProcessingError(f"DOCX 내용 추출 중 오류: {str(e)}")
@@ -502,8 +832,12 @@ class FileService:
             valid_files = []
             invalid_files = []
             
+            # 같은 폴더의 파일은 scandir 한 번으로 존재 여부와 크기를 함께 조회
+            directory_entries = self._scan_parent_directories(image_files)
+            
             for file_path in image_files:
-                if not os.path.exists(file_path):
+                entry = directory_entries.get(os.path.dirname(file_path), {}).get(os.path.basename(file_path))
+                if entry is None:
                     invalid_files.append(f"{file_path} (파일 없음)")
                     continue
                 
@@ -512,7 +846,7 @@ class FileService:
                     invalid_files.append(f"{file_path} (지원하지 않는 형식)")
                     continue
                 
-                file_size = os.path.getsize(file_path)
+                file_size = entry.stat().st_size
                 if file_size > 50 * 1024 * 1024:  # 50MB
                     invalid_files.append(f"{file_path} (파일 크기 초과: {file_size // (1024*1024)}MB)")
                     continue
@@ -535,6 +869,25 @@ class FileService:
         except Exception as e:
             raise FileProcessingError(f"이미지 파일 검증 중 오류 발생: {str(e)}")
 
+    def _scan_parent_directories(self, file_paths: List[str]) -> Dict[str, Dict[str, os.DirEntry]]:
+        """
+        파일 경로들의 상위 폴더를 폴더당 한 번씩 scandir로 조회
+        
+        Args:
+            file_paths: 조회할 파일 경로 목록
+            
+        Returns:
+            {상위 폴더 경로: {파일명: DirEntry}} (열 수 없는 폴더는 빈 딕셔너리)
+        """
+        directory_entries = {}
+        for parent in {os.path.dirname(file_path) for file_path in file_paths}:
+            try:
+                with os.scandir(parent or '.') as entries:
+                    directory_entries[parent] = {entry.name: entry for entry in entries}
+            except OSError:
+                directory_entries[parent] = {}
+        return directory_entries
+
     def get_file_info(self, file_path: str) -> Dict[str, Any]:
         """파일 정보 조회"""
         try:
@@ -560,4 +913,9 @@ class FileService:
             return {
                 'exists': False,
                 'message': f'파일 정보 조회 중 오류: {str(e)}'
-            }
\ No newline at end of file
+            }
+
+
+def _docx_paragraph_text(paragraph_element) -> str:
+    """w:p 요소 아래 모든 w:t 텍스트 연결"""
+    return "".join(text_node.text or "" for text_node in paragraph_element.iter(_W_T))
@@ -5,9 +5,20 @@
 여러 학생의 채점 프로세스를 조율하는 핵심 순차 채점 실행 엔진을 제공합니다.
 """
 
+import os
+import copy
+import json
+import math
 import time
+import queue
+import asyncio
+import hashlib
 import logging
-from typing import List, Dict, Optional, Callable, Any
+import threading
+from array import array
+from collections import OrderedDict
+from typing import List, Dict, Optional, Callable, Any, Union, Iterator, Tuple, Awaitable, TypeVar
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass, field
 from datetime import datetime
 from enum import Enum
@@ -15,15 +26,47 @@ from enum import Enum
 from models.student_model import Student
 from models.rubric_model import Rubric
 from models.result_model import GradingResult, GradingTimer
-from services.llm_service import LLMService, GradingType
+from services.llm_service import LLMService, GradingType, LLMModelType
 from services.rag_service import RAGService, format_retrieved_content
+from services.semantic_cache import SemanticCache
+from utils.cache_utils import DiskCache
+from utils.error_handler import compute_retry_delay
 from config import config
 
+# Rust 기반 orjson이 설치되어 있으면 체크포인트/캐시/요약 JSON 직렬화에 사용
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 
 # 로깅 설정
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# 디스크 캐시 앞단에 두는 메모리 캐시의 최대 항목 수
+_MEMORY_CACHE_SIZE = 4096
+
+# 진행 상황 콜백 최소 간격 (진행률 1% 또는 0.5초 중 먼저 도달하는 쪽)
+_PROGRESS_MIN_STEP_PERCENT = 1.0
+_PROGRESS_MIN_INTERVAL_SECONDS = 0.5
+
+T = TypeVar("T")
+
+
+def _dumps_json(data: Any) -> bytes:
+    """데이터를 UTF-8 JSON 바이트로 직렬화 (orjson이 있으면 사용)"""
+    if orjson is not None:
+        return orjson.dumps(data)
+    return json.dumps(data, ensure_ascii=False).encode("utf-8")
+
+
+def _loads_json(data: Union[str, bytes]) -> Any:
+    """JSON 문자열/바이트 역직렬화 (orjson이 있으면 사용)"""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
 
 class GradingStatus(Enum):
     """채점 상태를 나타내는 열거형"""
@@ -34,7 +77,7 @@ class GradingStatus(Enum):
     CANCELLED = "cancelled"
 
 
-@dataclass
+@dataclass(slots=True)
 class StudentGradingStatus:
     """
     개별 학생의 채점 상태를 나타냅니다.
@@ -45,26 +88,28 @@ class StudentGradingStatus:
         result: 채점 결과 (완료된 경우)
         error_message: 오류 메시지 (실패한 경우)
         attempt_count: 채점 시도 횟수
-        start_time: 채점 시작 시간
-        end_time: 채점 완료/실패 시간
+        start_time: 채점 시작 시점 (time.perf_counter 값)
+        end_time: 채점 완료/실패 시점 (time.perf_counter 값)
+        started_at: 화면 표시용 채점 시작 시각
     """
     student: Student
     status: GradingStatus = GradingStatus.NOT_STARTED
     result: Optional[GradingResult] = None
     error_message: Optional[str] = None
     attempt_count: int = 0
-    start_time: Optional[datetime] = None
-    end_time: Optional[datetime] = None
+    start_time: Optional[float] = None
+    end_time: Optional[float] = None
+    started_at: Optional[datetime] = None
     
     @property
     def processing_time(self) -> float:
-        """처리 시간을 초 단위로 가져옵니다."""
-        if self.start_time and self.end_time:
-            return (self.end_time - self.start_time).total_seconds()
+        """처리 시간을 초 단위로 가져옵니다 (단조 시계 기준이라 시스템 시각 변경에 영향받지 않음)."""
+        if self.start_time is not None and self.end_time is not None:
+            return self.end_time - self.start_time
         return 0.0
 
 
-@dataclass
+@dataclass(slots=True)
 class GradingProgress:
     """
     전체 채점 진행 상황을 나타냅니다.
@@ -74,17 +119,24 @@ class GradingProgress:
         completed_students: 완료된 학생 수
         failed_students: 실패한 학생 수
         current_student_index: 현재 처리 중인 학생 인덱스
+        current_student_name: 현재 처리 중인 학생 이름
+        current_student_class: 현재 처리 중인 학생 반
         start_time: 배치 채점 시작 시간
-        estimated_completion_time: 예상 완료 시간
+        estimated_completion_time: 예상 완료 시각 (epoch 초)
         average_processing_time: 학생당 평균 처리 시간
     """
     total_students: int
     completed_students: int = 0
     failed_students: int = 0
     current_student_index: int = 0
+    current_student_name: str = ""
+    current_student_class: str = ""
     start_time: Optional[datetime] = None
-    estimated_completion_time: Optional[datetime] = None
+    estimated_completion_time: Optional[float] = None
     average_processing_time: float = 0.0
+    _time_sum: float = field(default=0.0, init=False, repr=False)
+    # 학생별 처리 시간 (float 객체 대신 연속된 double 배열로 보관)
+    _times: array = field(default_factory=lambda: array('d'), init=False, repr=False)
     
     @property
     def progress_percentage(self) -> float:
@@ -98,14 +150,144 @@ class GradingProgress:
         """남은 학생 수를 가져옵니다."""
         return self.total_students - self.completed_students - self.failed_students
     
-    def update_estimates(self, processing_times: List[float]):
-        """완료된 처리 시간을 기반으로 시간 추정치를 업데이트합니다."""
-        if processing_times:
-            self.average_processing_time = sum(processing_times) / len(processing_times)
+    @property
+    def total_processing_time(self) -> float:
+        """완료된 학생들의 처리 시간 합계"""
+        return self._time_sum
+    
+    def processing_time_stats(self) -> Dict[str, float]:
+        """처리 시간의 최소/최대/평균/중앙값/95백분위 (기록이 없으면 빈 딕셔너리)"""
+        count = len(self._times)
+        if not count:
+            return {}
+        
+        ordered = sorted(self._times)
+        
+        def _percentile(q: float) -> float:
+            # nearest-rank 방식
+            return ordered[max(math.ceil(q * count) - 1, 0)]
+        
+        return {
+            "min": ordered[0],
+            "max": ordered[-1],
+            "mean": self._time_sum / count,
+            "p50": _percentile(0.5),
+            "p95": _percentile(0.95)
+        }
+    
+    def snapshot(self) -> "GradingProgress":
+        """다른 스레드에 넘길 사본 (처리 시간 배열까지 복사하여 엔진의 상태와 공유하지 않음)"""
+        snapshot = copy.copy(self)
+        snapshot._times = array('d', self._times)
+        return snapshot
+    
+    def update_estimates(self, processing_time: Union[float, List[float], None] = None):
+        """
+        완료된 처리 시간을 기반으로 시간 추정치를 업데이트합니다.
+        
+        새로 완료된 학생 한 명의 처리 시간을 넘기면 누적 합계와 개수만 갱신하여 O(1)로
+        평균을 구합니다. 시간 없이 호출하면 현재 평균으로 예상 완료 시각만 다시 계산하고,
+        이전 방식처럼 전체 목록을 넘기면 누적값을 그 목록으로 다시 설정합니다.
+        """
+        if isinstance(processing_time, list):
+            self._times = array('d', processing_time)
+            self._time_sum = sum(self._times)
+        elif processing_time is not None:
+            self._times.append(processing_time)
+            self._time_sum += processing_time
+        
+        if self._times:
+            self.average_processing_time = self._time_sum / len(self._times)
             
             if self.remaining_students > 0:
                 estimated_remaining_seconds = self.remaining_students * self.average_processing_time
-                self.estimated_completion_time = datetime.now().timestamp() + estimated_remaining_seconds
+                self.estimated_completion_time = time.time() + estimated_remaining_seconds
+
+
+@dataclass(slots=True)
+class Endpoint:
+    """채점 요청을 보낼 LLM 제공자와 그 제공자의 동시 요청 한도"""
+    provider: str
+    concurrency: int = 1
+
+
+class EndpointPool:
+    """
+    여러 LLM 제공자에 학생을 나누어 배정하는 엔드포인트 풀
+    
+    제공자마다 동시 요청 한도만큼 워커를 두고 공유 큐에서 학생을 가져가므로,
+    응답이 빠른 제공자가 자연스럽게 더 많은 학생을 맡습니다.
+    fallback이 켜져 있으면 한 제공자에서 실패한 시도는 다른 제공자로 재시도합니다.
+    """
+    
+    def __init__(self, endpoints: List[Dict[str, Any]], fallback: bool = True):
+        """
+        Args:
+            endpoints: {"provider": 모델 유형, "concurrency": 동시 요청 수} 목록
+            fallback: 실패한 시도를 다른 제공자로 넘길지 여부
+        """
+        self.endpoints = [
+            Endpoint(provider=endpoint["provider"], concurrency=max(int(endpoint.get("concurrency", 1)), 1))
+            for endpoint in endpoints
+        ]
+        if not self.endpoints:
+            raise ValueError("EndpointPool requires at least one endpoint")
+        self.fallback = fallback
+    
+    @classmethod
+    def from_availability(cls, availability: Dict[str, bool], grading_type: str) -> 'EndpointPool':
+        """사용 가능한 API와 config의 제공자별 한도로 풀 생성 (지도 채점은 Gemini만 사용)"""
+        endpoints = []
+        if availability.get(LLMModelType.GEMINI):
+            endpoints.append({"provider": LLMModelType.GEMINI, "concurrency": config.GEMINI_MAX_CONCURRENCY})
+        if availability.get(LLMModelType.GROQ) and grading_type != GradingType.MAP:
+            endpoints.append({"provider": LLMModelType.GROQ, "concurrency": config.GROQ_MAX_CONCURRENCY})
+        if not endpoints:
+            raise ValueError("No LLM models available")
+        return cls(endpoints)
+    
+    @property
+    def primary(self) -> str:
+        """첫 번째(우선) 제공자"""
+        return self.endpoints[0].provider
+    
+    def fallback_for(self, provider: str) -> Optional[str]:
+        """provider의 시도가 실패했을 때 넘길 제공자 (없으면 None)"""
+        if not self.fallback:
+            return None
+        for endpoint in self.endpoints:
+            if endpoint.provider != provider:
+                return endpoint.provider
+        return None
+    
+    async def run(self, indices: List[int], work: Callable[[int, str], Awaitable[T]]) -> Dict[int, T]:
+        """
+        indices의 각 항목을 제공자 워커들이 나누어 처리하고 {인덱스: 결과} 반환
+        
+        Args:
+            indices: 처리할 학생 인덱스 목록
+            work: (학생 인덱스, 제공자)를 받아 결과를 돌려주는 코루틴 함수
+        """
+        queue: asyncio.Queue = asyncio.Queue()
+        for index in indices:
+            queue.put_nowait(index)
+        
+        results: Dict[int, T] = {}
+        
+        async def _worker(provider: str):
+            while True:
+                try:
+                    index = queue.get_nowait()
+                except asyncio.QueueEmpty:
+                    return
+                results[index] = await work(index, provider)
+        
+        await asyncio.gather(*(
+            _worker(endpoint.provider)
+            for endpoint in self.endpoints
+            for _ in range(min(endpoint.concurrency, len(indices)))
+        ))
+        return results
 
 
 class SequentialGradingEngine:
@@ -116,26 +298,72 @@ class SequentialGradingEngine:
     실시간 진행 상황 업데이트, 오류 복구, 상세 로깅을 제공합니다.
     """
     
-    def __init__(self, llm_service: Optional[LLMService] = None):
+    def __init__(
+        self,
+        llm_service: Optional[LLMService] = None,
+        checkpoint_path: Optional[str] = None,
+        cache_enabled: Optional[bool] = None,
+        cache_ttl: Optional[int] = None
+    ):
         """
         채점 엔진을 초기화합니다.
         
         Args:
             llm_service: 선택적 LLM 서비스 인스턴스 (제공되지 않으면 새로 생성)
+            checkpoint_path: 학생별 성공 결과를 기록할 JSONL 파일 (기본값: config.GRADING_CHECKPOINT_PATH, 비어 있으면 사용 안 함)
+            cache_enabled: 채점 결과 디스크 캐시 사용 여부 (기본값: config.GRADING_CACHE_ENABLED)
+            cache_ttl: 캐시 항목 유효 시간(초) (기본값: config.GRADING_CACHE_TTL_SECONDS)
         """
         self.llm_service = llm_service or LLMService()
+        # 직접 생성한 LLM 서비스만 close()에서 함께 정리
+        self._owns_llm_service = llm_service is None
         self.is_cancelled = False
         self.current_batch_id = None
         
+        # 체크포인트 (중단 후 재시작 시 성공한 학생의 API 재호출 방지)
+        self.checkpoint_path = checkpoint_path or config.GRADING_CHECKPOINT_PATH or None
+        self._checkpoint_entries: Dict[str, Dict[str, Any]] = {}
+        self._checkpoint_lock = threading.Lock()
+        
+        # 채점 결과 디스크 캐시
+        if cache_enabled is None:
+            cache_enabled = config.GRADING_CACHE_ENABLED
+        self.response_cache: Optional[DiskCache] = None
+        if cache_enabled:
+            try:
+                self.response_cache = DiskCache(
+                    os.path.join(config.GRADING_CACHE_DIR, "responses.sqlite3"),
+                    ttl_seconds=cache_ttl if cache_ttl is not None else config.GRADING_CACHE_TTL_SECONDS
+                )
+            except Exception as e:
+                logger.warning(f"Grading cache disabled, could not open {config.GRADING_CACHE_DIR}: {e}")
+        # 같은 세션에서 반복되는 요청은 SQLite 조회와 JSON 파싱 없이 메모리에서 처리 (LRU)
+        self._memory_cache: "OrderedDict[str, GradingResult]" = OrderedDict()
+        self._memory_cache_lock = threading.Lock()
+        # 뜻이 같은 서술형 답안의 결과 재사용 (설정 시에만)
+        self.semantic_cache: Optional[SemanticCache] = (
+            SemanticCache() if config.SEMANTIC_CACHE_ENABLED else None
+        )
+        
         # 진행 상황 추적
         self.student_statuses: List[StudentGradingStatus] = []
         self.progress: Optional[GradingProgress] = None
+        # 상태 전이 시 갱신되는 완료/실패 목록 (조회 시 전체 상태 목록을 훑지 않음)
+        self._completed: List[StudentGradingStatus] = []
+        self._failed: List[StudentGradingStatus] = []
+        # 상태 객체 id -> 입력 순서 (완료/실패 목록을 학생 순서로 돌려줄 때 사용)
+        self._status_positions: Dict[int, int] = {}
         
         # Callbacks
         self.progress_callback: Optional[Callable] = None
         self.student_completed_callback: Optional[Callable] = None
         self.grading_completed_callback: Optional[Callable] = None
         self.error_callback: Optional[Callable] = None
+        # 진행/학생 완료 콜백은 전용 스레드 하나에서 순서대로 실행 (느린 UI 콜백이 채점을 막지 않음)
+        self._callback_pool: Optional[ThreadPoolExecutor] = None
+        # 마지막으로 진행 콜백에 보낸 진행률과 시각 (대규모 배치에서 UI 갱신 횟수 제한)
+        self._last_reported_pct = float("-inf")
+        self._last_reported_ts = 0.0
     
     def set_progress_callback(self, callback: Callable[[GradingProgress], None]):
         """Set callback for progress updates."""
@@ -167,7 +395,8 @@ class SequentialGradingEngine:
         references: Optional[List[str]] = None,
         groq_model_name: str = "qwen/qwen3-32b",
         max_retries: Optional[int] = None,
-        uploaded_files: Optional[List] = None  # New parameter for on-demand RAG processing
+        uploaded_files: Optional[List] = None,  # New parameter for on-demand RAG processing
+        dedupe_answers: bool = True
     ) -> List[GradingResult]:
         """
         Grade multiple students sequentially with comprehensive progress tracking.
@@ -181,10 +410,71 @@ class SequentialGradingEngine:
             groq_model_name: Specific Groq model to use (default: qwen/qwen3-32b)
             max_retries: Maximum retry attempts per student
             uploaded_files: Uploaded reference files for on-demand RAG processing
+            dedupe_answers: Grade identical descriptive answers once and share the result
             
         Returns:
             List of grading results
         """
+        return list(self.grade_students_sequential_iter(
+            students, rubric, model_type, grading_type,
+            references=references,
+            groq_model_name=groq_model_name,
+            max_retries=max_retries,
+            uploaded_files=uploaded_files,
+            dedupe_answers=dedupe_answers
+        ))
+    
+    def grade_students_sequential_iter(
+        self,
+        students: List[Student],
+        rubric: Rubric,
+        model_type: str,
+        grading_type: str,
+        references: Optional[List[str]] = None,
+        groq_model_name: str = "qwen/qwen3-32b",
+        max_retries: Optional[int] = None,
+        uploaded_files: Optional[List] = None,  # New parameter for on-demand RAG processing
+        dedupe_answers: bool = True
+    ) -> Iterator[GradingResult]:
+        """
+        Grade students sequentially, yielding each result as soon as it is ready.
+        
+        Accepts the same arguments as grade_students_sequential. Callers that
+        write results out incrementally avoid holding the whole batch in memory.
+        
+        Yields:
+            Grading result for each student that produced one
+        """
+        for _, result in self._iter_grade(
+            students, rubric, model_type, grading_type,
+            references=references,
+            groq_model_name=groq_model_name,
+            max_retries=max_retries,
+            uploaded_files=uploaded_files,
+            dedupe_answers=dedupe_answers
+        ):
+            if result:
+                yield result
+    
+    def _iter_grade(
+        self,
+        students: List[Student],
+        rubric: Rubric,
+        model_type: str,
+        grading_type: str,
+        references: Optional[List[str]] = None,
+        groq_model_name: str = "qwen/qwen3-32b",
+        max_retries: Optional[int] = None,
+        uploaded_files: Optional[List] = None,  # New parameter for on-demand RAG processing
+        dedupe_answers: bool = True
+    ) -> Iterator[Tuple[StudentGradingStatus, Optional[GradingResult]]]:
+        """
+        Core sequential grading loop.
+        
+        Yields (student status, result) after each student finishes, with
+        progress and student callbacks already delivered. Closing the
+        generator early still flushes callbacks and finalizes progress.
+        """
         # Initialize grading session
         self.current_batch_id = f"batch_{int(time.time())}"
         self.is_cancelled = False
@@ -195,8 +485,26 @@ class SequentialGradingEngine:
         
         logger.info(f"Starting sequential grading for {len(students)} students (batch: {self.current_batch_id})")
         
-        results = []
-        processing_times = []
+        graded_count = 0
+        
+        checkpoint_keys = self._prepare_checkpoints(students, rubric, model_type, grading_type)
+        answer_keys = self._answer_dedupe_keys(students, grading_type, dedupe_answers)
+        graded_answers: Dict[bytes, GradingResult] = {}
+        
+        # 루브릭에 따라 정해지는 프롬프트 앞부분은 배치마다 한 번만 생성
+        prompt_template = self.llm_service.prepare_prompt_template(rubric, grading_type)
+        primary_model_type, fallback_model_type = self._resolve_model_types(model_type, grading_type)
+        
+        # 학급 전체 답안의 참고 자료를 한 번에 검색
+        rag_references = {}
+        if grading_type == GradingType.DESCRIPTIVE and uploaded_files:
+            rag_references = self._prefetch_rag_references(students, uploaded_files)
+        
+        # 설정 시 참고 자료를 공유하는 서술형 답안은 여러 명씩 한 요청으로 먼저 채점
+        packed_results = self._prefetch_packed_results(
+            students, rubric, primary_model_type, grading_type, references, groq_model_name,
+            checkpoint_keys, answer_keys, rag_references
+        )
         
         try:
             for i, student in enumerate(students):
@@ -213,22 +521,39 @@ class SequentialGradingEngine:
                 # Get student status
                 student_status = self.student_statuses[i]
                 
-                # Grade individual student with retries
-                result = self._grade_student_with_retries(
-                    student_status=student_status,
-                    rubric=rubric,
-                    model_type=model_type,
-                    grading_type=grading_type,
-                    references=references,
-                    groq_model_name=groq_model_name,
-                    max_retries=max_retries,
-                    uploaded_files=uploaded_files  # Pass uploaded files for on-demand processing
-                )
+                answer_key = answer_keys[i]
+                shared = answer_key is not None and answer_key in graded_answers
+                if shared:
+                    # 같은 답안은 이미 채점된 결과를 이 학생 이름으로 복사
+                    result = self._apply_shared_result(
+                        student_status, graded_answers[answer_key], checkpoint_keys[i]
+                    )
+                elif i in packed_results:
+                    result = self._accept_packed_result(student_status, packed_results.pop(i), checkpoint_keys[i])
+                    if answer_key is not None:
+                        graded_answers[answer_key] = result
+                else:
+                    # Grade individual student with retries
+                    result = self._grade_student_with_retries(
+                        student_status=student_status,
+                        rubric=rubric,
+                        model_type=primary_model_type,
+                        grading_type=grading_type,
+                        references=references,
+                        groq_model_name=groq_model_name,
+                        max_retries=max_retries,
+                        uploaded_files=uploaded_files,  # Pass uploaded files for on-demand processing
+                        rag_references=rag_references.get(i),
+                        checkpoint_key=checkpoint_keys[i],
+                        prompt_template=prompt_template,
+                        fallback_model_type=fallback_model_type
+                    )
+                    if answer_key is not None and result and student_status.status == GradingStatus.COMPLETED:
+                        graded_answers[answer_key] = result
                 
-                # Always append result (even error results)
+                # Always count result (even error results)
                 if result:
-                    results.append(result)
-                    processing_times.append(result.grading_time_seconds)
+                    graded_count += 1
                     
                     # Check if this was a successful grading or an error result
                     if student_status.status == GradingStatus.COMPLETED:
@@ -238,15 +563,16 @@ class SequentialGradingEngine:
                 else:
                     self.progress.failed_students += 1
                 
-                # Update time estimates
-                self.progress.update_estimates(processing_times)
+                # Update time estimates (copied results took no grading time, so they are not sampled)
+                self.progress.update_estimates(result.grading_time_seconds if result and not shared else None)
                 
                 # Notify callbacks
                 self._notify_progress_update()
-                if self.student_completed_callback:
-                    self.student_completed_callback(student_status)
+                self._notify_student_completed(student_status)
                 
                 logger.info(f"Completed {i + 1}/{len(students)} students")
+                
+                yield student_status, result
         
         except Exception as e:
             logger.error(f"Critical error in grading process: {e}")
@@ -255,20 +581,33 @@ class SequentialGradingEngine:
             raise
         
         finally:
+            # Deliver queued progress updates before the completion notice
+            self._flush_callbacks()
+            
             # Finalize progress and notify completion
             if self.progress:
                 if not self.is_cancelled:
-                    logger.info(f"Sequential grading completed. {len(results)}/{len(students)} students graded successfully")
+                    logger.info(f"Sequential grading completed. {graded_count}/{len(students)} students graded successfully")
                     # Only notify grading completion callback (not progress callback)
                     if self.grading_completed_callback:
-                        logger.info(f"Calling grading completion callback with {len(results)} results")
-                        self.grading_completed_callback(len(results))
+                        logger.info(f"Calling grading completion callback with {graded_count} results")
+                        self.grading_completed_callback(graded_count)
                     else:
                         logger.warning("No grading completion callback set!")
                 else:
-                    logger.info(f"Sequential grading cancelled. {len(results)}/{len(students)} students completed before cancellation")
+                    logger.info(f"Sequential grading cancelled. {graded_count}/{len(students)} students completed before cancellation")
+    
+    def _resolve_model_types(self, model_type: str, grading_type: str) -> Tuple[str, Optional[str]]:
+        """
+        Map model_type to (provider, fallback provider).
         
-        return results
+        "auto" picks the first available provider and falls back to the other;
+        any explicit model type is used as-is without a fallback.
+        """
+        if model_type != LLMModelType.AUTO:
+            return model_type, None
+        pool = EndpointPool.from_availability(self.llm_service.validate_api_availability(), grading_type)
+        return pool.primary, pool.fallback_for(pool.primary)
     
     def _initialize_progress_tracking(self, students: List[Student]):
         """Initialize progress tracking structures."""
@@ -281,6 +620,260 @@ class SequentialGradingEngine:
             StudentGradingStatus(student=student)
             for student in students
         ]
+        self._completed = []
+        self._failed = []
+        self._status_positions = {id(status): i for i, status in enumerate(self.student_statuses)}
+        self._last_reported_pct = float("-inf")
+        self._last_reported_ts = 0.0
+    
+    def _mark_completed(self, student_status: StudentGradingStatus, result: GradingResult):
+        """Record a successful grading and index the status as completed."""
+        student_status.status = GradingStatus.COMPLETED
+        student_status.result = result
+        self._completed.append(student_status)
+    
+    def _mark_failed(self, student_status: StudentGradingStatus):
+        """Record a final grading failure and index the status as failed."""
+        student_status.status = GradingStatus.FAILED
+        self._failed.append(student_status)
+    
+    @staticmethod
+    def _answer_dedupe_keys(students: List[Student], grading_type: str, enabled: bool) -> List[Optional[bytes]]:
+        """
+        Key each descriptive text answer by its content so identical answers are graded once.
+        
+        Returns:
+            One blake2b digest per student, or None where deduplication does not
+            apply (disabled, map grading, or no text answer)
+        """
+        if not enabled or grading_type != GradingType.DESCRIPTIVE:
+            return [None] * len(students)
+        return [
+            hashlib.blake2b(student.answer.encode("utf-8"), digest_size=16).digest()
+            if student.has_text_answer else None
+            for student in students
+        ]
+    
+    def _prefetch_packed_results(
+        self,
+        students: List[Student],
+        rubric: Rubric,
+        model_type: str,
+        grading_type: str,
+        references: Optional[List[str]],
+        groq_model_name: str,
+        checkpoint_keys: List[Optional[str]],
+        answer_keys: List[Optional[bytes]],
+        rag_references: Dict[int, List[str]]
+    ) -> Dict[int, GradingResult]:
+        """
+        Grade descriptive answers several per API call ahead of the per-student loop.
+        
+        Enabled when config.PACKED_GRADING_BATCH_SIZE > 1. Only batches whose students
+        share the same references are packed; checkpointed students and repeated
+        answers are left out. Students missing from the packed responses are graded
+        individually by the normal retry path.
+        
+        Returns:
+            Successful packed results keyed by student index
+        """
+        if (
+            config.PACKED_GRADING_BATCH_SIZE <= 1
+            or grading_type != GradingType.DESCRIPTIVE
+            or rag_references
+        ):
+            return {}
+        
+        seen_answers = set()
+        candidates: List[int] = []
+        for index, answer_key in enumerate(answer_keys):
+            if checkpoint_keys[index] in self._checkpoint_entries:
+                continue
+            if answer_key is not None:
+                if answer_key in seen_answers:
+                    continue
+                seen_answers.add(answer_key)
+            candidates.append(index)
+        if len(candidates) < 2:
+            return {}
+        
+        try:
+            packed = self.llm_service.grade_students_packed(
+                [students[index] for index in candidates],
+                rubric,
+                model_type,
+                references=references,
+                groq_model_name=groq_model_name
+            )
+        except Exception as e:
+            logger.warning(f"Packed grading failed, grading students individually: {e}")
+            return {}
+        
+        packed_results = {
+            index: result
+            for index, result in zip(candidates, packed)
+            if result is not None and not self._is_error_result(result)
+        }
+        logger.info(f"Packed grading covered {len(packed_results)}/{len(candidates)} students")
+        return packed_results
+    
+    def _accept_packed_result(
+        self,
+        student_status: StudentGradingStatus,
+        result: GradingResult,
+        checkpoint_key: Optional[str] = None
+    ) -> GradingResult:
+        """Record a result from packed grading as the student's first successful attempt."""
+        student_status.attempt_count = 1
+        student_status.started_at = datetime.now()
+        student_status.start_time = time.perf_counter()
+        student_status.end_time = student_status.start_time + result.grading_time_seconds
+        self._mark_completed(student_status, result)
+        self._save_checkpoint(checkpoint_key, result)
+        return result
+    
+    def _apply_shared_result(
+        self,
+        student_status: StudentGradingStatus,
+        shared_result: GradingResult,
+        checkpoint_key: Optional[str] = None
+    ) -> GradingResult:
+        """
+        Complete a student with a copy of the result graded for an identical answer.
+        
+        Args:
+            student_status: Status of the student receiving the copy
+            shared_result: Result graded for another student with the same answer
+            checkpoint_key: Key of this student's entry in the checkpoint file
+            
+        Returns:
+            The copied result, relabelled with this student's name and class
+        """
+        student = student_status.student
+        result = copy.deepcopy(shared_result)
+        result.student_name = student.name
+        result.student_class_number = student.class_number
+        result.grading_time_seconds = 0.0
+        
+        student_status.start_time = student_status.end_time = time.perf_counter()
+        student_status.started_at = datetime.now()
+        self._mark_completed(student_status, result)
+        self._save_checkpoint(checkpoint_key, result)
+        
+        logger.info(f"Reused grading result for identical answer of student {student.name}")
+        return result
+    
+    def _prepare_checkpoints(
+        self,
+        students: List[Student],
+        rubric: Rubric,
+        model_type: str,
+        grading_type: str
+    ) -> List[Optional[str]]:
+        """
+        Load the checkpoint file and compute each student's checkpoint key.
+        
+        Returns:
+            One key per student, or all None when checkpointing is disabled
+        """
+        if not self.checkpoint_path:
+            return [None] * len(students)
+        
+        self._load_checkpoint_file()
+        rubric_json = rubric.canonical_json()
+        keys = [
+            self._checkpoint_key(student, rubric_json, model_type, grading_type)
+            for student in students
+        ]
+        restored = sum(1 for key in keys if key in self._checkpoint_entries)
+        if restored:
+            logger.info(f"Restoring {restored} students from checkpoint {self.checkpoint_path}")
+        return keys
+    
+    @staticmethod
+    def _checkpoint_key(student: Student, rubric_json: str, model_type: str, grading_type: str) -> str:
+        """Hash everything that determines a student's grading outcome."""
+        payload = "\x1f".join([
+            student.name, student.class_number, student.answer,
+            rubric_json, str(model_type), str(grading_type)
+        ])
+        return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+    
+    def _load_checkpoint_file(self):
+        """Read previously completed results from the JSONL checkpoint file."""
+        self._checkpoint_entries = {}
+        if not os.path.exists(self.checkpoint_path):
+            return
+        
+        try:
+            with open(self.checkpoint_path, "rb") as checkpoint_file:
+                for line in checkpoint_file:
+                    try:
+                        entry = _loads_json(line)
+                        self._checkpoint_entries[entry["key"]] = entry["result"]
+                    except (ValueError, KeyError, TypeError):
+                        # 기록 도중 중단되어 잘린 줄은 건너뜀
+                        continue
+        except OSError as e:
+            logger.warning(f"Could not read grading checkpoint {self.checkpoint_path}: {e}")
+    
+    def _restore_from_checkpoint(self, checkpoint_key: Optional[str]) -> Optional[GradingResult]:
+        """Rebuild a completed result from the checkpoint, if one exists."""
+        entry = self._checkpoint_entries.get(checkpoint_key) if checkpoint_key else None
+        if entry is None:
+            return None
+        try:
+            return GradingResult.from_dict(entry)
+        except (ValueError, KeyError, TypeError) as e:
+            logger.warning(f"Ignoring unreadable checkpoint entry: {e}")
+            return None
+    
+    def _save_checkpoint(self, checkpoint_key: Optional[str], result: GradingResult):
+        """Append a completed result to the checkpoint file as one JSON line."""
+        if not checkpoint_key or not self.checkpoint_path:
+            return
+        
+        result_dict = result.to_dict()
+        line = _dumps_json({"key": checkpoint_key, "result": result_dict}) + b"\n"
+        try:
+            with self._checkpoint_lock:
+                checkpoint_dir = os.path.dirname(self.checkpoint_path)
+                if checkpoint_dir:
+                    os.makedirs(checkpoint_dir, exist_ok=True)
+                # 한 줄 단위 추가 + fsync: 중단되어도 마지막 줄만 잘리고 로드 시 무시됨
+                with open(self.checkpoint_path, "ab") as checkpoint_file:
+                    checkpoint_file.write(line)
+                    checkpoint_file.flush()
+                    os.fsync(checkpoint_file.fileno())
+                self._checkpoint_entries[checkpoint_key] = result_dict
+        except OSError as e:
+            logger.warning(f"Could not write grading checkpoint {self.checkpoint_path}: {e}")
+    
+    def _prefetch_rag_references(self, students: List[Student], uploaded_files: List) -> Dict[int, List[str]]:
+        """
+        Retrieve reference chunks for every text answer with one batched search.
+        
+        Args:
+            students: Students being graded
+            uploaded_files: Uploaded reference files
+            
+        Returns:
+            Mapping of student index to retrieved reference chunks
+        """
+        try:
+            rag_service = RAGService()
+            if not rag_service.process_documents(uploaded_files):
+                logger.warning("RAG document processing failed; falling back to per-student retrieval")
+                return {}
+            
+            positions = [i for i, student in enumerate(students) if student.has_text_answer]
+            batched = rag_service.search_relevant_content_batch(
+                [students[i].answer for i in positions], k=3
+            )
+            return dict(zip(positions, batched))
+        except Exception as e:
+            logger.warning(f"Batched RAG retrieval failed: {e}")
+            return {}
     
     def _grade_student_with_retries(
         self,
@@ -291,7 +884,11 @@ class SequentialGradingEngine:
         references: Optional[List[str]],
         max_retries: int,
         groq_model_name: str = "qwen/qwen3-32b",
-        uploaded_files: Optional[List] = None  # New parameter for on-demand RAG processing
+        uploaded_files: Optional[List] = None,  # New parameter for on-demand RAG processing
+        rag_references: Optional[List[str]] = None,
+        checkpoint_key: Optional[str] = None,
+        prompt_template: Optional[Callable[[str, Optional[List[str]]], str]] = None,
+        fallback_model_type: Optional[str] = None
     ) -> Optional[GradingResult]:
         """
         Grade a single student with retry mechanism.
@@ -305,85 +902,115 @@ class SequentialGradingEngine:
             max_retries: Maximum retry attempts
             groq_model_name: Specific Groq model to use (default: qwen/qwen3-32b)
             uploaded_files: Uploaded reference files for on-demand RAG processing
+            rag_references: Reference chunks already retrieved for this student
+            checkpoint_key: Key of this student's entry in the checkpoint file
+            prompt_template: Prompt renderer compiled once for the batch
+            fallback_model_type: Provider to alternate with after a failed attempt
             
         Returns:
             Grading result if successful, None if failed
         """
         student = student_status.student
         
+        restored = self._restore_from_checkpoint(checkpoint_key)
+        if restored is not None:
+            student_status.start_time = student_status.end_time = time.perf_counter()
+            student_status.started_at = datetime.now()
+            self._mark_completed(student_status, restored)
+            logger.info(f"Restored student {student.name} from checkpoint")
+            return restored
+        
+        # For descriptive grading with uploaded files, process documents on-demand
+        # (once per student; retries reuse the retrieved references)
+        processed_references = references
+        if rag_references is not None:
+            processed_references = rag_references
+        elif grading_type == GradingType.DESCRIPTIVE and uploaded_files and student.has_text_answer and not self.is_cancelled:
+            try:
+                rag_service = RAGService()
+                rag_result = rag_service.process_documents_for_student(
+                    uploaded_files, 
+                    student.answer
+                )
+                
+                if rag_result.success:
+                    processed_references = rag_result.content
+                else:
+                    logger.warning(f"RAG processing failed for student {student.name}: {rag_result.error_message}")
+            except Exception as e:
+                logger.warning(f"RAG processing error for student {student.name}: {e}")
+        
         for attempt in range(max_retries + 1):
             if self.is_cancelled:
                 student_status.status = GradingStatus.CANCELLED
                 return None
             
+            # 실패 후에는 대체 제공자와 번갈아 시도
+            attempt_model_type = model_type
+            if fallback_model_type and attempt % 2 == 1:
+                attempt_model_type = fallback_model_type
+            
             student_status.attempt_count = attempt + 1
             student_status.status = GradingStatus.IN_PROGRESS
-            student_status.start_time = datetime.now()
+            student_status.start_time = time.perf_counter()
+            student_status.started_at = datetime.now()
             
             try:
                 logger.info(f"Grading student {student.name} (attempt {attempt + 1}/{max_retries + 1})")
                 
-                # For descriptive grading with uploaded files, process documents on-demand
-                processed_references = references
-                if grading_type == "descriptive" and uploaded_files and student.has_text_answer:
-                    try:
-                        rag_service = RAGService()
-                        rag_result = rag_service.process_documents_for_student(
-                            uploaded_files, 
-                            student.answer
+                # Call LLM service for grading (identical requests are served from the cache)
+                result = self._cached_grade(
+                    self._response_cache_key(
+                        student, rubric, attempt_model_type, grading_type, processed_references, groq_model_name
+                    ),
+                    student,
+                    lambda: self._semantic_grade(
+                        student, rubric, attempt_model_type, grading_type, groq_model_name,
+                        lambda: self.llm_service.grade_student_sequential(
+                            student=student,
+                            rubric=rubric,
+                            model_type=attempt_model_type,
+                            grading_type=grading_type,
+                            references=processed_references,
+                            groq_model_name=groq_model_name,
+                            prompt_template=prompt_template
                         )
-                        
-                        if rag_result.success:
-                            processed_references = rag_result.content
-                        else:
-                            logger.warning(f"RAG processing failed for student {student.name}: {rag_result.error_message}")
-                    except Exception as e:
-                        logger.warning(f"RAG processing error for student {student.name}: {e}")
-                
-                # Call LLM service for grading
-                result = self.llm_service.grade_student_sequential(
-                    student=student,
-                    rubric=rubric,
-                    model_type=model_type,
-                    grading_type=grading_type,
-                    references=processed_references,
-                    groq_model_name=groq_model_name
-                )
-                
-                # Check if this is an error result (total_score = 0 and error message in feedback)
-                is_error_result = (
-                    result.total_score == 0 and 
-                    "채점 중 오류가 발생했습니다" in result.overall_feedback
+                    )
                 )
                 
-                if is_error_result:
+                if self._is_error_result(result):
                     # Treat as failure and retry
                     error_msg = result.overall_feedback
                     raise Exception(error_msg)
                 
                 # Success
-                student_status.end_time = datetime.now()
-                student_status.status = GradingStatus.COMPLETED
-                student_status.result = result
+                student_status.end_time = time.perf_counter()
+                self._mark_completed(student_status, result)
+                self._save_checkpoint(checkpoint_key, result)
                 
                 logger.info(f"Successfully graded student {student.name} in {result.grading_time_seconds:.2f}s")
                 return result
                 
             except Exception as e:
-                student_status.end_time = datetime.now()
+                student_status.end_time = time.perf_counter()
                 error_msg = f"Attempt {attempt + 1} failed: {str(e)}"
                 student_status.error_message = error_msg
                 
                 logger.warning(f"Failed to grade student {student.name} on attempt {attempt + 1}: {e}")
                 
                 if attempt < max_retries:
-                    # Wait before retry with exponential backoff
-                    retry_delay = config.RETRY_DELAY ** attempt
-                    logger.info(f"Retrying in {retry_delay} seconds...")
+                    if fallback_model_type and attempt % 2 == 0:
+                        # The other provider has its own rate limit, so switch without waiting
+                        logger.info(f"Retrying student {student.name} with {fallback_model_type}")
+                        continue
+                    
+                    # Wait before retry with jittered exponential backoff
+                    retry_delay = self._retry_delay(attempt, e)
+                    logger.info(f"Retrying in {retry_delay:.1f} seconds...")
                     time.sleep(retry_delay)
                 else:
                     # Final failure
-                    student_status.status = GradingStatus.FAILED
+                    self._mark_failed(student_status)
                     logger.error(f"Failed to grade student {student.name} after {max_retries + 1} attempts")
                     
                     if self.error_callback:
@@ -393,13 +1020,208 @@ class SequentialGradingEngine:
         
         return None
     
-    def _notify_progress_update(self):
-        """Notify progress callback if set."""
-        if self.progress_callback and self.progress:
+    @staticmethod
+    def _retry_delay(attempt: int, error: Exception) -> float:
+        """Compute the wait before the next attempt (Retry-After aware, jittered backoff)."""
+        return compute_retry_delay(attempt, error)
+    
+    @staticmethod
+    def _is_error_result(result: GradingResult) -> bool:
+        """Check if the LLM service returned its error placeholder (zero score with error feedback)."""
+        return result.total_score == 0 and "채점 중 오류가 발생했습니다" in result.overall_feedback
+    
+    def _response_cache_key(
+        self,
+        student: Student,
+        rubric: Rubric,
+        model_type: str,
+        grading_type: str,
+        references: Optional[List[str]],
+        groq_model_name: str
+    ) -> Optional[str]:
+        """
+        Hash the full grading request: model, rubric, references and the answer itself.
+        
+        Map answers are keyed by the image bytes, since the upload path changes every run.
+        Returns None when the image cannot be read.
+        """
+        digest = hashlib.sha256()
+        for part in (str(model_type), groq_model_name, str(grading_type), rubric.canonical_json(), student.answer):
+            digest.update(part.encode("utf-8"))
+            digest.update(b"\x1f")
+        for reference in references or ():
+            digest.update(reference.encode("utf-8"))
+            digest.update(b"\x1e")
+        if grading_type == GradingType.MAP and student.image_path:
             try:
-                self.progress_callback(self.progress)
+                with open(student.image_path, "rb") as image_file:
+                    digest.update(image_file.read())
+            except OSError:
+                return None
+        return digest.hexdigest()
+    
+    def _cached_grade(
+        self,
+        cache_key: Optional[str],
+        student: Student,
+        grade_fn: Callable[[], GradingResult]
+    ) -> GradingResult:
+        """
+        Return the cached result for cache_key, or call grade_fn and cache a successful result.
+        
+        The in-memory LRU is always checked first; the disk cache only when it is enabled.
+        Cached results are relabelled with the current student's name and class,
+        because identical answers from different students share one entry.
+        """
+        if cache_key is None:
+            return grade_fn()
+        
+        with self._memory_cache_lock:
+            remembered = self._memory_cache.get(cache_key)
+            if remembered is not None:
+                self._memory_cache.move_to_end(cache_key)
+        if remembered is not None:
+            result = copy.deepcopy(remembered)
+            result.student_name = student.name
+            result.student_class_number = student.class_number
+            logger.info(f"Using in-memory cached grading result for student {student.name}")
+            return result
+        
+        cached = self.response_cache.get(cache_key) if self.response_cache is not None else None
+        if cached is not None:
+            try:
+                result = GradingResult.from_dict(_loads_json(cached))
+                result.student_name = student.name
+                result.student_class_number = student.class_number
+                self._remember_result(cache_key, result)
+                logger.info(f"Using cached grading result for student {student.name}")
+                return result
+            except (ValueError, KeyError, TypeError) as e:
+                logger.warning(f"Ignoring unreadable grading cache entry: {e}")
+        
+        result = grade_fn()
+        if not self._is_error_result(result):
+            self._remember_result(cache_key, result)
+            if self.response_cache is not None:
+                try:
+                    self.response_cache.set(cache_key, _dumps_json(result.to_dict()))
+                except Exception as e:
+                    logger.warning(f"Could not store grading result in cache: {e}")
+        return result
+    
+    def _semantic_grade(
+        self,
+        student: Student,
+        rubric: Rubric,
+        model_type: str,
+        grading_type: str,
+        groq_model_name: str,
+        grade_fn: Callable[[], GradingResult]
+    ) -> GradingResult:
+        """
+        Reuse the result of a paraphrased answer, or call grade_fn and remember its result.
+        
+        Only descriptive answers are compared, and only against answers graded with the
+        same rubric and model. References are left out of the match, since they are
+        retrieved per answer and differ slightly between paraphrases.
+        """
+        if self.semantic_cache is None or grading_type != GradingType.DESCRIPTIVE or not student.has_text_answer:
+            return grade_fn()
+        
+        namespace = hashlib.sha256(
+            "\x1f".join((str(model_type), groq_model_name, rubric.canonical_json())).encode("utf-8")
+        ).hexdigest()
+        try:
+            similar = self.semantic_cache.lookup(namespace, student.answer)
+        except Exception as e:
+            logger.warning(f"Semantic cache lookup failed: {e}")
+            similar = None
+        if similar is not None:
+            result = copy.deepcopy(similar)
+            result.student_name = student.name
+            result.student_class_number = student.class_number
+            logger.info(f"Using grading result of a similar answer for student {student.name}")
+            return result
+        
+        result = grade_fn()
+        if not self._is_error_result(result):
+            try:
+                self.semantic_cache.put(namespace, student.answer, copy.deepcopy(result))
+            except Exception as e:
+                logger.warning(f"Could not store result in semantic cache: {e}")
+        return result
+    
+    def _remember_result(self, cache_key: str, result: GradingResult):
+        """Keep a private copy of result in the in-memory LRU, evicting the oldest entry when full."""
+        snapshot = copy.deepcopy(result)
+        with self._memory_cache_lock:
+            self._memory_cache[cache_key] = snapshot
+            self._memory_cache.move_to_end(cache_key)
+            if len(self._memory_cache) > _MEMORY_CACHE_SIZE:
+                self._memory_cache.popitem(last=False)
+    
+    def _notify_progress_update(self, force: bool = False):
+        """
+        Queue a snapshot of the progress for the progress callback, if set.
+        
+        Updates are throttled to one per 1% of progress or per 0.5s, whichever
+        comes first. The first update, 100% and cancellation are always sent.
+        """
+        if not (self.progress_callback and self.progress):
+            return
+        
+        percentage = self.progress.progress_percentage
+        now = time.monotonic()
+        if (
+            not force
+            and not self.is_cancelled
+            and percentage < 100
+            and percentage - self._last_reported_pct < _PROGRESS_MIN_STEP_PERCENT
+            and now - self._last_reported_ts < _PROGRESS_MIN_INTERVAL_SECONDS
+        ):
+            return
+        
+        self._last_reported_pct = percentage
+        self._last_reported_ts = now
+        self._submit_callback(self.progress_callback, self.progress.snapshot(), "Progress")
+    
+    def _notify_student_completed(self, student_status: StudentGradingStatus):
+        """Queue the student completion callback, if set."""
+        if self.student_completed_callback:
+            self._submit_callback(self.student_completed_callback, student_status, "Student completed")
+    
+    def _submit_callback(self, callback: Callable, argument: Any, name: str):
+        """Run a callback on the single callback thread, preserving submission order."""
+        if self._callback_pool is None:
+            self._callback_pool = ThreadPoolExecutor(max_workers=1, thread_name_prefix="grading-callbacks")
+        
+        def _run():
+            try:
+                callback(argument)
             except Exception as e:
-                logger.warning(f"Progress callback failed: {e}")
+                logger.warning(f"{name} callback failed: {e}")
+        
+        self._callback_pool.submit(_run)
+    
+    def _flush_callbacks(self):
+        """Wait until every queued progress/student callback has run."""
+        if self._callback_pool is not None:
+            self._callback_pool.submit(lambda: None).result()
+    
+    def close(self):
+        """Finish queued callbacks, stop the callback thread and release an owned LLM service."""
+        if self._callback_pool is not None:
+            self._callback_pool.shutdown(wait=True)
+            self._callback_pool = None
+        if self._owns_llm_service:
+            self.llm_service.close()
+            self._owns_llm_service = False
+    
+    def __del__(self):
+        try:
+            self.close()
+        except Exception:
+            pass
     
     def get_grading_summary(self) -> Dict[str, Any]:
         """
@@ -411,12 +1233,6 @@ class SequentialGradingEngine:
         if not self.progress or not self.student_statuses:
             return {"error": "No grading session in progress"}
         
-        # Calculate statistics
-        successful_results = [s for s in self.student_statuses if s.status == GradingStatus.COMPLETED]
-        failed_results = [s for s in self.student_statuses if s.status == GradingStatus.FAILED]
-        
-        processing_times = [s.result.grading_time_seconds for s in successful_results if s.result]
-        
         summary = {
             "batch_id": self.current_batch_id,
             "total_students": self.progress.total_students,
@@ -424,7 +1240,8 @@ class SequentialGradingEngine:
             "failed_students": self.progress.failed_students,
             "progress_percentage": self.progress.progress_percentage,
             "average_processing_time": self.progress.average_processing_time,
-            "total_processing_time": sum(processing_times) if processing_times else 0.0,
+            "total_processing_time": self.progress.total_processing_time,
+            "processing_time_stats": self.progress.processing_time_stats(),
             "success_rate": (self.progress.completed_students / self.progress.total_students * 100) if self.progress.total_students > 0 else 0.0,
             "is_cancelled": self.is_cancelled,
             "start_time": self.progress.start_time.isoformat() if self.progress.start_time else None,
@@ -454,21 +1271,28 @@ class SequentialGradingEngine:
         
         return summary
     
+    def get_grading_summary_json(self) -> bytes:
+        """Get the grading summary serialized as UTF-8 JSON bytes (uses orjson when installed)."""
+        return _dumps_json(self.get_grading_summary())
+    
     def get_successful_results(self) -> List[GradingResult]:
-        """Get all successful grading results."""
-        return [
-            status.result 
-            for status in self.student_statuses 
-            if status.status == GradingStatus.COMPLETED and status.result
-        ]
+        """Get all successful grading results, in student order."""
+        return [status.result for status in self._in_student_order(self._completed) if status.result]
+    
+    def get_results_by_student(self) -> Dict[str, GradingResult]:
+        """Get successful grading results keyed by student name, for O(1) lookup by student."""
+        return {
+            status.result.student_name: status.result
+            for status in self._completed if status.result
+        }
     
     def get_failed_students(self) -> List[StudentGradingStatus]:
-        """Get all failed student statuses."""
-        return [
-            status 
-            for status in self.student_statuses 
-            if status.status == GradingStatus.FAILED
-        ]
+        """Get all failed student statuses, in student order."""
+        return self._in_student_order(self._failed)
+    
+    def _in_student_order(self, statuses: List[StudentGradingStatus]) -> List[StudentGradingStatus]:
+        """Sort indexed statuses back into input order (completion order varies under concurrency)."""
+        return sorted(statuses, key=lambda status: self._status_positions.get(id(status), 0))
     
     def retry_failed_students(
         self,
@@ -504,8 +1328,23 @@ class SequentialGradingEngine:
         
         new_results = []
         max_retries = max_retries or config.MAX_RETRIES
+        checkpoint_keys = self._prepare_checkpoints(
+            [status.student for status in failed_statuses], rubric, model_type, grading_type
+        )
+        prompt_template = self.llm_service.prepare_prompt_template(rubric, grading_type)
+        primary_model_type, fallback_model_type = self._resolve_model_types(model_type, grading_type)
+        
+        # 재시도 대상 학생들의 참고 자료도 한 번에 검색
+        rag_references = {}
+        if grading_type == GradingType.DESCRIPTIVE and uploaded_files:
+            rag_references = self._prefetch_rag_references(
+                [status.student for status in failed_statuses], uploaded_files
+            )
         
-        for status in failed_statuses:
+        # 다시 실패한 학생은 _mark_failed가 새로 등록
+        self._failed = []
+        
+        for position, (status, checkpoint_key) in enumerate(zip(failed_statuses, checkpoint_keys)):
             # Reset status for retry
             status.status = GradingStatus.NOT_STARTED
             status.error_message = None
@@ -514,12 +1353,16 @@ class SequentialGradingEngine:
             result = self._grade_student_with_retries(
                 student_status=status,
                 rubric=rubric,
-                model_type=model_type,
+                model_type=primary_model_type,
                 grading_type=grading_type,
                 references=references,
                 groq_model_name=groq_model_name,
                 max_retries=max_retries,
-                uploaded_files=uploaded_files  # Pass uploaded files for on-demand processing
+                uploaded_files=uploaded_files,  # Pass uploaded files for on-demand processing
+                rag_references=rag_references.get(position),
+                checkpoint_key=checkpoint_key,
+                prompt_template=prompt_template,
+                fallback_model_type=fallback_model_type
             )
             
             if result:
@@ -601,4 +1444,342 @@ class SequentialGradingEngine:
             if missing_images:
                 validation_results["warnings"].append(f"Students without images: {', '.join(missing_images[:5])}")
         
-        return validation_results
\ No newline at end of file
+        return validation_results
+
+class ConcurrentGradingEngine(SequentialGradingEngine):
+    """
+    여러 학생의 LLM 호출을 동시에 진행하는 채점 실행 엔진
+    
+    학생별 채점은 서로 독립적인 I/O 대기이므로, 동시 요청 수만큼의 워커가 공유 큐에서
+    학생을 가져가며 함께 실행합니다. model_type="auto"이면 사용 가능한 제공자마다
+    워커를 두어 요청을 나누어 보냅니다. 재시도/진행 상황/콜백 동작은 순차 엔진과 동일합니다.
+    """
+    
+    def __init__(
+        self,
+        llm_service: Optional[LLMService] = None,
+        max_concurrency: Optional[int] = None,
+        checkpoint_path: Optional[str] = None,
+        cache_enabled: Optional[bool] = None,
+        cache_ttl: Optional[int] = None
+    ):
+        """
+        동시 채점 엔진을 초기화합니다.
+        
+        Args:
+            llm_service: 선택적 LLM 서비스 인스턴스 (제공되지 않으면 새로 생성)
+            max_concurrency: 동시에 진행할 최대 학생 수 (기본값: config.MAX_CONCURRENT_REQUESTS)
+            checkpoint_path: 학생별 성공 결과를 기록할 JSONL 파일
+            cache_enabled: 채점 결과 디스크 캐시 사용 여부
+            cache_ttl: 캐시 항목 유효 시간(초)
+        """
+        super().__init__(
+            llm_service,
+            checkpoint_path=checkpoint_path,
+            cache_enabled=cache_enabled,
+            cache_ttl=cache_ttl
+        )
+        self.max_concurrency = max(max_concurrency or config.MAX_CONCURRENT_REQUESTS, 1)
+    
+    def grade_students_concurrent(
+        self,
+        students: List[Student],
+        rubric: Rubric,
+        model_type: str,
+        grading_type: str,
+        references: Optional[List[str]] = None,
+        groq_model_name: str = "qwen/qwen3-32b",
+        max_retries: Optional[int] = None,
+        uploaded_files: Optional[List] = None,
+        max_parallel_requests: Optional[int] = None,
+        dedupe_answers: bool = True
+    ) -> List[GradingResult]:
+        """
+        Grade multiple students concurrently with bounded parallelism.
+        
+        Synchronous wrapper around grade_students_async for callers that are not
+        running an event loop. Takes the same arguments as grade_students_sequential
+        and returns the results in the original student order.
+        
+        Returns:
+            List of grading results
+        """
+        return asyncio.run(self.grade_students_async(
+            students=students,
+            rubric=rubric,
+            model_type=model_type,
+            grading_type=grading_type,
+            references=references,
+            groq_model_name=groq_model_name,
+            max_retries=max_retries,
+            uploaded_files=uploaded_files,
+            max_parallel_requests=max_parallel_requests,
+            dedupe_answers=dedupe_answers
+        ))
+    
+    def iter_grade_students(
+        self,
+        students: List[Student],
+        rubric: Rubric,
+        model_type: str,
+        grading_type: str,
+        references: Optional[List[str]] = None,
+        groq_model_name: str = "qwen/qwen3-32b",
+        max_retries: Optional[int] = None,
+        uploaded_files: Optional[List] = None,
+        max_parallel_requests: Optional[int] = None,
+        dedupe_answers: bool = True
+    ) -> Iterator[GradingResult]:
+        """
+        Grade students concurrently, yielding each result as soon as it completes.
+        
+        Results arrive in completion order rather than student order. Grading runs
+        on a helper thread with its own event loop; an exception raised there is
+        re-raised here after the last result. Closing the iterator early cancels
+        the remaining students. Takes the same arguments as grade_students_concurrent.
+        
+        Yields:
+            Grading result for each student that produced one
+        """
+        finished = object()
+        results: "queue.Queue[Any]" = queue.Queue()
+        errors: List[BaseException] = []
+        
+        def _run():
+            try:
+                asyncio.run(self.grade_students_async(
+                    students=students,
+                    rubric=rubric,
+                    model_type=model_type,
+                    grading_type=grading_type,
+                    references=references,
+                    groq_model_name=groq_model_name,
+                    max_retries=max_retries,
+                    uploaded_files=uploaded_files,
+                    max_parallel_requests=max_parallel_requests,
+                    dedupe_answers=dedupe_answers,
+                    on_result=results.put
+                ))
+            except BaseException as e:
+                errors.append(e)
+            finally:
+                results.put(finished)
+        
+        worker = threading.Thread(target=_run, name="grading-iter", daemon=True)
+        worker.start()
+        try:
+            while True:
+                item = results.get()
+                if item is finished:
+                    break
+                yield item
+        finally:
+            if worker.is_alive():
+                # 소비자가 중간에 멈추면 남은 학생 채점을 취소
+                self.cancel_grading()
+            worker.join()
+        
+        if errors:
+            raise errors[0]
+    
+    async def grade_students_async(
+        self,
+        students: List[Student],
+        rubric: Rubric,
+        model_type: str,
+        grading_type: str,
+        references: Optional[List[str]] = None,
+        groq_model_name: str = "qwen/qwen3-32b",
+        max_retries: Optional[int] = None,
+        uploaded_files: Optional[List] = None,
+        max_parallel_requests: Optional[int] = None,
+        dedupe_answers: bool = True,
+        on_result: Optional[Callable[[GradingResult], None]] = None
+    ) -> List[GradingResult]:
+        """
+        Grade multiple students concurrently from inside a running event loop.
+        
+        Args:
+            model_type: LLM model to use, or "auto" to spread students across every
+                available provider (config.GEMINI_MAX_CONCURRENCY / GROQ_MAX_CONCURRENCY)
+            max_parallel_requests: Per-call override of the engine's max_concurrency
+            dedupe_answers: Grade identical descriptive answers once and share the result
+            on_result: Called on the event loop thread with each result as it completes
+            (other arguments as in grade_students_sequential)
+            
+        Returns:
+            List of grading results in the original student order
+        """
+        self.current_batch_id = f"batch_{int(time.time())}"
+        self.is_cancelled = False
+        max_retries = max_retries or config.MAX_RETRIES
+        concurrency = max(max_parallel_requests or self.max_concurrency, 1)
+        if model_type == LLMModelType.AUTO:
+            pool = EndpointPool.from_availability(self.llm_service.validate_api_availability(), grading_type)
+        else:
+            pool = EndpointPool([{"provider": model_type, "concurrency": concurrency}], fallback=False)
+        
+        self._initialize_progress_tracking(students)
+        
+        logger.info(
+            f"Starting concurrent grading for {len(students)} students (batch: {self.current_batch_id}, "
+            f"endpoints: {', '.join(f'{e.provider}x{e.concurrency}' for e in pool.endpoints)})"
+        )
+        
+        checkpoint_keys = self._prepare_checkpoints(students, rubric, model_type, grading_type)
+        
+        results: List[GradingResult] = []
+        try:
+            # 모든 학생이 같은 벡터 저장소를 공유하므로 동시 실행 전에 한 번에 구축 및 검색
+            rag_references = {}
+            if grading_type == GradingType.DESCRIPTIVE and uploaded_files:
+                rag_references = await asyncio.to_thread(
+                    self._prefetch_rag_references, students, uploaded_files
+                )
+            
+            answer_keys = self._answer_dedupe_keys(students, grading_type, dedupe_answers)
+            packed_results = await asyncio.to_thread(
+                self._prefetch_packed_results,
+                students, rubric, pool.primary, grading_type, references, groq_model_name,
+                checkpoint_keys, answer_keys, rag_references
+            )
+            
+            graded = await self._grade_all_async(
+                students=students,
+                rag_references=rag_references,
+                checkpoint_keys=checkpoint_keys,
+                answer_keys=answer_keys,
+                pool=pool,
+                packed_results=packed_results,
+                on_result=on_result,
+                rubric=rubric,
+                grading_type=grading_type,
+                references=references,
+                groq_model_name=groq_model_name,
+                max_retries=max_retries,
+                uploaded_files=uploaded_files,
+                prompt_template=self.llm_service.prepare_prompt_template(rubric, grading_type)
+            )
+            results = [result for result in graded if result]
+        
+        except Exception as e:
+            logger.error(f"Critical error in grading process: {e}")
+            if self.error_callback:
+                self.error_callback("Critical grading error", e)
+            raise
+        
+        finally:
+            self._flush_callbacks()
+            if self.progress:
+                if not self.is_cancelled:
+                    logger.info(f"Concurrent grading completed. {len(results)}/{len(students)} students graded successfully")
+                    if self.grading_completed_callback:
+                        self.grading_completed_callback(len(results))
+                else:
+                    logger.info(f"Concurrent grading cancelled. {len(results)}/{len(students)} students completed before cancellation")
+        
+        return results
+    
+    async def _grade_all_async(
+        self,
+        students: List[Student],
+        rag_references: Dict[int, List[str]],
+        checkpoint_keys: List[Optional[str]],
+        answer_keys: List[Optional[bytes]],
+        pool: EndpointPool,
+        packed_results: Optional[Dict[int, GradingResult]] = None,
+        on_result: Optional[Callable[[GradingResult], None]] = None,
+        **grading_kwargs
+    ) -> List[Optional[GradingResult]]:
+        """
+        Run every student through the retry pipeline on the endpoint pool's workers.
+        
+        Students whose answer duplicates an earlier one wait for that first
+        student and receive a copy of its result; they are graded themselves
+        only if the first student failed. Students already graded by a packed
+        request are recorded without another API call.
+        """
+        packed_results = packed_results or {}
+        
+        async def _grade_one(index: int, provider: str) -> Optional[GradingResult]:
+            if self.is_cancelled:
+                return None
+            
+            student_status = self.student_statuses[index]
+            self.progress.current_student_index = index
+            self.progress.current_student_name = student_status.student.name
+            self.progress.current_student_class = student_status.student.class_number
+            self._notify_progress_update()
+            
+            if index in packed_results:
+                result = self._accept_packed_result(
+                    student_status, packed_results.pop(index), checkpoint_keys[index]
+                )
+            else:
+                # 블로킹 SDK 호출은 워커 스레드에서 실행
+                result = await asyncio.to_thread(
+                    self._grade_student_with_retries,
+                    student_status=student_status,
+                    model_type=provider,
+                    fallback_model_type=pool.fallback_for(provider),
+                    rag_references=rag_references.get(index),
+                    checkpoint_key=checkpoint_keys[index],
+                    **grading_kwargs
+                )
+            
+            # 진행 상황 갱신은 이벤트 루프 스레드에서만 수행되므로 잠금이 필요 없음
+            completed_time = None
+            if result and student_status.status == GradingStatus.COMPLETED:
+                self.progress.completed_students += 1
+                completed_time = result.grading_time_seconds
+            elif student_status.status != GradingStatus.CANCELLED:
+                self.progress.failed_students += 1
+            
+            self.progress.update_estimates(completed_time)
+            self._notify_progress_update()
+            self._notify_student_completed(student_status)
+            if result and on_result:
+                on_result(result)
+            
+            return result
+        
+        leaders: Dict[bytes, int] = {}
+        first_wave: List[int] = []
+        followers: List[int] = []
+        for index, answer_key in enumerate(answer_keys):
+            if answer_key is None:
+                first_wave.append(index)
+            elif answer_key in leaders:
+                followers.append(index)
+            else:
+                leaders[answer_key] = index
+                first_wave.append(index)
+        
+        results: List[Optional[GradingResult]] = [None] * len(students)
+        for index, result in (await pool.run(first_wave, _grade_one)).items():
+            results[index] = result
+        
+        second_wave: List[int] = []
+        for index in followers:
+            leader_index = leaders[answer_keys[index]]
+            leader_result = results[leader_index]
+            if self.is_cancelled or leader_result is None:
+                second_wave.append(index)
+                continue
+            
+            student_status = self.student_statuses[index]
+            results[index] = self._apply_shared_result(
+                student_status, leader_result, checkpoint_keys[index]
+            )
+            self.progress.completed_students += 1
+            # 복사한 결과는 채점 시간이 없으므로 평균/예상 시간 표본에 넣지 않음
+            self.progress.update_estimates(None)
+            self._notify_progress_update()
+            self._notify_student_completed(student_status)
+            if on_result:
+                on_result(results[index])
+        
+        # 첫 학생의 채점이 실패한 중복 답안은 각자 다시 채점
+        for index, result in (await pool.run(second_wave, _grade_one)).items():
+            results[index] = result
+        return results
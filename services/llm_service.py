@@ -6,10 +6,16 @@
 메모리 사용량, API 호출 효율성, 응답 캐싱에 대한 성능 최적화가 포함되어 있습니다.
 """
 
+import os
 import json
+import asyncio
+import datetime
 import time
 import base64
-from typing import Dict, List, Optional, Union, Any, Callable
+import threading
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from typing import Dict, List, Optional, Union, Any, Callable, Tuple
 from pathlib import Path
 import logging
 from functools import lru_cache
@@ -37,18 +43,62 @@ from models.student_model import Student
 from models.rubric_model import Rubric
 from models.result_model import GradingResult, ElementScore, GradingTimer
 from utils.error_handler import handle_error, retry_with_backoff, ErrorType, ErrorInfo
+from utils.cache_utils import DiskCache
+from utils.rate_limiter import RateLimiter
 # 시스템 모니터링 정리의 일환으로 성능 최적화 import 제거
 
+# Rust 기반 orjson이 설치되어 있으면 JSON 모드 응답(본문 전체가 JSON)을 바로 파싱
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 
 # 로깅 설정
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# Shared decoder for extracting the JSON object embedded in LLM responses
+_JSON_DECODER = json.JSONDecoder()
+
+# Gemini model used for every grading request (also part of the response cache key)
+_GEMINI_MODEL_NAME = "gemini-2.5-flash"
+
+# Recreate a Gemini context cache this long before the server deletes it at the end of its TTL
+_CONTEXT_CACHE_REFRESH_MARGIN_SECONDS = 60
+
+# Per-provider request pacing shared by every LLMService in the process (limits are per API key)
+_GEMINI_RATE_LIMITER = RateLimiter(config.GEMINI_REQUESTS_PER_MINUTE)
+_GROQ_RATE_LIMITER = RateLimiter(config.GROQ_REQUESTS_PER_MINUTE)
+
+# Separates student answers inside a packed multi-student prompt
+_STUDENT_SEPARATOR = "\n---STUDENT|||SEP|||BOUNDARY---\n"
+
+
+def _decode_json_at(text: str, start: int) -> Any:
+    """
+    Decode the JSON value starting at text[start], ignoring any text after it.
+    
+    JSON-mode responses are the whole body, so orjson is tried on the rest of the
+    text first; responses with trailing prose fall back to the stdlib raw_decode.
+    """
+    if orjson is not None:
+        try:
+            return orjson.loads(text[start:].rstrip())
+        except orjson.JSONDecodeError:
+            pass
+    return _JSON_DECODER.raw_decode(text, start)[0]
+
+
+class _PackedResponseError(ValueError):
+    """Raised when a packed multi-student response cannot be parsed."""
+
 
 class LLMModelType:
     """LLM 모델 유형을 위한 열거형 클래스"""
     GEMINI = "gemini"
     GROQ = "groq"
+    AUTO = "auto"  # 사용 가능한 제공자에 나누어 요청 (채점 엔진에서 처리)
 
 
 class GradingType:
@@ -65,17 +115,40 @@ class LLMService:
     Google Gemini (텍스트 + 이미지) 및 Groq (텍스트만) API를 지원합니다.
     """
     
+    # 루브릭별로 컴파일된 프롬프트 템플릿 캐시 최대 크기
+    _PROMPT_TEMPLATE_CACHE_SIZE = 32
+    
     def __init__(self):
         """Initialize LLM service with API clients and performance optimization."""
         self.groq_client = None
+        # Gemini 모델 객체는 한 번 만들어 재사용 (호출마다 새로 만들지 않음)
+        self._gemini_model = None
+        # 루브릭 접두부 해시 -> (Gemini 컨텍스트 캐시, 다시 만들 시각)
+        # 생성 실패 시 None을 기록해 재시도하지 않음
+        self._context_caches: Dict[str, Tuple[Any, float]] = {}
+        self._context_cache_lock = threading.Lock()
         self._initialize_clients()
         
         # Performance optimization (removed as part of system monitoring cleanup)
-        self.response_cache = {}
+        # API 응답 캐시: (모델, 프롬프트, 이미지) 키의 메모리 LRU, 설정 시 SQLite에도 보관
+        # cache_enabled를 False로 두면 조회/저장을 모두 건너뜀 (매번 API 호출)
+        self.cache_enabled = True
+        self.response_cache: "OrderedDict[str, Dict[str, Any]]" = OrderedDict()
+        self._response_cache_lock = threading.Lock()
+        self.response_disk_cache: Optional[DiskCache] = None
+        if config.GRADING_CACHE_ENABLED:
+            try:
+                self.response_disk_cache = DiskCache(
+                    os.path.join(config.GRADING_CACHE_DIR, "api_responses.sqlite3"),
+                    ttl_seconds=config.GRADING_CACHE_TTL_SECONDS
+                )
+            except Exception as e:
+                logger.warning(f"API response disk cache disabled: {e}")
         self.api_call_count = 0
         self.total_processing_time = 0.0
         self._cache_hits = 0
         self._cache_requests = 0
+        self._prompt_template_cache: Dict[tuple, Callable[[str, Optional[List[str]]], str]] = {}
     
     def _initialize_clients(self):
         """Initialize API clients with proper configuration."""
@@ -111,6 +184,89 @@ class LLMService:
             if self.groq_client is None:
                 logger.info("Groq client not initialized due to error")
     
+    def _get_gemini_model(self):
+        """Return the shared Gemini model, creating it on first use."""
+        if self._gemini_model is None:
+            self._gemini_model = genai.GenerativeModel(_GEMINI_MODEL_NAME)
+        return self._gemini_model
+    
+    def _get_context_cache(self, prefix: str):
+        """
+        Return the Gemini context cache holding prefix, creating it on first use.
+        
+        The server deletes a cache when its TTL runs out, so a cache is recreated
+        shortly before that instead of being reused. Returns None when the cache
+        cannot be created (for example when the prefix is below the model's minimum
+        cacheable size); the failure is remembered so later calls send the full
+        prompt without asking again.
+        """
+        key = self._context_cache_key(prefix)
+        with self._context_cache_lock:
+            entry = self._context_caches.get(key)
+            if entry is not None:
+                context_cache, refresh_at = entry
+                if context_cache is None or time.monotonic() < refresh_at:
+                    return context_cache
+            
+            ttl = config.GEMINI_CONTEXT_CACHE_TTL_SECONDS
+            try:
+                from google.generativeai import caching
+                
+                context_cache = caching.CachedContent.create(
+                    model=f"models/{_GEMINI_MODEL_NAME}",
+                    contents=[prefix],
+                    ttl=datetime.timedelta(seconds=ttl)
+                )
+                logger.info("Created Gemini context cache for the rubric prompt prefix")
+            except Exception as e:
+                logger.info(f"Gemini context cache unavailable, sending full prompts: {e}")
+                context_cache = None
+            refresh_at = time.monotonic() + ttl - min(_CONTEXT_CACHE_REFRESH_MARGIN_SECONDS, ttl / 2)
+            self._context_caches[key] = (context_cache, refresh_at)
+            return context_cache
+    
+    def _drop_context_cache(self, prefix: str, context_cache: Any):
+        """Forget context_cache for prefix (if still current) so the next call creates a new one."""
+        key = self._context_cache_key(prefix)
+        with self._context_cache_lock:
+            entry = self._context_caches.get(key)
+            if entry is not None and entry[0] is context_cache:
+                del self._context_caches[key]
+    
+    @staticmethod
+    def _context_cache_key(prefix: str) -> str:
+        """Key the context cache table by a digest of the prompt prefix."""
+        return hashlib.blake2b(prefix.encode("utf-8"), digest_size=16).hexdigest()
+    
+    def close(self):
+        """Release API clients, server-side context caches and the disk cache connection."""
+        with self._context_cache_lock:
+            context_caches = [c for c, _ in self._context_caches.values() if c is not None]
+            self._context_caches.clear()
+        for context_cache in context_caches:
+            try:
+                context_cache.delete()
+            except Exception as e:
+                logger.debug(f"Failed to delete Gemini context cache: {e}")
+        
+        if self.groq_client is not None:
+            try:
+                self.groq_client.close()
+            except Exception as e:
+                logger.debug(f"Failed to close Groq client: {e}")
+            self.groq_client = None
+        self._gemini_model = None
+        
+        if self.response_disk_cache is not None:
+            self.response_disk_cache.close()
+            self.response_disk_cache = None
+    
+    def __del__(self):
+        try:
+            self.close()
+        except Exception:
+            pass
+    
     def select_model(self, model_type: str, grading_type: str) -> str:
         """
         Select appropriate model based on grading type and user preference.
@@ -158,6 +314,10 @@ class LLMService:
         """
         Generate structured prompt for LLM grading.
         
+        The prompt starts with the rubric-dependent static prefix (role, rubric,
+        output format) shared by every student, followed by the per-student
+        suffix (references and answer), so providers can reuse the cached prefix.
+        
         Args:
             rubric: Evaluation rubric
             student_answer: Student's text answer (for descriptive questions)
@@ -167,6 +327,93 @@ class LLMService:
         Returns:
             Structured prompt string
         """
+        render = self._get_prompt_template(rubric, grading_type)
+        return render(student_answer, references)
+    
+    def prepare_prompt_template(
+        self,
+        rubric: Rubric,
+        grading_type: str = GradingType.DESCRIPTIVE
+    ) -> Callable[[str, Optional[List[str]]], str]:
+        """
+        Compile the rubric-dependent prompt prefix once for a whole batch.
+        
+        Args:
+            rubric: Evaluation rubric
+            grading_type: Type of grading (descriptive/map)
+            
+        Returns:
+            Callable taking (student_answer, references) and returning the prompt;
+            pass it to grade_student_sequential as prompt_template
+        """
+        return self._get_prompt_template(rubric, grading_type)
+    
+    def _get_prompt_template(
+        self,
+        rubric: Rubric,
+        grading_type: str
+    ) -> Callable[[str, Optional[List[str]]], str]:
+        """Return the compiled prompt renderer for a rubric, compiling it on first use."""
+        cache_key = (self._rubric_prompt_key(rubric), grading_type)
+        render = self._prompt_template_cache.get(cache_key)
+        if render is not None:
+            return render
+        
+        render = self._compile_prompt_template(rubric, grading_type)
+        if len(self._prompt_template_cache) >= self._PROMPT_TEMPLATE_CACHE_SIZE:
+            self._prompt_template_cache.pop(next(iter(self._prompt_template_cache)))
+        self._prompt_template_cache[cache_key] = render
+        return render
+    
+    @staticmethod
+    def _rubric_prompt_key(rubric: Rubric) -> tuple:
+        """Build a hashable key covering every rubric field that appears in the prompt."""
+        return (
+            rubric.total_max_score,
+            tuple(
+                (element.name, element.max_score,
+                 tuple((criteria.score, criteria.description) for criteria in element.criteria))
+                for element in rubric.elements
+            )
+        )
+    
+    def _compile_prompt_template(
+        self,
+        rubric: Rubric,
+        grading_type: str
+    ) -> Callable[[str, Optional[List[str]]], str]:
+        """
+        Compile the rubric into a renderer that only fills in per-student parts.
+        
+        Args:
+            rubric: Evaluation rubric
+            grading_type: Type of grading (descriptive/map)
+            
+        Returns:
+            Callable taking (student_answer, references) and returning the prompt.
+            The shared prefix is kept on its ``prefix`` attribute for packed prompts.
+        """
+        prefix = self._build_static_prefix(rubric, grading_type)
+        
+        # Map prompts carry the answer as an image, so the text never varies
+        if grading_type == GradingType.MAP:
+            map_prompt = f"{prefix}\n다음은 학생이 작성한 백지도 답안입니다. 이미지를 분석하여 채점해주세요."
+            
+            def render(student_answer: str, references: Optional[List[str]]) -> str:
+                return map_prompt
+        else:
+            head = f"{prefix}\n"
+            
+            def render(student_answer: str, references: Optional[List[str]]) -> str:
+                if references:
+                    return f"{head}{self._format_references_block(references)}\n\n다음은 학생 답안입니다:\n{student_answer}"
+                return f"{head}다음은 학생 답안입니다:\n{student_answer}"
+        
+        render.prefix = prefix
+        return render
+    
+    def _build_static_prefix(self, rubric: Rubric, grading_type: str) -> str:
+        """Build the prompt prefix that is identical for every student."""
         prompt_parts = []
         
         # 1. System role definition
@@ -175,30 +422,14 @@ class LLMService:
         else:
             prompt_parts.append("당신은 지리 교과목 전문 채점자입니다. 학생의 서술형 답안을 분석하여 채점해주세요.")
         
-        # 2. Reference materials (descriptive only)
-        if grading_type == GradingType.DESCRIPTIVE and references:
-            prompt_parts.append("\n다음은 채점 참고 자료입니다:")
-            for i, ref in enumerate(references, 1):
-                # Limit each reference chunk to 300 characters
-                clean_ref = ref.strip()
-                if len(clean_ref) > 300:
-                    clean_ref = clean_ref[:300] + "..."
-                prompt_parts.append(f"참고자료 {i}: {clean_ref}")
-        
-        # 3. Evaluation rubric
+        # 2. Evaluation rubric
         prompt_parts.append("\n다음은 평가 루브릭입니다:")
         for element in rubric.elements:
             prompt_parts.append(f"\n평가요소: {element.name} (최대 {element.max_score}점)")
             for criteria in element.criteria:
                 prompt_parts.append(f"  {criteria.score}점: {criteria.description}")
         
-        # 4. Student answer
-        if grading_type == GradingType.MAP:
-            prompt_parts.append("\n다음은 학생이 작성한 백지도 답안입니다. 이미지를 분석하여 채점해주세요.")
-        else:
-            prompt_parts.append(f"\n다음은 학생 답안입니다:\n{student_answer}")
-        
-        # 5. Output format specification
+        # 3. Output format specification
         prompt_parts.append(f"""
 다음 JSON 형식으로 채점 결과를 제공해주세요:
 {{
@@ -217,53 +448,140 @@ class LLMService:
         
         return "\n".join(prompt_parts)
     
+    @staticmethod
+    def _format_references_block(references: List[str]) -> str:
+        """Format RAG references for the per-student part of the prompt."""
+        prompt_parts = ["다음은 채점 참고 자료입니다:"]
+        for i, ref in enumerate(references, 1):
+            # Limit each reference chunk to 300 characters
+            clean_ref = ref.strip()
+            if len(clean_ref) > 300:
+                clean_ref = clean_ref[:300] + "..."
+            prompt_parts.append(f"참고자료 {i}: {clean_ref}")
+        return "\n".join(prompt_parts)
+    
     def _cleanup_cache(self):
         """Clean up internal caches to free memory."""
-        self.response_cache.clear()
+        with self._response_cache_lock:
+            self.response_cache.clear()
+        self._prompt_template_cache.clear()
         logger.info("LLM service cache cleaned up")
     
-    def _generate_cache_key(self, prompt: str, image_path: Optional[str] = None) -> str:
-        """Generate cache key for API responses."""
-        key_data = prompt
+    def _generate_cache_key(self, prompt: str, image_path: Optional[str] = None, model_name: str = "") -> str:
+        """
+        Generate cache key for API responses.
+        
+        The key covers the model as well as the prompt, so a response from one
+        model is never served for another. Images are keyed by their content.
+        blake2b is used because it hashes long prompts and image bytes faster than sha256.
+        """
+        digest = hashlib.blake2b(model_name.encode("utf-8"), digest_size=16)
+        digest.update(b"\x1f")
+        digest.update(prompt.encode("utf-8"))
         if image_path:
-            # Include image file hash for cache key
+            digest.update(b"\x1f")
             try:
                 with open(image_path, 'rb') as f:
-                    image_hash = hashlib.md5(f.read()).hexdigest()[:8]
-                key_data += f"_img_{image_hash}"
-            except Exception:
-                key_data += f"_img_{image_path}"
+                    digest.update(f.read())
+            except OSError:
+                digest.update(image_path.encode("utf-8"))
         
-        return hashlib.md5(key_data.encode()).hexdigest()
+        return digest.hexdigest()
     
     def _get_cached_response(self, cache_key: str) -> Optional[Dict[str, Any]]:
-        """Get cached API response if available and valid."""
-        self._cache_requests += 1
-        
-        if cache_key in self.response_cache:
-            cached_data = self.response_cache[cache_key]
-            # Check if cache is still valid (TTL)
-            if time.time() - cached_data['timestamp'] < getattr(config, 'API_CACHE_TTL_SECONDS', 300):
-                self._cache_hits += 1
-                return cached_data['response']
-            else:
+        """Get cached API response from memory, then from the disk cache if enabled."""
+        if not self.cache_enabled:
+            return None
+        
+        with self._response_cache_lock:
+            self._cache_requests += 1
+            
+            cached_data = self.response_cache.get(cache_key)
+            if cached_data is not None:
+                # Check if cache is still valid (TTL)
+                if time.time() - cached_data['timestamp'] < getattr(config, 'API_CACHE_TTL_SECONDS', 300):
+                    self.response_cache.move_to_end(cache_key)
+                    self._cache_hits += 1
+                    return cached_data['response']
                 # Remove expired cache entry
                 del self.response_cache[cache_key]
+        
+        if self.response_disk_cache is not None:
+            stored = self.response_disk_cache.get(cache_key)
+            if stored is not None:
+                try:
+                    response = json.loads(stored)
+                except ValueError:
+                    return None
+                with self._response_cache_lock:
+                    self._cache_hits += 1
+                self._cache_response(cache_key, response, persist=False)
+                return response
         return None
     
-    def _cache_response(self, cache_key: str, response: Dict[str, Any]):
-        """Cache API response with TTL."""
-        # Implement simple LRU eviction if cache is full
-        if len(self.response_cache) >= getattr(config, 'API_CACHE_MAX_SIZE', 100):
-            # Remove oldest entry
-            oldest_key = min(self.response_cache.keys(), 
-                           key=lambda k: self.response_cache[k]['timestamp'])
-            del self.response_cache[oldest_key]
-        
-        self.response_cache[cache_key] = {
-            'response': response,
-            'timestamp': time.time()
-        }
+    def _get_parsed_cached_response(
+        self,
+        cache_key: str,
+        parse: Optional[Callable[[str], Any]]
+    ) -> Optional[Dict[str, Any]]:
+        """Get a cached response, parsed with parse if given; entries that no longer parse are evicted."""
+        cached_response = self._get_cached_response(cache_key)
+        if not cached_response or parse is None:
+            return cached_response
+        try:
+            return {"text": cached_response["text"], "parsed": parse(cached_response["text"])}
+        except ValueError:
+            self._evict_cached_response(cache_key)
+            return None
+    
+    def _parse_and_cache_response(
+        self,
+        cache_key: str,
+        response: Dict[str, Any],
+        parse: Optional[Callable[[str], Any]]
+    ) -> Dict[str, Any]:
+        """Parse a fresh API response if a parser is given, and cache it only once it parses."""
+        if parse is not None:
+            # Raises on malformed/truncated output, which is then never cached or replayed
+            parsed = parse(response["text"])
+            self._cache_response(cache_key, response)
+            return {"text": response["text"], "parsed": parsed}
+        self._cache_response(cache_key, response)
+        return response
+    
+    def _evict_cached_response(self, cache_key: str):
+        """Remove a cached API response from memory and disk."""
+        with self._response_cache_lock:
+            self.response_cache.pop(cache_key, None)
+        if self.response_disk_cache is not None:
+            self.response_disk_cache.delete(cache_key)
+    
+    def _cache_response(self, cache_key: str, response: Dict[str, Any], persist: bool = True):
+        """Cache API response with TTL, evicting the least recently used entry when full."""
+        if not self.cache_enabled:
+            return
+        
+        with self._response_cache_lock:
+            self.response_cache[cache_key] = {
+                'response': response,
+                'timestamp': time.time()
+            }
+            self.response_cache.move_to_end(cache_key)
+            while len(self.response_cache) > getattr(config, 'API_CACHE_MAX_SIZE', 100):
+                self.response_cache.popitem(last=False)
+        
+        if persist and self.response_disk_cache is not None:
+            try:
+                self.response_disk_cache.set(cache_key, json.dumps(response, ensure_ascii=False))
+            except Exception as e:
+                logger.warning(f"Could not store API response in disk cache: {e}")
+    
+    def clear_cache(self):
+        """Drop every cached API response, in memory and on disk."""
+        with self._response_cache_lock:
+            self.response_cache.clear()
+        if self.response_disk_cache is not None:
+            self.response_disk_cache.clear()
     
     def _create_rubric_hash(self, rubric: Rubric) -> str:
         """Create hash for rubric to enable caching."""
@@ -289,9 +607,6 @@ class LLMService:
         grading_type: str = GradingType.DESCRIPTIVE
     ) -> str:
         """Generate prompt with caching support."""
-        rubric_hash = self._create_rubric_hash(rubric)
-        references_hash = self._create_references_hash(references)
-        
         return self.generate_prompt(
             rubric=rubric,
             student_answer=student_answer,
@@ -320,7 +635,10 @@ class LLMService:
         self, 
         prompt: str, 
         image_path: Optional[str] = None,
-        max_retries: Optional[int] = None
+        max_retries: Optional[int] = None,
+        json_output: Optional[bool] = None,
+        cached_prefix: Optional[str] = None,
+        parse: Optional[Callable[[str], Any]] = None
     ) -> Dict[str, Any]:
         """
         Call Google Gemini API for text/image analysis with caching and optimization.
@@ -329,6 +647,14 @@ class LLMService:
             prompt: Text prompt for the model
             image_path: Optional path to image file
             max_retries: Maximum number of retry attempts
+            json_output: Request a bare JSON body (response_mime_type=application/json)
+                instead of free text; defaults to config.GEMINI_JSON_OUTPUT
+            cached_prefix: Leading part of prompt shared by many calls (the rubric block).
+                With GEMINI_CONTEXT_CACHE_ENABLED it is uploaded once as a Gemini
+                context cache and only the rest of the prompt is sent per call.
+            parse: Optional parser/validator for the response text. When given, the
+                response is cached only after it parses, and the parsed value is
+                returned under "parsed"; a parse error is raised to the caller.
             
         Returns:
             API response as dictionary
@@ -345,14 +671,31 @@ class LLMService:
             )
             raise ValueError(error_info.user_message)
         
+        if json_output is None:
+            json_output = config.GEMINI_JSON_OUTPUT
+        # JSON 모드 응답은 자유 형식 응답과 다르므로 캐시 키에 구분하여 포함
+        generation_config = {"response_mime_type": "application/json"} if json_output else None
+        
         # Check cache first
-        cache_key = self._generate_cache_key(prompt, image_path)
-        cached_response = self._get_cached_response(cache_key)
+        cache_key = self._generate_cache_key(
+            prompt, image_path, f"{_GEMINI_MODEL_NAME}:json" if json_output else _GEMINI_MODEL_NAME
+        )
+        cached_response = self._get_parsed_cached_response(cache_key, parse)
         if cached_response:
             logger.debug("Using cached Gemini API response")
             return cached_response
         
+        # 공통 접두부(루브릭)가 서버 측 컨텍스트 캐시에 있으면 나머지 부분만 전송
+        context_cache = None
+        request_prompt = prompt
+        if cached_prefix and config.GEMINI_CONTEXT_CACHE_ENABLED and prompt.startswith(cached_prefix):
+            context_cache = self._get_context_cache(cached_prefix)
+            if context_cache is not None:
+                request_prompt = prompt[len(cached_prefix):]
+        
         def _make_api_call():
+            nonlocal context_cache
+            
             # Prepare content for API call following official documentation
             # Reference: https://ai.google.dev/gemini-api/docs/vision
             
@@ -384,7 +727,7 @@ class LLMService:
                     }
                     
                     # According to official docs: put text and image in same contents array
-                    content = [prompt, image_part]
+                    content = [request_prompt, image_part]
                     print(f"DEBUG: Created content with text and image")
                     
                 except Exception as e:
@@ -403,20 +746,33 @@ class LLMService:
                     print(f"DEBUG: Path exists: {Path(image_path).exists()}")
                 
                 # Text only content
-                content = [prompt]
+                content = [request_prompt]
             
             # Generate response
             try:
-                # Use google-generativeai GenerativeModel with latest model
-                model = genai.GenerativeModel('gemini-2.5-flash')
-                response = model.generate_content(content)
+                response = None
+                if context_cache is not None:
+                    try:
+                        model = genai.GenerativeModel.from_cached_content(cached_content=context_cache)
+                        _GEMINI_RATE_LIMITER.acquire()
+                        response = model.generate_content(content, generation_config=generation_config)
+                    except Exception as e:
+                        # The cache may have expired or been deleted on the server: drop it and
+                        # send the full prompt from now on (this attempt and any retries)
+                        logger.info(f"Gemini context cache request failed, resending the full prompt: {e}")
+                        self._drop_context_cache(cached_prefix, context_cache)
+                        context_cache = None
+                        content[0] = prompt
+                
+                if response is None:
+                    # Reuse one GenerativeModel (and its transport) for every call
+                    model = self._get_gemini_model()
+                    _GEMINI_RATE_LIMITER.acquire()
+                    response = model.generate_content(content, generation_config=generation_config)
                 
                 if response.text:
-                    result = {"text": response.text}
-                    # Cache successful response
-                    self._cache_response(cache_key, result)
                     self.api_call_count += 1
-                    return result
+                    return {"text": response.text}
                 else:
                     raise ValueError("Empty response from Gemini API")
             
@@ -461,12 +817,13 @@ class LLMService:
         
         # Use retry mechanism with exponential backoff
         max_retries = max_retries or config.MAX_RETRIES
-        return retry_with_backoff(
+        result = retry_with_backoff(
             _make_api_call,
             ErrorType.API_COMMUNICATION,
             max_retries=max_retries,
             context="call_gemini_api"
         )
+        return self._parse_and_cache_response(cache_key, result, parse)
     
     def get_selected_groq_model(self) -> str:
         """세션 상태에서 선택된 Groq 모델을 가져옵니다."""
@@ -484,7 +841,8 @@ class LLMService:
         self, 
         prompt: str, 
         model_name: Optional[str] = None,
-        max_retries: Optional[int] = None
+        max_retries: Optional[int] = None,
+        parse: Optional[Callable[[str], Any]] = None
     ) -> Dict[str, Any]:
         """
         Call Groq API for text analysis with caching and optimization.
@@ -493,6 +851,7 @@ class LLMService:
             prompt: Text prompt for the model
             model_name: Name of the Groq model to use (None = auto-select from session)
             max_retries: Maximum number of retry attempts
+            parse: Optional parser/validator for the response text (see call_gemini_api)
             
         Returns:
             API response as dictionary
@@ -516,8 +875,8 @@ class LLMService:
             raise ValueError(error_info.user_message)
         
         # Check cache first
-        cache_key = self._generate_cache_key(prompt)
-        cached_response = self._get_cached_response(cache_key)
+        cache_key = self._generate_cache_key(prompt, model_name=model_name)
+        cached_response = self._get_parsed_cached_response(cache_key, parse)
         if cached_response:
             logger.debug("Using cached Groq API response")
             return cached_response
@@ -535,6 +894,7 @@ class LLMService:
                 print(f"DEBUG: Using max_tokens={max_tokens} for model {model_name}")
                 
                 # Call Groq API
+                _GROQ_RATE_LIMITER.acquire()
                 response = self.groq_client.chat.completions.create(
                     model=model_name,  # Use specified Groq model
                     messages=[
@@ -545,11 +905,8 @@ class LLMService:
                 )
                 
                 if response.choices and response.choices[0].message.content:
-                    result = {"text": response.choices[0].message.content}
-                    # Cache successful response
-                    self._cache_response(cache_key, result)
                     self.api_call_count += 1
-                    return result
+                    return {"text": response.choices[0].message.content}
                 else:
                     raise ValueError("Empty response from Groq API")
             
@@ -594,12 +951,13 @@ class LLMService:
         
         # Use retry mechanism with exponential backoff
         max_retries = max_retries or config.MAX_RETRIES
-        return retry_with_backoff(
+        result = retry_with_backoff(
             _make_api_call,
             ErrorType.API_COMMUNICATION,
             max_retries=max_retries,
             context="call_groq_api"
         )
+        return self._parse_and_cache_response(cache_key, result, parse)
     
     def parse_response(self, response_text: str, rubric: Rubric) -> Dict[str, Any]:
         """
@@ -616,15 +974,13 @@ class LLMService:
             ValueError: If response format is invalid
         """
         try:
-            # Debug: Log the actual response content
-            print(f"DEBUG: API Response (length: {len(response_text)})")
-            print(f"DEBUG: API Response content: {repr(response_text)}")
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug(f"API Response (length: {len(response_text)}): {response_text!r}")
             
             # Extract JSON from response (handle cases where LLM adds extra text)
             json_start = response_text.find('{')
-            json_end = response_text.rfind('}') + 1
             
-            if json_start == -1 or json_end == 0:
+            if json_start == -1:
                 error_info = handle_error(
                     ValueError("No JSON found in response"),
                     ErrorType.PARSING,
@@ -633,19 +989,54 @@ class LLMService:
                 )
                 raise ValueError(error_info.user_message)
             
-            json_text = response_text[json_start:json_end]
-            
             try:
-                parsed = json.loads(json_text)
-            except json.JSONDecodeError as e:
-                error_info = handle_error(
-                    e,
-                    ErrorType.PARSING,
-                    context=f"parse_response: JSON decode error in text: {json_text[:200]}...",
-                    user_context="AI 응답 JSON 파싱"
-                )
-                raise ValueError(error_info.user_message)
+                # Decode the first JSON object in place; trailing text after it is ignored
+                parsed = _decode_json_at(response_text, json_start)
+            except json.JSONDecodeError:
+                parsed = None
+            
+            if not isinstance(parsed, dict):
+                json_text = response_text[json_start:response_text.rfind('}') + 1]
+                try:
+                    parsed = json.loads(json_text)
+                except json.JSONDecodeError as e:
+                    error_info = handle_error(
+                        e,
+                        ErrorType.PARSING,
+                        context=f"parse_response: JSON decode error in text: {json_text[:200]}...",
+                        user_context="AI 응답 JSON 파싱"
+                    )
+                    raise ValueError(error_info.user_message)
+            
+            return self._validate_parsed_response(parsed, rubric)
+            
+        except ValueError:
+            # Re-raise ValueError with error info already handled
+            raise
+        except Exception as e:
+            error_info = handle_error(
+                e,
+                ErrorType.PARSING,
+                context=f"parse_response: unexpected parsing error",
+                user_context="AI 응답 파싱"
+            )
+            raise ValueError(error_info.user_message)
+    
+    def _validate_parsed_response(self, parsed: Dict[str, Any], rubric: Rubric) -> Dict[str, Any]:
+        """
+        Validate a decoded grading object against the rubric.
+        
+        Args:
+            parsed: Decoded JSON object for one student
+            rubric: Evaluation rubric for validation
             
+        Returns:
+            The same object, with default reasoning filled in where missing
+            
+        Raises:
+            ValueError: If required fields or element scores are missing or invalid
+        """
+        try:
             # Validate required fields
             required_fields = ['scores', 'reasoning', 'feedback', 'total_score']
             missing_fields = [field for field in required_fields if field not in parsed]
@@ -701,7 +1092,7 @@ class LLMService:
             error_info = handle_error(
                 e,
                 ErrorType.PARSING,
-                context=f"parse_response: unexpected parsing error",
+                context=f"_validate_parsed_response: unexpected validation error",
                 user_context="AI 응답 파싱"
             )
             raise ValueError(error_info.user_message)
@@ -713,7 +1104,8 @@ class LLMService:
         model_type: str,
         grading_type: str,
         references: Optional[List[str]] = None,
-        groq_model_name: str = "qwen/qwen3-32b"
+        groq_model_name: str = "qwen/qwen3-32b",
+        prompt_template: Optional[Callable[[str, Optional[List[str]]], str]] = None
     ) -> GradingResult:
         """
         Grade a single student's answer sequentially.
@@ -725,6 +1117,7 @@ class LLMService:
             grading_type: Type of grading (descriptive/map)
             references: Reference materials from RAG
             groq_model_name: Specific Groq model to use (default: qwen/qwen3-32b)
+            prompt_template: Renderer from prepare_prompt_template, compiled once per batch
             
         Returns:
             Grading result with timing information
@@ -736,13 +1129,20 @@ class LLMService:
             # Select appropriate model
             selected_model = self.select_model(model_type, grading_type)
             
-            # Generate prompt with caching
-            prompt = self.generate_prompt_with_caching(
-                rubric=rubric,
-                student_answer=student.answer,
-                references=references,
-                grading_type=grading_type
-            )
+            # Generate prompt (only the per-student suffix when the template is precompiled)
+            if prompt_template is not None:
+                prompt = prompt_template(student.answer, references)
+            else:
+                prompt = self.generate_prompt_with_caching(
+                    rubric=rubric,
+                    student_answer=student.answer,
+                    references=references,
+                    grading_type=grading_type
+                )
+            
+            # Responses are only cached once they parse against the rubric
+            def parse(response_text: str) -> Dict[str, Any]:
+                return self.parse_response(response_text, rubric)
             
             # Call appropriate API
             if selected_model == LLMModelType.GEMINI:
@@ -758,38 +1158,21 @@ class LLMService:
                 
                 response = self.call_gemini_api(
                     prompt=prompt,
-                    image_path=image_path_to_use
+                    image_path=image_path_to_use,
+                    cached_prefix=getattr(prompt_template, "prefix", None),
+                    parse=parse
                 )
             else:  # GROQ
-                response = self.call_groq_api(prompt=prompt, model_name=groq_model_name)
+                response = self.call_groq_api(prompt=prompt, model_name=groq_model_name, parse=parse)
             
-            # Parse response
-            parsed_result = self.parse_response(response["text"], rubric)
+            # Parsed and validated before the response was cached
+            parsed_result = response["parsed"]
             
             # Stop timer and get elapsed time
             elapsed_time = timer.stop()
             
             # Create grading result
-            result = GradingResult(
-                student_name=student.name,
-                student_class_number=student.class_number,
-                grading_time_seconds=elapsed_time,
-                overall_feedback=parsed_result["feedback"]
-            )
-            
-            # Add element scores
-            for element in rubric.elements:
-                element_name = element.name
-                score = parsed_result["scores"][element_name]
-                reasoning = parsed_result["reasoning"].get(element_name, "")
-                
-                result.add_element_score(
-                    element_name=element_name,
-                    score=int(score),
-                    max_score=element.max_score,
-                    feedback="",  # 피드백은 별도로 설정
-                    reasoning=reasoning  # 판단 근거
-                )
+            result = self._build_grading_result(student, rubric, parsed_result, elapsed_time)
             
             logger.info(f"Successfully graded student {student.name} in {elapsed_time:.2f}s")
             return result
@@ -819,6 +1202,241 @@ class LLMService:
             
             return result
     
+    def _build_grading_result(
+        self,
+        student: Student,
+        rubric: Rubric,
+        parsed_result: Dict[str, Any],
+        elapsed_time: float
+    ) -> GradingResult:
+        """Create a GradingResult from a validated grading object."""
+        result = GradingResult(
+            student_name=student.name,
+            student_class_number=student.class_number,
+            grading_time_seconds=elapsed_time,
+            overall_feedback=parsed_result["feedback"]
+        )
+        
+        # Add element scores
+        for element in rubric.elements:
+            element_name = element.name
+            score = parsed_result["scores"][element_name]
+            reasoning = parsed_result["reasoning"].get(element_name, "")
+            
+            result.add_element_score(
+                element_name=element_name,
+                score=int(score),
+                max_score=element.max_score,
+                feedback="",  # 피드백은 별도로 설정
+                reasoning=reasoning  # 판단 근거
+            )
+        
+        return result
+    
+    def _build_batch_prompt(
+        self,
+        students: List[Student],
+        rubric: Rubric,
+        references: Optional[List[str]] = None
+    ) -> str:
+        """
+        Build one descriptive-grading prompt covering several students.
+        
+        The rubric and references appear once; answers follow as numbered
+        sections separated by _STUDENT_SEPARATOR.
+        
+        Args:
+            students: Students whose answers are packed into the prompt
+            rubric: Evaluation rubric
+            references: Reference materials shared by all students
+            
+        Returns:
+            Structured prompt string
+        """
+        # 루브릭 앞부분은 학생별 프롬프트와 같은 컴파일 결과를 재사용
+        prompt_parts = [self._get_prompt_template(rubric, GradingType.DESCRIPTIVE).prefix]
+        if references:
+            prompt_parts.append(self._format_references_block(references))
+            prompt_parts.append("")
+        
+        prompt_parts.append(
+            f"이번 요청에는 학생 {len(students)}명의 답안이 있습니다. 각 학생을 독립적으로 채점하고, "
+            "학생마다 위 JSON 형식의 객체에 \"student_id\" 필드(답안 번호)를 추가하여 "
+            "모든 객체를 하나의 JSON 배열로 제공해주세요."
+        )
+        
+        answers = [
+            f"학생 답안 {student_id}:\n{student.answer}"
+            for student_id, student in enumerate(students, 1)
+        ]
+        prompt_parts.append(_STUDENT_SEPARATOR.join(answers))
+        return "\n".join(prompt_parts)
+    
+    def _parse_batch_response(self, response_text: str, rubric: Rubric, student_count: int) -> Dict[int, Dict[str, Any]]:
+        """
+        Parse a packed multi-student response.
+        
+        Args:
+            response_text: Raw response text from LLM
+            rubric: Evaluation rubric for validation
+            student_count: Number of students packed into the prompt
+            
+        Returns:
+            Validated grading objects keyed by 0-based student position. Students
+            whose object is missing or invalid are left out.
+            
+        Raises:
+            ValueError: If no JSON array can be decoded from the response
+        """
+        array_start = response_text.find('[')
+        if array_start == -1:
+            raise ValueError("No JSON array found in batch response")
+        
+        try:
+            parsed = _decode_json_at(response_text, array_start)
+        except json.JSONDecodeError as e:
+            raise ValueError(f"Batch response JSON decode error: {e}")
+        if not isinstance(parsed, list):
+            raise ValueError("Batch response is not a JSON array")
+        
+        graded = {}
+        for item in parsed:
+            if not isinstance(item, dict):
+                continue
+            try:
+                position = int(item.get('student_id')) - 1
+            except (TypeError, ValueError):
+                continue
+            if not 0 <= position < student_count or position in graded:
+                continue
+            try:
+                graded[position] = self._validate_parsed_response(item, rubric)
+            except ValueError as e:
+                logger.warning(f"Invalid batch entry for student_id {position + 1}: {e}")
+        return graded
+    
+    def _grade_packed_chunk(
+        self,
+        students: List[Student],
+        rubric: Rubric,
+        model_type: str,
+        references: Optional[List[str]],
+        groq_model_name: str
+    ) -> List[Optional[GradingResult]]:
+        """
+        Grade several descriptive answers with a single API call.
+        
+        Returns:
+            One entry per student; None where the packed response had no usable
+            result, so the caller can grade that student individually
+            
+        Raises:
+            ValueError: If the response contains no decodable JSON array
+        """
+        timer = GradingTimer()
+        timer.start()
+        
+        try:
+            selected_model = self.select_model(model_type, GradingType.DESCRIPTIVE)
+            prompt = self._build_batch_prompt(students, rubric, references)
+            
+            def parse(response_text: str) -> Dict[int, Dict[str, Any]]:
+                try:
+                    return self._parse_batch_response(response_text, rubric, len(students))
+                except ValueError as e:
+                    raise _PackedResponseError(str(e)) from e
+            
+            if selected_model == LLMModelType.GEMINI:
+                response = self.call_gemini_api(prompt=prompt, parse=parse)
+            else:  # GROQ
+                response = self.call_groq_api(prompt=prompt, model_name=groq_model_name, parse=parse)
+        except _PackedResponseError:
+            # Unparseable packed response: let the caller shrink the chunk
+            timer.stop()
+            raise
+        except Exception as e:
+            timer.stop()
+            logger.warning(f"Packed grading of {len(students)} students failed, grading individually: {e}")
+            return [None] * len(students)
+        
+        timer.stop()
+        graded = response["parsed"]
+        
+        # 한 번의 호출 시간을 학생 수로 나누어 학생별 채점 시간으로 기록
+        elapsed_per_student = timer.elapsed_time / len(students)
+        results: List[Optional[GradingResult]] = []
+        for position, student in enumerate(students):
+            parsed_result = graded.get(position)
+            if parsed_result is None:
+                results.append(None)
+                continue
+            try:
+                results.append(self._build_grading_result(student, rubric, parsed_result, elapsed_per_student))
+            except Exception as e:
+                logger.warning(f"Could not build packed result for student {student.name}: {e}")
+                results.append(None)
+        return results
+    
+    def grade_students_packed(
+        self,
+        students: List[Student],
+        rubric: Rubric,
+        model_type: str,
+        references: Optional[List[str]] = None,
+        groq_model_name: str = "qwen/qwen3-32b",
+        batch_size: Optional[int] = None
+    ) -> List[Optional[GradingResult]]:
+        """
+        Grade descriptive answers several per API call, adapting the pack size.
+        
+        Packing starts at batch_size and halves whenever a packed response cannot
+        be parsed, retrying that chunk at the smaller size; the smaller size is kept
+        for the rest of the run. Chunks are also cut short so the answers stay under
+        config.PACKED_PROMPT_MAX_CHARS.
+        
+        Args:
+            students: Students with descriptive answers
+            rubric: Evaluation rubric
+            model_type: LLM model to use
+            references: Reference materials shared by all students
+            groq_model_name: Specific Groq model to use (default: qwen/qwen3-32b)
+            batch_size: Initial students per prompt (default: config.PACKED_GRADING_BATCH_SIZE)
+            
+        Returns:
+            One entry per student; None where the student still needs individual grading
+        """
+        size = max(batch_size or config.PACKED_GRADING_BATCH_SIZE, 1)
+        results: List[Optional[GradingResult]] = [None] * len(students)
+        
+        position = 0
+        while position < len(students):
+            # 답안 길이 합이 한도를 넘지 않는 만큼만 묶음 (최소 1명)
+            chunk_end = position + 1
+            answer_chars = len(students[position].answer)
+            while chunk_end < min(position + size, len(students)):
+                answer_chars += len(students[chunk_end].answer)
+                if answer_chars > config.PACKED_PROMPT_MAX_CHARS:
+                    break
+                chunk_end += 1
+            
+            chunk = students[position:chunk_end]
+            if len(chunk) == 1:
+                # 한 명뿐인 묶음은 개별 채점 경로에 맡김
+                position = chunk_end
+                continue
+            
+            try:
+                results[position:chunk_end] = self._grade_packed_chunk(
+                    chunk, rubric, model_type, references, groq_model_name
+                )
+            except ValueError as e:
+                size = max(len(chunk) // 2, 1)
+                logger.warning(f"Packed response for {len(chunk)} students unreadable ({e}), retrying with {size} per request")
+                continue
+            position = chunk_end
+        
+        return results
+    
     def grade_students_batch(
         self,
         students: List[Student],
@@ -827,10 +1445,19 @@ class LLMService:
         grading_type: str,
         references: Optional[List[str]] = None,
         groq_model_name: str = "qwen/qwen3-32b",
-        progress_callback: Optional[Callable] = None
+        progress_callback: Optional[Callable] = None,
+        batch_size: Optional[int] = None
     ) -> List[GradingResult]:
         """
-        Grade multiple students sequentially with progress tracking.
+        Grade multiple students with progress tracking.
+        
+        Descriptive answers are packed batch_size at a time into one prompt, cutting
+        API round-trips from N to ceil(N / batch_size). Any student missing from a
+        packed response (or a whole chunk whose response cannot be parsed) is graded
+        individually. Map grading always sends one image per call. Individually
+        graded students are sent concurrently, at most config.MAX_CONCURRENT_REQUESTS
+        at a time, and results keep the input order. When called from inside a
+        running event loop the same students are graded on a thread pool instead.
         
         Args:
             students: List of students to grade
@@ -840,6 +1467,8 @@ class LLMService:
             references: Reference materials from RAG
             groq_model_name: Specific Groq model to use (default: qwen/qwen3-32b)
             progress_callback: Optional callback for progress updates
+            batch_size: Students per packed prompt (1 disables packing;
+                defaults to config.PACKED_GRADING_BATCH_SIZE, which is 1 unless configured)
             
         Returns:
             List of grading results
@@ -849,34 +1478,134 @@ class LLMService:
         
         logger.info(f"Starting batch grading for {total_students} students")
         
-        for i, student in enumerate(students, 1):
+        if batch_size is None:
+            batch_size = config.PACKED_GRADING_BATCH_SIZE
+        
+        packed_results: List[Optional[GradingResult]] = [None] * total_students
+        if grading_type == GradingType.DESCRIPTIVE and batch_size > 1:
+            packed_results = self.grade_students_packed(
+                students, rubric, model_type, references, groq_model_name, batch_size
+            )
+        
+        pending = [i for i, result in enumerate(packed_results) if result is None]
+        if pending:
+            pending_students = [students[i] for i in pending]
             try:
-                # Grade individual student
-                result = self.grade_student_sequential(
-                    student=student,
-                    rubric=rubric,
-                    model_type=model_type,
-                    grading_type=grading_type,
-                    references=references,
-                    groq_model_name=groq_model_name
+                asyncio.get_running_loop()
+            except RuntimeError:
+                graded = asyncio.run(self._agrade_students(
+                    pending_students, rubric, model_type, grading_type,
+                    references, groq_model_name
+                ))
+            else:
+                # Called from inside an event loop (asyncio.run is not allowed there)
+                graded = self._grade_students_threaded(
+                    pending_students, rubric, model_type, grading_type,
+                    references, groq_model_name
                 )
-                
-                results.append(result)
-                
-                # Call progress callback if provided
-                if progress_callback:
-                    progress_callback(i, total_students, result)
-                
-                logger.info(f"Completed {i}/{total_students} students")
-                
-            except Exception as e:
-                logger.error(f"Failed to grade student {student.name}: {e}")
+            for i, result in zip(pending, graded):
+                packed_results[i] = result
+        
+        for i, (student, result) in enumerate(zip(students, packed_results), 1):
+            if isinstance(result, BaseException) or result is None:
+                logger.error(f"Failed to grade student {student.name}: {result}")
                 # Continue with next student
                 continue
+            
+            results.append(result)
+            
+            # Call progress callback if provided
+            if progress_callback:
+                try:
+                    progress_callback(i, total_students, result)
+                except Exception as e:
+                    logger.warning(f"Progress callback failed: {e}")
+            
+            logger.info(f"Completed {i}/{total_students} students")
         
         logger.info(f"Batch grading completed. {len(results)}/{total_students} students graded successfully")
         return results
     
+    async def agrade_student(
+        self,
+        student: Student,
+        rubric: Rubric,
+        model_type: str,
+        grading_type: str,
+        references: Optional[List[str]] = None,
+        groq_model_name: str = "qwen/qwen3-32b"
+    ) -> GradingResult:
+        """
+        Grade a single student without blocking the event loop.
+        
+        The blocking SDK call runs in a worker thread, so several awaits overlap
+        their network waits.
+        """
+        return await asyncio.to_thread(
+            self.grade_student_sequential,
+            student=student,
+            rubric=rubric,
+            model_type=model_type,
+            grading_type=grading_type,
+            references=references,
+            groq_model_name=groq_model_name
+        )
+    
+    async def _agrade_students(
+        self,
+        students: List[Student],
+        rubric: Rubric,
+        model_type: str,
+        grading_type: str,
+        references: Optional[List[str]],
+        groq_model_name: str
+    ) -> List[Union[GradingResult, BaseException]]:
+        """Grade students concurrently; failures are returned in place of results."""
+        semaphore = asyncio.Semaphore(max(config.MAX_CONCURRENT_REQUESTS, 1))
+        
+        async def _grade(student: Student) -> GradingResult:
+            async with semaphore:
+                return await self.agrade_student(
+                    student, rubric, model_type, grading_type, references, groq_model_name
+                )
+        
+        return await asyncio.gather(*(_grade(student) for student in students), return_exceptions=True)
+    
+    def _grade_students_threaded(
+        self,
+        students: List[Student],
+        rubric: Rubric,
+        model_type: str,
+        grading_type: str,
+        references: Optional[List[str]],
+        groq_model_name: str
+    ) -> List[Union[GradingResult, BaseException]]:
+        """Grade students on a thread pool; failures are returned in place of results, in input order."""
+        graded: List[Union[GradingResult, BaseException, None]] = [None] * len(students)
+        with ThreadPoolExecutor(
+            max_workers=max(min(config.MAX_CONCURRENT_REQUESTS, len(students)), 1),
+            thread_name_prefix="batch-grading"
+        ) as executor:
+            futures = {
+                executor.submit(
+                    self.grade_student_sequential,
+                    student=student,
+                    rubric=rubric,
+                    model_type=model_type,
+                    grading_type=grading_type,
+                    references=references,
+                    groq_model_name=groq_model_name
+                ): position
+                for position, student in enumerate(students)
+            }
+            for future in as_completed(futures):
+                position = futures[future]
+                try:
+                    graded[position] = future.result()
+                except Exception as e:
+                    graded[position] = e
+        return graded
+    
     def validate_api_availability(self) -> Dict[str, bool]:
         """
         Check availability of API services.
@@ -917,17 +1646,21 @@ class LLMService:
     
     def optimize_memory_usage(self) -> Dict[str, Any]:
         """Optimize memory usage by cleaning up caches and resources."""
-        cache_size = len(self.response_cache)
-        
-        # Clear old cache entries
-        current_time = time.time()
-        expired_keys = [
-            key for key, data in self.response_cache.items()
-            if current_time - data['timestamp'] > getattr(config, 'API_CACHE_TTL_SECONDS', 300)
-        ]
+        with self._response_cache_lock:
+            cache_size = len(self.response_cache)
+            
+            # Clear old cache entries
+            current_time = time.time()
+            expired_keys = [
+                key for key, data in self.response_cache.items()
+                if current_time - data['timestamp'] > getattr(config, 'API_CACHE_TTL_SECONDS', 300)
+            ]
+            
+            for key in expired_keys:
+                del self.response_cache[key]
         
-        for key in expired_keys:
-            del self.response_cache[key]
+        if self.response_disk_cache is not None:
+            self.response_disk_cache.purge_expired()
         
         # Clear prompt cache if it's getting large
         # Since @lru_cache was removed, there's no prompt cache to clear
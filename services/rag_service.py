@@ -4,28 +4,57 @@
 문서 처리 및 유사성 검색을 위해 LangChain FAISS를 사용하는 간소화된 RAG 서비스입니다.
 """
 
-import os
-import tempfile
-from typing import List, Optional
-from dataclasses import dataclass, field
+import io
+import json
+import hashlib
+from typing import TYPE_CHECKING, Dict, Iterator, List, Optional, Tuple
+from dataclasses import dataclass
+from functools import lru_cache
 import logging
+from collections import OrderedDict
 from pathlib import Path
 
-from langchain_huggingface import HuggingFaceEmbeddings
+import numpy as np
 from langchain_community.vectorstores import FAISS
 from langchain_core.documents import Document as LangChainDocument
 import PyPDF2
 from docx import Document
 
+from config import config
+from utils.cache_utils import DiskCache
 
-@dataclass
+if TYPE_CHECKING:
+    from langchain_huggingface import HuggingFaceEmbeddings
+
+
+EMBEDDING_MODEL_NAME = "sentence-transformers/all-MiniLM-L6-v2"
+
+
+@lru_cache(maxsize=1)
+def _get_embeddings() -> "HuggingFaceEmbeddings":
+    """임베딩 모델을 한 번만 로드하여 모든 RAGService 인스턴스가 공유"""
+    # torch/sentence-transformers는 임베딩이 실제로 필요할 때만 import
+    from langchain_huggingface import HuggingFaceEmbeddings
+    
+    return HuggingFaceEmbeddings(model_name=EMBEDDING_MODEL_NAME)
+
+
+@dataclass(frozen=True, slots=True)
 class RAGResult:
-    """RAG 처리 결과"""
+    """RAG 처리 결과 (불변, 해시 가능)"""
     success: bool
-    content: List[str] = field(default_factory=list)
+    content: Tuple[str, ...] = ()
     error_message: str = ""
 
 
+@dataclass
+class DocumentShard:
+    """업로드 파일 하나에서 생성된 청크와 임베딩"""
+    texts: List[str]
+    vectors: np.ndarray
+    metadatas: List[dict]
+
+
 class RAGService:
     """
     문서 처리 및 유사성 검색을 위해 LangChain FAISS를 사용하는 간소화된 RAG 서비스
@@ -42,15 +71,23 @@ class RAGService:
     def __init__(self):
         """HuggingFace 임베딩으로 RAG 서비스 초기화"""
         if not RAGService._initialized:
-            self.embeddings = HuggingFaceEmbeddings(model_name="sentence-transformers/all-MiniLM-L6-v2")
+            self.embeddings = _get_embeddings()
             self.vector_store = None
+            # 파일 해시 -> 샤드, Streamlit file_id -> 파일 해시 (프로세스 전역 싱글톤이므로 LRU로 크기 제한)
+            self.shards: "OrderedDict[str, DocumentShard]" = OrderedDict()
+            self._active_shard_keys: Tuple[str, ...] = ()
+            self._file_hash_memo: "OrderedDict[str, str]" = OrderedDict()
             self.logger = logging.getLogger(__name__)
+            self.embedding_cache = self._open_embedding_cache()
             RAGService._initialized = True
         
     def process_documents(self, uploaded_files: List) -> bool:
         """
         업로드된 참고 문서를 처리하고 FAISS 벡터 저장소 생성
         
+        파일마다 청크와 임베딩을 샤드로 보관하므로, 참고 자료가 추가되어도
+        새 파일만 임베딩하고 기존 샤드는 재사용합니다.
+        
         Args:
             uploaded_files: Streamlit에서 업로드된 파일 객체 목록
             
@@ -58,38 +95,353 @@ class RAGService:
             처리 성공 시 True, 실패 시 False
         """
         try:
-            documents = []
+            hashed_files = self._hash_files(uploaded_files)
+            shard_keys = tuple(file_hash for _, file_hash in hashed_files)
             
-            for file_obj in uploaded_files:
-                try:
-                    # 텍스트 내용 추출
-                    content = self._extract_document_content(file_obj)
-                    if content:
-                        # 청크 생성
-                        chunks = self._chunk_document(content)
-                        
-                        # LangChain Document 객체로 변환
-                        for i, chunk in enumerate(chunks):
-                            doc = LangChainDocument(
-                                page_content=chunk,
-                                metadata={"source": file_obj.name, "chunk_id": i}
-                            )
-                            documents.append(doc)
-                            
-                except Exception:
-                    # 문제가 있는 파일은 건너뛰기
-                    continue
+            # 같은 파일 구성으로 이미 만들어진 저장소는 그대로 사용
+            if self.vector_store is not None and shard_keys == self._active_shard_keys:
+                return True
+            
+            cache_dir = self._get_index_cache_dir(shard_keys)
+            if cache_dir and self._load_cached_index(cache_dir):
+                self._active_shard_keys = shard_keys
+                return True
+            
+            # 1단계: 아직 샤드가 없는 파일만 청크 분할 및 임베딩
+            shards = []
+            for file_obj, file_hash in hashed_files:
+                shard = self.shards.get(file_hash)
+                if shard is not None:
+                    self.shards.move_to_end(file_hash)
+                else:
+                    try:
+                        shard = self._build_shard(file_obj)
+                    except Exception:
+                        # 문제가 있는 파일은 건너뛰기
+                        shard = None
+                    if shard is None:
+                        continue
+                    self.shards[file_hash] = shard
+                shards.append(shard)
             
-            if not documents:
+            if not shards:
                 return False
             
-            # 문서들로부터 FAISS 벡터 저장소 생성
-            self.vector_store = FAISS.from_documents(documents, self.embeddings)
+            # 2단계: 샤드의 임베딩을 모아 FAISS 벡터 저장소를 한 번에 생성 (재임베딩 없음)
+            texts = [text for shard in shards for text in shard.texts]
+            metadatas = [metadata for shard in shards for metadata in shard.metadatas]
+            vectors = np.vstack([shard.vectors for shard in shards])
+            self.vector_store = self._build_vector_store(texts, vectors, metadatas)
+            self._active_shard_keys = shard_keys
+            self._trim_shards()
+            
+            if cache_dir:
+                try:
+                    self._save_index_cache(cache_dir, texts, metadatas)
+                except Exception as e:
+                    self.logger.warning(f"FAISS 인덱스 캐시 저장 실패: {e}")
             return True
             
         except Exception:
             return False
     
+    def _build_shard(self, file_obj) -> Optional[DocumentShard]:
+        """
+        단일 파일을 청크로 분할하고 임베딩하여 샤드 생성
+        
+        Args:
+            file_obj: 업로드된 파일 객체
+            
+        Returns:
+            생성된 샤드 (추출된 내용이 없으면 None)
+        """
+        # 텍스트 내용 추출 및 청크 생성 (PDF는 페이지 단위 스트리밍)
+        chunks = list(self._iter_document_chunks(file_obj))
+        if not chunks:
+            return None
+        
+        # 중복 청크를 제거한 뒤 배치 단위로 임베딩
+        vectors = np.asarray(self._embed_unique_chunks(chunks), dtype="float32")
+        metadatas = [{"source": file_obj.name, "chunk_id": i} for i in range(len(chunks))]
+        return DocumentShard(texts=chunks, vectors=vectors, metadatas=metadatas)
+    
+    def _hash_files(self, uploaded_files: List) -> List[Tuple[object, str]]:
+        """
+        업로드 파일별 내용 해시 계산 (Streamlit file_id 기준으로 메모)
+        
+        Args:
+            uploaded_files: 업로드된 파일 객체 목록
+            
+        Returns:
+            (파일 객체, sha256 해시) 목록 (읽을 수 없는 파일은 제외)
+        """
+        hashed_files = []
+        for file_obj in uploaded_files:
+            file_id = getattr(file_obj, "file_id", None)
+            file_hash = self._file_hash_memo.get(file_id) if file_id else None
+            if file_hash is not None:
+                self._file_hash_memo.move_to_end(file_id)
+            else:
+                try:
+                    file_hash = hashlib.sha256(self._read_file_bytes(file_obj)).hexdigest()
+                except Exception:
+                    continue
+                if file_id:
+                    self._file_hash_memo[file_id] = file_hash
+                    if len(self._file_hash_memo) > config.RAG_FILE_HASH_MEMO_SIZE:
+                        self._file_hash_memo.popitem(last=False)
+            hashed_files.append((file_obj, file_hash))
+        return hashed_files
+    
+    def _trim_shards(self):
+        """현재 벡터 저장소에 쓰이지 않는 오래된 샤드부터 제거하여 config.RAG_SHARD_CACHE_SIZE 이하로 유지"""
+        active = set(self._active_shard_keys)
+        for file_hash in list(self.shards):
+            if len(self.shards) <= config.RAG_SHARD_CACHE_SIZE:
+                break
+            if file_hash not in active:
+                del self.shards[file_hash]
+    
+    def _get_index_cache_dir(self, shard_keys: Tuple[str, ...]) -> Optional[Path]:
+        """
+        업로드 파일 해시와 임베딩 모델로 인덱스 캐시 경로 계산
+        
+        Args:
+            shard_keys: 업로드 파일별 sha256 해시
+            
+        Returns:
+            캐시 디렉터리 경로 (캐시 비활성화 또는 파일이 없으면 None)
+        """
+        if not config.FAISS_CACHE_ENABLED or not shard_keys:
+            return None
+        
+        key_source = "|".join(sorted(shard_keys) + [EMBEDDING_MODEL_NAME])
+        cache_key = hashlib.sha256(key_source.encode()).hexdigest()
+        return Path(config.FAISS_CACHE_DIR) / cache_key
+    
+    def _save_index_cache(self, cache_dir: Path, texts: List[str], metadatas: List[dict]):
+        """
+        FAISS 인덱스와 청크 텍스트/메타데이터를 디스크 캐시에 저장
+        
+        문서 저장소는 pickle 대신 JSON으로 저장하여, 캐시 디렉터리의 파일을 읽을 때
+        임의 코드가 실행되지 않도록 합니다.
+        
+        Args:
+            cache_dir: 저장할 인덱스 디렉터리
+            texts: 인덱스 순서와 같은 청크 텍스트 목록
+            metadatas: 인덱스 순서와 같은 청크 메타데이터 목록
+        """
+        import faiss
+        
+        cache_dir.mkdir(parents=True, exist_ok=True)
+        faiss.write_index(self.vector_store.index, str(cache_dir / "index.faiss"))
+        documents = [
+            {"page_content": text, "metadata": metadata}
+            for text, metadata in zip(texts, metadatas)
+        ]
+        with open(cache_dir / "docstore.json", "w", encoding="utf-8") as f:
+            json.dump(documents, f, ensure_ascii=False)
+    
+    def _load_cached_index(self, cache_dir: Path) -> bool:
+        """
+        디스크에 저장된 FAISS 인덱스를 메모리 매핑으로 불러오기
+        
+        Args:
+            cache_dir: _save_index_cache로 저장된 인덱스 디렉터리
+            
+        Returns:
+            캐시 적중 및 로드 성공 시 True
+        """
+        index_path = cache_dir / "index.faiss"
+        store_path = cache_dir / "docstore.json"
+        if not index_path.exists() or not store_path.exists():
+            return False
+        
+        try:
+            import faiss
+            
+            # 인덱스는 mmap으로 읽어 재구축 없이 페이지 단위로 로드
+            index = faiss.read_index(str(index_path), faiss.IO_FLAG_MMAP | faiss.IO_FLAG_READ_ONLY)
+            with open(store_path, "r", encoding="utf-8") as f:
+                documents = json.load(f)
+            if len(documents) != index.ntotal:
+                raise ValueError("문서 수와 인덱스 크기가 일치하지 않음")
+            
+            self.vector_store = self._wrap_faiss_index(
+                index,
+                [document["page_content"] for document in documents],
+                [document["metadata"] for document in documents],
+            )
+            self.logger.info(f"캐시된 FAISS 인덱스 재사용: {cache_dir.name[:12]}")
+            return True
+        except Exception as e:
+            self.logger.warning(f"FAISS 인덱스 캐시 로드 실패, 다시 생성합니다: {e}")
+            return False
+    
+    @staticmethod
+    def _read_file_bytes(file_obj) -> bytes:
+        """업로드 파일의 전체 바이트를 읽고 읽기 위치를 처음으로 되돌림"""
+        if hasattr(file_obj, "getvalue"):
+            return file_obj.getvalue()
+        data = file_obj.read()
+        file_obj.seek(0)
+        return data
+    
+    def _build_vector_store(self, texts: List[str], vectors: np.ndarray, metadatas: List[dict]) -> FAISS:
+        """
+        청크 수에 따라 Flat 또는 IVF-PQ 인덱스로 FAISS 벡터 저장소 생성
+        
+        청크가 FAISS_ANN_THRESHOLD 이하이면 Flat 인덱스(FAISS_QUANTIZATION이 "int8"이면
+        8비트 스칼라 양자화)를 사용하고, 그보다 많으면 index_factory로 학습된
+        근사 인덱스를 만들어 검색 비용을 줄입니다.
+        
+        Args:
+            texts: 청크 텍스트 목록
+            vectors: 청크별 임베딩 벡터
+            metadatas: 청크별 메타데이터
+            
+        Returns:
+            생성된 FAISS 벡터 저장소
+        """
+        use_ann = len(vectors) > config.FAISS_ANN_THRESHOLD
+        if not use_ann and config.FAISS_QUANTIZATION != "int8":
+            return FAISS.from_embeddings(list(zip(texts, vectors)), self.embeddings, metadatas=metadatas)
+        
+        import faiss
+        
+        matrix = np.asarray(vectors, dtype="float32")
+        
+        if use_ann:
+            nlist = max(int(4 * np.sqrt(len(matrix))), 1)
+            factory_string = config.FAISS_ANN_INDEX_FACTORY.format(nlist=nlist)
+            
+            index = faiss.index_factory(matrix.shape[1], factory_string)
+            index.train(matrix)
+            index.add(matrix)
+            faiss.extract_index_ivf(index).nprobe = config.FAISS_ANN_NPROBE
+            self.logger.info(f"대용량 참고 자료 인덱스 생성: {factory_string} ({len(matrix)}개 청크)")
+        else:
+            # 벡터당 4바이트 대신 1바이트로 저장해 인덱스 크기와 검색 시 메모리 대역폭 절감
+            index = faiss.IndexScalarQuantizer(matrix.shape[1], faiss.ScalarQuantizer.QT_8bit)
+            index.train(matrix)
+            index.add(matrix)
+        
+        return self._wrap_faiss_index(index, texts, metadatas)
+    
+    def _wrap_faiss_index(self, index, texts: List[str], metadatas: List[dict]) -> FAISS:
+        """직접 구성한 FAISS 인덱스를 LangChain 벡터 저장소로 감싸기"""
+        from langchain_community.docstore.in_memory import InMemoryDocstore
+        
+        ids = [str(i) for i in range(len(texts))]
+        docstore = InMemoryDocstore({
+            doc_id: LangChainDocument(page_content=text, metadata=metadata)
+            for doc_id, text, metadata in zip(ids, texts, metadatas)
+        })
+        return FAISS(
+            embedding_function=self.embeddings,
+            index=index,
+            docstore=docstore,
+            index_to_docstore_id=dict(enumerate(ids)),
+        )
+    
+    def _embed_unique_chunks(self, texts: List[str]) -> List[List[float]]:
+        """
+        내용이 같은 청크는 한 번만 임베딩하고 원래 순서대로 벡터를 복원
+        
+        Args:
+            texts: 임베딩할 텍스트 청크 목록 (중복 포함 가능)
+            
+        Returns:
+            입력 순서와 동일한 임베딩 벡터 목록
+        """
+        unique_positions = {}
+        chunk_keys = []
+        for text in texts:
+            key = hashlib.blake2b(text.encode("utf-8"), digest_size=16).digest()
+            unique_positions.setdefault(key, len(unique_positions))
+            chunk_keys.append(key)
+        
+        if len(unique_positions) == len(texts):
+            return self._embed_with_cache(texts)
+        
+        unique_texts = [None] * len(unique_positions)
+        for text, key in zip(texts, chunk_keys):
+            unique_texts[unique_positions[key]] = text
+        
+        self.logger.info(f"중복 청크 {len(texts) - len(unique_texts)}개 임베딩 생략")
+        unique_vectors = self._embed_with_cache(unique_texts)
+        return [unique_vectors[unique_positions[key]] for key in chunk_keys]
+    
+    def _open_embedding_cache(self) -> Optional[DiskCache]:
+        """청크 임베딩 디스크 캐시 열기 (비활성화 또는 열기 실패 시 None)"""
+        if not config.EMBEDDING_CACHE_ENABLED:
+            return None
+        try:
+            return DiskCache(config.EMBEDDING_CACHE_PATH)
+        except Exception as e:
+            self.logger.warning(f"임베딩 캐시를 열 수 없어 사용하지 않습니다: {e}")
+            return None
+    
+    @staticmethod
+    def _embedding_cache_key(text: str) -> str:
+        """임베딩 모델과 청크 내용으로 캐시 키 생성"""
+        return hashlib.sha256(f"{EMBEDDING_MODEL_NAME}\0{text}".encode("utf-8")).hexdigest()
+    
+    def _embed_with_cache(self, texts: List[str]) -> List[List[float]]:
+        """
+        디스크 캐시에 있는 청크 임베딩은 재사용하고 나머지만 임베딩
+        
+        참고 자료 구성이 바뀌어 FAISS 인덱스 캐시가 맞지 않더라도
+        이전에 임베딩한 청크는 모델을 다시 실행하지 않습니다.
+        
+        Args:
+            texts: 임베딩할 텍스트 청크 목록 (중복 없음)
+            
+        Returns:
+            입력 순서와 동일한 임베딩 벡터 목록
+        """
+        if self.embedding_cache is None:
+            return self._embed_in_batches(texts)
+        
+        vectors: List[Optional[List[float]]] = [None] * len(texts)
+        missing_positions = []
+        cache_keys = [self._embedding_cache_key(text) for text in texts]
+        for position, cache_key in enumerate(cache_keys):
+            cached = self.embedding_cache.get(cache_key)
+            if cached is None:
+                missing_positions.append(position)
+            else:
+                vectors[position] = np.frombuffer(cached, dtype="float32").tolist()
+        
+        if missing_positions:
+            new_vectors = self._embed_in_batches([texts[position] for position in missing_positions])
+            for position, vector in zip(missing_positions, new_vectors):
+                vectors[position] = vector
+                self.embedding_cache.set(
+                    cache_keys[position], np.asarray(vector, dtype="float32").tobytes()
+                )
+        
+        hits = len(texts) - len(missing_positions)
+        if hits:
+            self.logger.info(f"캐시된 청크 임베딩 {hits}개 재사용")
+        return vectors
+    
+    def _embed_in_batches(self, texts: List[str]) -> List[List[float]]:
+        """
+        청크 목록을 EMBEDDING_BATCH_SIZE 단위로 나누어 임베딩
+        
+        Args:
+            texts: 임베딩할 텍스트 청크 목록
+            
+        Returns:
+            입력 순서와 동일한 임베딩 벡터 목록
+        """
+        batch_size = max(config.EMBEDDING_BATCH_SIZE, 1)
+        vectors = []
+        for start in range(0, len(texts), batch_size):
+            vectors.extend(self.embeddings.embed_documents(texts[start:start + batch_size]))
+        return vectors
+    
     def search_relevant_content(self, query: str, k: int = 3) -> List[str]:
         """
         쿼리를 기반으로 관련 내용 검색
@@ -114,6 +466,47 @@ class RAGService:
         except Exception:
             return []
     
+    def search_relevant_content_batch(self, queries: List[str], k: int = 3) -> List[List[str]]:
+        """
+        여러 쿼리를 한 번의 임베딩 호출과 한 번의 FAISS 검색으로 처리
+        
+        Args:
+            queries: 검색할 쿼리 텍스트 목록 (예: 학급 전체 학생 답안)
+            k: 쿼리당 검색할 유사 청크 수
+            
+        Returns:
+            쿼리 순서와 동일한 관련 텍스트 청크 목록의 목록
+        """
+        results: List[List[str]] = [[] for _ in queries]
+        if not self.vector_store:
+            return results
+        
+        positions = [i for i, query in enumerate(queries) if query and query.strip()]
+        if not positions:
+            return results
+        
+        try:
+            query_vectors = np.asarray(
+                self.embeddings.embed_documents([queries[i].strip() for i in positions]),
+                dtype="float32"
+            )
+            # (N, d) 쿼리 행렬을 한 번에 검색
+            _, indices = self.vector_store.index.search(query_vectors, k)
+            
+            id_map = self.vector_store.index_to_docstore_id
+            docstore = self.vector_store.docstore
+            for position, row in zip(positions, indices):
+                results[position] = [
+                    docstore.search(id_map[int(idx)]).page_content
+                    for idx in row if idx != -1
+                ]
+        except Exception:
+            # 일괄 검색이 불가능하면 쿼리별 검색으로 대체
+            for position in positions:
+                results[position] = self.search_relevant_content(queries[position], k=k)
+        
+        return results
+    
     def process_documents_for_student(self, uploaded_files: List, student_answer: str) -> RAGResult:
         """
         문서를 처리하고 특정 학생 답안과 관련된 내용 검색
@@ -126,18 +519,16 @@ class RAGService:
             성공 상태와 관련 내용이 포함된 RAGResult
         """
         try:
-            # 문서가 아직 처리되지 않았다면 처리
-            if not self.vector_store:
-                success = self.process_documents(uploaded_files)
-                if not success:
-                    return RAGResult(success=False, error_message="문서 처리 실패")
+            # 현재 업로드된 파일 구성으로 저장소 준비 (이미 처리된 파일은 재사용)
+            if not self.process_documents(uploaded_files):
+                return RAGResult(success=False, error_message="문서 처리 실패")
             
             # 학생 답안을 쿼리로 사용하여 관련 내용 검색
             relevant_content = self.search_relevant_content(student_answer, k=3)
             
             return RAGResult(
                 success=True,
-                content=relevant_content
+                content=tuple(relevant_content)
             )
             
         except Exception as e:
@@ -146,6 +537,70 @@ class RAGService:
                 error_message=str(e)
             )
     
+    def _iter_document_chunks(self, file_obj) -> Iterator[str]:
+        """
+        업로드 파일에서 청크를 생성
+        
+        PDF는 전체 문서 문자열을 만들지 않고 페이지 단위로 청크를 내보내며,
+        그 외 형식은 추출한 텍스트를 _chunk_document로 분할합니다.
+        
+        Args:
+            file_obj: 업로드된 파일 객체
+            
+        Yields:
+            텍스트 청크
+        """
+        if Path(file_obj.name).suffix.lower() == '.pdf':
+            pdf_reader = PyPDF2.PdfReader(io.BytesIO(file_obj.read()))
+            yield from self._stream_chunks_from_pdf(pdf_reader)
+            return
+        
+        content = self._extract_document_content(file_obj)
+        if content:
+            yield from self._chunk_document(content)
+    
+    def _stream_chunks_from_pdf(self, pdf_reader, chunk_size: int = 300, overlap: int = 50) -> Iterator[str]:
+        """
+        PDF 페이지를 순서대로 읽으며 겹침 청크를 생성
+        
+        다음 청크 시작 위치 이후의 텍스트만 버퍼에 남기므로 메모리 사용량이
+        페이지 수와 무관하게 유지되며, 결과는 전체 텍스트를 _chunk_document로
+        분할한 것과 같습니다.
+        
+        Args:
+            pdf_reader: PyPDF2 PdfReader 객체
+            chunk_size: 청크당 최대 문자 수
+            overlap: 청크 간 겹칠 문자 수
+            
+        Yields:
+            텍스트 청크
+        """
+        step = max(chunk_size - overlap, 1)
+        buffer = ""
+        
+        for page in pdf_reader.pages:
+            page_text = page.extract_text()
+            if not page_text.strip():
+                continue
+            
+            buffer = f"{buffer}\n\n{page_text}" if buffer else page_text.lstrip()
+            
+            # 다음 페이지의 내용이 필요 없는 완전한 청크만 먼저 내보냄
+            start = 0
+            while len(buffer) - start >= chunk_size:
+                chunk = buffer[start:start + chunk_size].strip()
+                if chunk:
+                    yield chunk
+                start += step
+            buffer = buffer[start:]
+        
+        # 남은 꼬리 부분을 같은 시작 위치 규칙으로 마무리
+        tail = buffer.rstrip()
+        for start in range(0, len(tail), step):
+            chunk = tail[start:start + chunk_size].strip()
+            if chunk:
+                yield chunk
+    
     def _extract_document_content(self, file_obj) -> Optional[str]:
         """
         PDF 또는 DOCX 파일에서 텍스트 내용 추출
@@ -170,41 +625,26 @@ class RAGService:
             return None
     
     def _extract_pdf_content(self, file_obj) -> str:
-        """PDF 파일에서 텍스트 내용 추출"""
-        with tempfile.NamedTemporaryFile(delete=False, suffix='.pdf') as tmp_file:
-            tmp_file.write(file_obj.read())
-            tmp_file_path = tmp_file.name
+        """PDF 파일에서 텍스트 내용 추출 (임시 파일 없이 메모리에서 처리)"""
+        pdf_reader = PyPDF2.PdfReader(io.BytesIO(file_obj.read()))
+        text_content = []
+        for page in pdf_reader.pages:
+            page_text = page.extract_text()
+            if page_text.strip():
+                text_content.append(page_text)
         
-        try:
-            text_content = []
-            with open(tmp_file_path, 'rb') as pdf_file:
-                pdf_reader = PyPDF2.PdfReader(pdf_file)
-                for page in pdf_reader.pages:
-                    page_text = page.extract_text()
-                    if page_text.strip():
-                        text_content.append(page_text)
-            
-            return '\n\n'.join(text_content)
-        finally:
-            os.unlink(tmp_file_path)
+        return '\n\n'.join(text_content)
     
     def _extract_docx_content(self, file_obj) -> str:
-        """DOCX 파일에서 텍스트 내용 추출"""
-        with tempfile.NamedTemporaryFile(delete=False, suffix='.docx') as tmp_file:
-            tmp_file.write(file_obj.read())
-            tmp_file_path = tmp_file.name
+        """DOCX 파일에서 텍스트 내용 추출 (임시 파일 없이 메모리에서 처리)"""
+        doc = Document(io.BytesIO(file_obj.read()))
+        text_content = []
         
-        try:
-            doc = Document(tmp_file_path)
-            text_content = []
-            
-            for paragraph in doc.paragraphs:
-                if paragraph.text.strip():
-                    text_content.append(paragraph.text)
-            
-            return '\n\n'.join(text_content)
-        finally:
-            os.unlink(tmp_file_path)  
+        for paragraph in doc.paragraphs:
+            if paragraph.text.strip():
+                text_content.append(paragraph.text)
+        
+        return '\n\n'.join(text_content)
     
     def _chunk_document(self, content: str, chunk_size: int = 300, overlap: int = 50) -> List[str]:
         """
@@ -222,20 +662,13 @@ class RAGService:
             return []
         
         content = content.strip()
-        chunks = []
         
-        # 겹침이 있는 간단한 문자 기반 청킹
-        start = 0
-        while start < len(content):
-            end = start + chunk_size
-            chunk = content[start:end]
-            
-            if chunk.strip():
-                chunks.append(chunk.strip())
-            
-            start += chunk_size - overlap
+        # 겹침이 있는 간단한 문자 기반 청킹 (청크 시작 위치를 미리 계산해 한 번에 슬라이싱)
+        step = max(chunk_size - overlap, 1)
+        chunks = (content[start:start + chunk_size].strip()
+                  for start in range(0, len(content), step))
         
-        return chunks
+        return [chunk for chunk in chunks if chunk]
 
 
 def create_rag_service() -> RAGService:
@@ -252,6 +685,8 @@ def format_retrieved_content(content: List[str]) -> str:
     """
     LLM 프롬프트에 포함할 수 있도록 검색된 RAG 내용을 포맷팅
     
+    같은 청크 조합은 재시도나 여러 학생 사이에서 반복되므로 결과를 캐시합니다.
+    
     Args:
         content: 검색된 텍스트 청크 목록
         
@@ -261,6 +696,12 @@ def format_retrieved_content(content: List[str]) -> str:
     if not content:
         return ""
     
+    return _format_chunks(tuple(content))
+
+
+@lru_cache(maxsize=512)
+def _format_chunks(content: Tuple[str, ...]) -> str:
+    """청크 튜플을 참고자료 형식 문자열로 변환 (캐시됨)"""
     formatted_chunks = []
     for i, chunk in enumerate(content, 1):
         # 프롬프트 팽창을 방지하기 위해 각 청크를 300자로 제한
@@ -270,4 +711,4 @@ def format_retrieved_content(content: List[str]) -> str:
         
         formatted_chunks.append(f"참고자료 {i}:\n{truncated_chunk}")
     
-    return "\n\n".join(formatted_chunks)
\ No newline at end of file
+    return "\n\n".join(formatted_chunks)
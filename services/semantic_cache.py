@@ -0,0 +1,140 @@
+"""
+지리 자동 채점 시스템의 의미 기반 채점 결과 캐시
+
+표현은 다르지만 뜻이 같은 답안(패러프레이즈)을 임베딩 유사도로 찾아
+이미 받은 채점 결과를 재사용합니다. 같은 루브릭/모델 조합 안에서만 비교합니다.
+"""
+
+import logging
+import threading
+from dataclasses import dataclass, field
+from functools import lru_cache
+from typing import TYPE_CHECKING, Any, Dict, List, Optional
+
+import numpy as np
+
+from config import config
+
+if TYPE_CHECKING:
+    from langchain_huggingface import HuggingFaceEmbeddings
+
+
+logger = logging.getLogger(__name__)
+
+
+@lru_cache(maxsize=1)
+def _get_semantic_embeddings() -> "HuggingFaceEmbeddings":
+    """의미 캐시용 다국어 임베딩 모델을 한 번만 로드"""
+    # torch/sentence-transformers는 의미 캐시가 실제로 쓰일 때만 import
+    from langchain_huggingface import HuggingFaceEmbeddings
+    
+    return HuggingFaceEmbeddings(model_name=config.SEMANTIC_CACHE_MODEL)
+
+
+@dataclass
+class _Namespace:
+    """루브릭/모델 조합 하나의 답안 벡터 인덱스와 저장된 값"""
+    index: Any
+    values: List[Any] = field(default_factory=list)
+
+
+class SemanticCache:
+    """
+    코사인 유사도 기반 캐시
+    
+    정규화한 답안 임베딩을 네임스페이스별 faiss.IndexFlatIP에 보관하고,
+    가장 가까운 답안의 유사도가 임계값 이상이면 그 값을 돌려줍니다.
+    여러 채점 스레드에서 함께 사용할 수 있도록 잠금으로 보호합니다.
+    """
+    
+    def __init__(
+        self,
+        threshold: Optional[float] = None,
+        embeddings: Optional["HuggingFaceEmbeddings"] = None,
+        max_entries_per_namespace: Optional[int] = None
+    ):
+        """
+        의미 캐시를 초기화합니다.
+        
+        Args:
+            threshold: 캐시 적중으로 볼 최소 코사인 유사도 (기본값: config.SEMANTIC_CACHE_THRESHOLD)
+            embeddings: 임베딩 모델 (기본값: config.SEMANTIC_CACHE_MODEL을 처음 사용할 때 로드)
+            max_entries_per_namespace: 네임스페이스별 최대 항목 수, 넘으면 더 저장하지 않음
+                (기본값: config.SEMANTIC_CACHE_MAX_ENTRIES)
+        """
+        self.threshold = threshold if threshold is not None else config.SEMANTIC_CACHE_THRESHOLD
+        self.max_entries_per_namespace = (
+            max_entries_per_namespace
+            if max_entries_per_namespace is not None
+            else config.SEMANTIC_CACHE_MAX_ENTRIES
+        )
+        self._embeddings = embeddings
+        self._namespaces: Dict[str, _Namespace] = {}
+        self._lock = threading.Lock()
+    
+    def _embed(self, text: str) -> np.ndarray:
+        """텍스트를 L2 정규화된 (1, 차원) float32 벡터로 변환"""
+        if self._embeddings is None:
+            self._embeddings = _get_semantic_embeddings()
+        
+        vector = np.asarray([self._embeddings.embed_query(text)], dtype="float32")
+        norm = np.linalg.norm(vector)
+        if norm > 0:
+            vector /= norm
+        return vector
+    
+    def lookup(self, namespace: str, text: str) -> Optional[Any]:
+        """
+        가장 비슷한 답안의 값을 조회
+        
+        Args:
+            namespace: 비교 범위 (루브릭/모델 조합)
+            text: 학생 답안
+        
+        Returns:
+            유사도가 임계값 이상인 저장 값, 없으면 None
+        """
+        with self._lock:
+            entry = self._namespaces.get(namespace)
+            if entry is None or not entry.values:
+                return None
+        
+        vector = self._embed(text)
+        with self._lock:
+            scores, ids = entry.index.search(vector, 1)
+            best_id = int(ids[0][0])
+            if best_id < 0 or float(scores[0][0]) < self.threshold:
+                return None
+            logger.debug(f"Semantic cache hit (similarity {float(scores[0][0]):.3f})")
+            return entry.values[best_id]
+    
+    def put(self, namespace: str, text: str, value: Any):
+        """
+        답안과 값을 저장
+        
+        Args:
+            namespace: 비교 범위 (루브릭/모델 조합)
+            text: 학생 답안
+            value: 재사용할 값
+        """
+        vector = self._embed(text)
+        with self._lock:
+            entry = self._namespaces.get(namespace)
+            if entry is None:
+                import faiss
+                
+                entry = _Namespace(index=faiss.IndexFlatIP(vector.shape[1]))
+                self._namespaces[namespace] = entry
+            if len(entry.values) >= self.max_entries_per_namespace:
+                return
+            entry.index.add(vector)
+            entry.values.append(value)
+    
+    def clear(self):
+        """모든 네임스페이스 삭제"""
+        with self._lock:
+            self._namespaces.clear()
+    
+    def __len__(self) -> int:
+        with self._lock:
+            return sum(len(entry.values) for entry in self._namespaces.values())
@@ -9,12 +9,13 @@ from typing import List, Dict, Optional, Callable
 from datetime import datetime, timedelta
 from dataclasses import dataclass, field
 import threading
-import queue
+import logging
+from collections import deque
 
 from models.student_model import Student
 from models.rubric_model import Rubric
 from models.result_model import GradingResult
-from services.grading_engine import SequentialGradingEngine, GradingProgress, StudentGradingStatus, GradingStatus
+from services.grading_engine import ConcurrentGradingEngine, GradingProgress, StudentGradingStatus, GradingStatus
 from services.llm_service import LLMService
 from services.rag_service import RAGService, format_retrieved_content
 from utils.error_handler import handle_error, ErrorType, ErrorInfo
@@ -22,6 +23,16 @@ from utils.error_handler import handle_error, ErrorType, ErrorInfo
 from config import config
 
 
+logger = logging.getLogger(__name__)
+
+# 채점 상태 알림 문구 (% 포맷 템플릿)
+_GRADING_STARTED_MSG = "🚀 채점이 시작되었습니다!"
+_GRADING_COMPLETED_MSG = "🎉 채점이 완료되었습니다! 총 %d명의 학생이 채점되었습니다."
+
+# 한 번에 처리할 진행 상황 업데이트 상한 (초과분은 최신 상태로 병합)
+_MAX_PENDING_PROGRESS_UPDATES = 200
+
+
 def display_error(error_info: ErrorInfo, show_details: bool = False):
     """기본적인 오류 표시 함수 (error_display_ui 대체)"""
     # ErrorInfo에서 정보 추출
@@ -108,10 +119,11 @@ class GradingExecutionUI:
         self.grading_engine = None
         
         # Use session state to maintain queue instances across UI refreshes
-        if 'progress_queue' not in st.session_state:
-            st.session_state.progress_queue = queue.Queue()
-        if 'result_queue' not in st.session_state:
-            st.session_state.result_queue = queue.Queue()
+        # deque.append/popleft는 스레드 안전하므로 별도 락 없이 스레드 간 전달에 사용
+        if not isinstance(st.session_state.get('progress_queue'), deque):
+            st.session_state.progress_queue = deque()
+        if not isinstance(st.session_state.get('result_queue'), deque):
+            st.session_state.result_queue = deque()
             
         self.progress_queue = st.session_state.progress_queue
         self.result_queue = st.session_state.result_queue
@@ -671,13 +683,13 @@ class GradingExecutionUI:
         session = st.session_state.grading_session
         
         try:
-            # Initialize grading engine
-            self.grading_engine = SequentialGradingEngine()
+            # Initialize grading engine (students are graded in parallel up to MAX_CONCURRENT_REQUESTS)
+            self.grading_engine = ConcurrentGradingEngine()
             
             # Set up callbacks
             self.grading_engine.set_progress_callback(self.on_progress_update)
-            self.grading_engine.set_student_completed_callback(self.on_student_completed)
-            self.grading_engine.set_grading_completed_callback(self.on_grading_completed)
+            # Student results and the completion signal are sent from run_grading_thread,
+            # after iter_grade_students has been drained, so results are queued before 'completed'
             self.grading_engine.set_error_callback(self.on_error)
             
             # Validate setup
@@ -725,7 +737,7 @@ class GradingExecutionUI:
             grading_thread.start()
             st.session_state.grading_thread = grading_thread
             
-            st.success("🚀 채점이 시작되었습니다!")
+            st.success(_GRADING_STARTED_MSG)
             st.rerun()
             
         except Exception as e:
@@ -744,7 +756,9 @@ class GradingExecutionUI:
             groq_model_name = session.groq_model
             
             if self.grading_engine:
-                results = self.grading_engine.grade_students_sequential(
+                # Push each result to the UI as soon as it is graded
+                completed_count = 0
+                for result in self.grading_engine.iter_grade_students(
                     students=session.students,
                     rubric=session.rubric,
                     model_type=session.model_type,
@@ -752,14 +766,18 @@ class GradingExecutionUI:
                     references=session.references,
                     groq_model_name=groq_model_name,
                     uploaded_files=session.uploaded_files  # Pass uploaded files for on-demand RAG processing
-                )
+                ):
+                    self.result_queue.append(('result', result))
+                    completed_count += 1
                 
-                # Mark session as completed - completion callback will handle UI updates
                 session.is_active = False
-                session.is_paused = False
                 
-                # Note: Completion notification is now handled by grading_completed_callback
-                # instead of manually sending to progress_queue here
+                # Stop/pause cancel the engine: keep the partial results but do not report completion
+                if not self.grading_engine.is_cancelled:
+                    session.is_paused = False
+                    
+                    # Signal completion only after every result is in result_queue
+                    self.on_grading_completed(completed_count)
             else:
                 st.error("채점 엔진이 초기화되지 않았습니다.")
                 
@@ -777,7 +795,7 @@ class GradingExecutionUI:
             session.is_paused = False
             
             # Send error to UI thread
-            self.progress_queue.put(('thread_error', error_info))
+            self.progress_queue.append(('thread_error', error_info))
     
     def pause_grading(self):
         """Pause the grading process."""
@@ -844,37 +862,35 @@ class GradingExecutionUI:
         """Callback for progress updates."""
         try:
             # Use queue to safely communicate between threads
-            self.progress_queue.put(('progress', progress))
-        except Exception as e:
-            print(f"Error in progress update: {e}")
+            self.progress_queue.append(('progress', progress))
+        except Exception:
+            logger.exception("Error in progress update")
     
     def on_student_completed(self, student_status: StudentGradingStatus):
         """Callback for individual student completion."""
         try:
             if student_status.result:
                 # Use queue to safely pass results between threads
-                self.result_queue.put(('result', student_status.result))
+                self.result_queue.append(('result', student_status.result))
                 print(f"DEBUG: Queued result for {student_status.result.student_name}")
             else:
                 print(f"DEBUG: No result for student {student_status.student.name}")
-        except Exception as e:
-            error_msg = f"Error updating student results: {str(e)}"
-            print(error_msg)  # Fallback logging
+        except Exception:
+            logger.exception("Error updating student results")
     
     def on_grading_completed(self, completed_count: int):
         """Callback for overall grading completion."""
         try:
             print(f"DEBUG: on_grading_completed called with {completed_count} students")
             # Send completion signal to progress queue
-            self.progress_queue.put(('completed', completed_count))
+            self.progress_queue.append(('completed', completed_count))
             print(f"DEBUG: Completion signal put in queue")
             
             # Note: Do NOT set session state from background thread
             # It will be handled in the main thread via queue processing
                 
-        except Exception as e:
-            error_msg = f"Error handling grading completion: {str(e)}"
-            print(error_msg)  # Fallback logging
+        except Exception:
+            logger.exception("Error handling grading completion")
     
     def on_error(self, message: str, exception: Exception):
         """Callback for error handling with proper error categorization."""
@@ -899,80 +915,72 @@ class GradingExecutionUI:
             st.session_state.grading_errors.append(error_info)
             
             # Send to UI thread
-            self.progress_queue.put(('error', error_info))
+            self.progress_queue.append(('error', error_info))
             
         except Exception as e:
             # Fallback error handling
-            self.progress_queue.put(('error', f"Error handler failed: {e}"))
+            self.progress_queue.append(('error', f"Error handler failed: {e}"))
     
     def update_progress_from_queue(self):
         """Update UI from background thread queues with error handling."""
         print(f"DEBUG: update_progress_from_queue called")
         # Process progress updates
         should_rerun = False
-        queue_processed = False
-        processed_items = 0
-        try:
-            while True:
-                update_type, data = self.progress_queue.get_nowait()
-                queue_processed = True
-                processed_items += 1
-                print(f"DEBUG: Processing queue item #{processed_items}: {update_type}")
-                
-                if update_type == 'progress':
-                    # Safely update session state in main thread
-                    st.session_state.grading_progress = data
-                    should_rerun = True
-                
-                elif update_type == 'error':
-                    if isinstance(data, ErrorInfo):
-                        display_error(data)
-                    else:
-                        st.error(f"채점 오류: {data}")
-                    should_rerun = True
+        pending_updates = self._drain_queue(self.progress_queue)
+        
+        if pending_updates:
+            print(f"DEBUG: Queue drained {len(pending_updates)} items")
+        else:
+            print(f"DEBUG: Queue was empty")
+        
+        pending_updates = self._coalesce_progress_updates(pending_updates)
+        
+        for processed_items, (update_type, data) in enumerate(pending_updates, 1):
+            print(f"DEBUG: Processing queue item #{processed_items}: {update_type}")
+            
+            if update_type == 'progress':
+                # Safely update session state in main thread
+                st.session_state.grading_progress = data
+                should_rerun = True
+            
+            elif update_type == 'error':
+                if isinstance(data, ErrorInfo):
+                    display_error(data)
+                else:
+                    st.error(f"채점 오류: {data}")
+                should_rerun = True
+            
+            elif update_type == 'completed':
+                # Handle grading completion - show results immediately
+                print(f"DEBUG: Processing completed signal with {data} students")
+                if hasattr(st.session_state, 'grading_session') and st.session_state.grading_session:
+                    st.session_state.grading_session.is_active = False
+                    st.session_state.grading_session.is_paused = False
                 
-                elif update_type == 'completed':
-                    # Handle grading completion - show results immediately
-                    print(f"DEBUG: Processing completed signal with {data} students")
-                    if hasattr(st.session_state, 'grading_session') and st.session_state.grading_session:
-                        st.session_state.grading_session.is_active = False
-                        st.session_state.grading_session.is_paused = False
-                    
-                    # Set completion flag for UI to detect
-                    st.session_state.grading_completed = True
-                    st.session_state.completed_count = data
-                    print(f"DEBUG: Set grading_completed flag to True in main thread")
-                    
-                    st.success(f"🎉 채점이 완료되었습니다! 총 {data}명의 학생이 채점되었습니다.")
-                    st.info("📊 아래에서 실시간 채점 결과를 확인하거나, 상단 탭에서 '결과 보기'를 클릭하세요.")
-                    should_rerun = True
+                # Set completion flag for UI to detect
+                st.session_state.grading_completed = True
+                st.session_state.completed_count = data
+                print(f"DEBUG: Set grading_completed flag to True in main thread")
                 
-                elif update_type == 'thread_error':
-                    display_error(data)
-                    should_rerun = True
-                    if hasattr(st.session_state, 'grading_session') and st.session_state.grading_session:
-                        st.session_state.grading_session.is_active = False
-                    
-        except queue.Empty:
-            if queue_processed:
-                print(f"DEBUG: Queue processed {processed_items} items, now empty")
-            else:
-                print(f"DEBUG: Queue was empty")
-            pass
+                st.success(_GRADING_COMPLETED_MSG % data)
+                st.info("📊 아래에서 실시간 채점 결과를 확인하거나, 상단 탭에서 '결과 보기'를 클릭하세요.")
+                should_rerun = True
+            
+            elif update_type == 'thread_error':
+                display_error(data)
+                should_rerun = True
+                if hasattr(st.session_state, 'grading_session') and st.session_state.grading_session:
+                    st.session_state.grading_session.is_active = False
         
         # Process result updates first
-        try:
-            while True:
-                update_type, data = self.result_queue.get_nowait()
-                if update_type == 'result':
-                    # Safely update session state in main thread
-                    if 'student_results' not in st.session_state:
-                        st.session_state.student_results = []
-                    st.session_state.student_results.append(data)
-                    print(f"DEBUG: Added result for {data.student_name}, total results: {len(st.session_state.student_results)}")
-                    should_rerun = True
-        except queue.Empty:
-            pass
+        for update_type, data in self._drain_queue(self.result_queue):
+            if update_type == 'result':
+                # Safely update session state in main thread
+                if 'student_results' not in st.session_state:
+                    st.session_state.student_results = []
+                st.session_state.student_results.append(data)
+                print(f"DEBUG: Added result for {data.student_name}, total results: {len(st.session_state.student_results)}")
+                should_rerun = True
         
         # Check if all results are collected (completion detection via results)
         session = st.session_state.grading_session
@@ -989,6 +997,30 @@ class GradingExecutionUI:
         if should_rerun:
             st.rerun()
 
+    def _drain_queue(self, update_queue: deque) -> List:
+        """현재 쌓인 항목 수만큼만 꺼내 예외 없이 큐를 비웁니다."""
+        return [update_queue.popleft() for _ in range(len(update_queue))]
+    
+    def _coalesce_progress_updates(self, pending_updates: List) -> List:
+        """
+        UI가 밀려 진행 상황 업데이트가 과도하게 쌓이면 최신 상태만 남기고 병합합니다.
+        
+        오류 및 완료 신호는 병합하지 않고 순서대로 유지합니다.
+        """
+        progress_count = sum(1 for update_type, _ in pending_updates if update_type == 'progress')
+        if progress_count <= _MAX_PENDING_PROGRESS_UPDATES:
+            return pending_updates
+        
+        last_progress_index = max(
+            i for i, (update_type, _) in enumerate(pending_updates) if update_type == 'progress'
+        )
+        logger.warning(f"UI 응답 지연: {progress_count - 1}개 상태 메시지 병합")
+        
+        return [
+            item for i, item in enumerate(pending_updates)
+            if item[0] != 'progress' or i == last_progress_index
+        ]
+    
     def _cleanup_temp_directories(self):
         """Clean up temporary directories after grading completion."""
         if 'temp_directories' in st.session_state:
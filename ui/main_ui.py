@@ -9,6 +9,7 @@ from enum import Enum
 import os
 import tempfile
 import shutil
+from pathlib import Path
 
 
 def display_file_upload_error(error_info, filename: str = ""):
@@ -463,34 +464,21 @@ class MainUI:
                 # 서술형 채점 파일 처리
                 student_file = st.session_state.uploaded_files.get('student_data')
                 if student_file:
-                    # 업로드된 파일을 임시로 저장
-                    import tempfile
-                    import os
-                    
-                    with tempfile.NamedTemporaryFile(delete=False, suffix='.xlsx') as tmp_file:
-                        tmp_file.write(student_file.read())
-                        tmp_file_path = tmp_file.name
+                    # 업로드된 파일 객체를 임시 파일 없이 메모리에서 바로 처리
+                    result = file_service.process_student_data(
+                        excel_file_path=student_file,
+                        grading_type="descriptive"
+                    )
                     
-                    try:
-                        result = file_service.process_student_data(
-                            excel_file_path=tmp_file_path,
-                            grading_type="descriptive"
-                        )
-                        
-                        if result['success']:
-                            st.session_state.processed_students = result['students']
-                            st.success(f"✅ {len(result['students'])}명의 학생 데이터를 성공적으로 처리했습니다.")
+                    if result['success']:
+                        st.session_state.processed_students = result['students']
+                        st.success(f"✅ {len(result['students'])}명의 학생 데이터를 성공적으로 처리했습니다.")
+                    else:
+                        if 'error_info' in result:
+                            display_file_upload_error(result['error_info'], student_file.name)
                         else:
-                            if 'error_info' in result:
-                                display_file_upload_error(result['error_info'], student_file.name)
-                            else:
-                                st.error(f"❌ {result['message']}")
-                            return
-                    
-                    finally:
-                        # Clean up temporary file
-                        if os.path.exists(tmp_file_path):
-                            os.unlink(tmp_file_path)
+                            st.error(f"❌ {result['message']}")
+                        return
                 
                 # Store reference files without immediate RAG processing
                 reference_files = st.session_state.uploaded_files.get('reference_files')
@@ -504,53 +492,41 @@ class MainUI:
                 image_files = st.session_state.uploaded_files.get('image_files')
                 
                 if student_info_file and image_files:
-                    # Save uploaded files temporarily
                     import tempfile
                     import os
                     
-                    with tempfile.NamedTemporaryFile(delete=False, suffix='.xlsx') as tmp_file:
-                        tmp_file.write(student_info_file.read())
-                        tmp_file_path = tmp_file.name
-                    
-                    # Save image files temporarily
+                    # Save image files temporarily (the Excel file is read in memory)
                     temp_image_paths = []
                     temp_dir = tempfile.mkdtemp()
                     
-                    try:
-                        for image_file in image_files:
-                            image_path = os.path.join(temp_dir, image_file.name)
-                            with open(image_path, 'wb') as f:
-                                f.write(image_file.read())
-                            temp_image_paths.append(image_path)
-                        
-                        result = file_service.process_student_data(
-                            excel_file_path=tmp_file_path,
-                            grading_type="map",
-                            image_files=temp_image_paths
-                        )
-                        
-                        if result['success']:
-                            st.session_state.processed_students = result['students']
-                            # Store temp directories for cleanup after grading
-                            if 'temp_directories' not in st.session_state:
-                                st.session_state.temp_directories = []
-                            st.session_state.temp_directories.append(temp_dir)
-                            st.success(f"✅ {len(result['students'])}명의 학생 데이터를 성공적으로 처리했습니다.")
-                        else:
-                            if 'error_info' in result:
-                                display_file_upload_error(result['error_info'], student_info_file.name)
-                            else:
-                                st.error(f"❌ {result['message']}")
-                            # Clean up on failure
-                            import shutil
-                            if os.path.exists(temp_dir):
-                                shutil.rmtree(temp_dir)
-                            return
+                    for image_file in image_files:
+                        image_path = Path(temp_dir) / image_file.name
+                        image_path.write_bytes(image_file.getvalue())
+                        temp_image_paths.append(str(image_path))
                     
-                    finally:
-                        # Clean up Excel file only (keep image files for grading)
-                        if os.path.exists(tmp_file_path):
-                            os.unlink(tmp_file_path)
+                    result = file_service.process_student_data(
+                        excel_file_path=student_info_file,
+                        grading_type="map",
+                        image_files=temp_image_paths
+                    )
+                    
+                    if result['success']:
+                        st.session_state.processed_students = result['students']
+                        # Store temp directories for cleanup after grading
+                        if 'temp_directories' not in st.session_state:
+                            st.session_state.temp_directories = []
+                        st.session_state.temp_directories.append(temp_dir)
+                        st.success(f"✅ {len(result['students'])}명의 학생 데이터를 성공적으로 처리했습니다.")
+                    else:
+                        if 'error_info' in result:
+                            display_file_upload_error(result['error_info'], student_info_file.name)
+                        else:
+                            st.error(f"❌ {result['message']}")
+                        # Clean up on failure
+                        import shutil
+                        if os.path.exists(temp_dir):
+                            shutil.rmtree(temp_dir)
+                        return
             
         except Exception as e:
             error_info = handle_error(
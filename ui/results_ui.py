@@ -703,13 +703,16 @@ class ResultsUI:
         
         # Add element scores if available
         if results[0].element_scores:
+            # 학생별 요소 점수를 한 번씩만 사전으로 만들어 요소마다 목록을 다시 훑지 않음
+            scores_by_result = [
+                {e.element_name: e.score for e in result.element_scores}
+                for result in results
+            ]
             for element in results[0].element_scores:
                 element_name = element.element_name
-                data[f'{element_name}_점수'] = []
-                
-                for result in results:
-                    element_score = next((e.score for e in result.element_scores if e.element_name == element_name), 0)
-                    data[f'{element_name}_점수'].append(element_score)
+                data[f'{element_name}_점수'] = [
+                    scores.get(element_name, 0) for scores in scores_by_result
+                ]
         
         # Create correlation matrix
         df = pd.DataFrame(data)
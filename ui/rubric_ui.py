@@ -97,19 +97,23 @@ class RubricUI:
         
         # Sample element 1: Content accuracy
         content_element = EvaluationElement(name="내용 정확성")
-        content_element.add_criteria(score=5, description="모든 내용이 정확하고 완전함")
-        content_element.add_criteria(score=4, description="대부분의 내용이 정확함")
-        content_element.add_criteria(score=3, description="일부 내용이 정확함")
-        content_element.add_criteria(score=2, description="내용이 부분적으로 정확함")
-        content_element.add_criteria(score=1, description="내용이 대부분 부정확함")
-        content_element.add_criteria(score=0, description="내용이 완전히 부정확하거나 없음")
+        content_element.add_criteria_bulk([
+            (5, "모든 내용이 정확하고 완전함"),
+            (4, "대부분의 내용이 정확함"),
+            (3, "일부 내용이 정확함"),
+            (2, "내용이 부분적으로 정확함"),
+            (1, "내용이 대부분 부정확함"),
+            (0, "내용이 완전히 부정확하거나 없음"),
+        ])
         
         # Sample element 2: Explanation quality
         explanation_element = EvaluationElement(name="설명의 질")
-        explanation_element.add_criteria(score=3, description="논리적이고 명확한 설명")
-        explanation_element.add_criteria(score=2, description="대체로 명확한 설명")
-        explanation_element.add_criteria(score=1, description="부분적으로 명확한 설명")
-        explanation_element.add_criteria(score=0, description="설명이 불명확하거나 없음")
+        explanation_element.add_criteria_bulk([
+            (3, "논리적이고 명확한 설명"),
+            (2, "대체로 명확한 설명"),
+            (1, "부분적으로 명확한 설명"),
+            (0, "설명이 불명확하거나 없음"),
+        ])
         
         sample_rubric.add_element(content_element)
         sample_rubric.add_element(explanation_element)
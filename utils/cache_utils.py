@@ -0,0 +1,99 @@
+"""
+디스크 기반 캐시 유틸리티
+
+SQLite 파일 하나에 키-값을 저장 시각과 함께 보관하여, 앱을 다시 시작해도
+만료 시간(TTL) 안의 결과를 재사용할 수 있는 캐시를 제공합니다.
+"""
+
+import os
+import time
+import logging
+import sqlite3
+import threading
+from typing import Optional, Union
+
+
+logger = logging.getLogger(__name__)
+
+
+class DiskCache:
+    """
+    SQLite 기반 TTL 키-값 캐시
+    
+    하나의 연결을 잠금으로 보호하므로 여러 채점 스레드에서 함께 사용할 수 있습니다.
+    값은 문자열 또는 바이트로 저장합니다.
+    """
+    
+    def __init__(self, path: str, ttl_seconds: Optional[float] = None):
+        """
+        캐시 파일을 열거나 새로 만듭니다.
+        
+        Args:
+            path: SQLite 파일 경로 (상위 디렉터리는 자동 생성)
+            ttl_seconds: 항목 유효 시간(초), None이면 만료되지 않음
+        """
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        
+        self.path = path
+        self.ttl_seconds = ttl_seconds
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(path, check_same_thread=False, isolation_level=None)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS cache ("
+            "key TEXT PRIMARY KEY, value BLOB NOT NULL, created_at REAL NOT NULL)"
+        )
+    
+    def get(self, key: str) -> Optional[Union[str, bytes]]:
+        """키에 해당하는 값 조회 (없거나 만료되었으면 None)"""
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT value, created_at FROM cache WHERE key = ?", (key,)
+            ).fetchone()
+            if row is None:
+                return None
+            
+            value, created_at = row
+            if self.ttl_seconds is not None and time.time() - created_at > self.ttl_seconds:
+                self._conn.execute("DELETE FROM cache WHERE key = ?", (key,))
+                return None
+            return value
+    
+    def set(self, key: str, value: Union[str, bytes]):
+        """값 저장 (같은 키가 있으면 덮어쓰고 저장 시각 갱신)"""
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO cache (key, value, created_at) VALUES (?, ?, ?)",
+                (key, value, time.time())
+            )
+    
+    def delete(self, key: str):
+        """키 삭제"""
+        with self._lock:
+            self._conn.execute("DELETE FROM cache WHERE key = ?", (key,))
+    
+    def purge_expired(self) -> int:
+        """만료된 항목을 모두 삭제하고 삭제된 개수 반환"""
+        if self.ttl_seconds is None:
+            return 0
+        with self._lock:
+            cursor = self._conn.execute(
+                "DELETE FROM cache WHERE created_at < ?", (time.time() - self.ttl_seconds,)
+            )
+            return cursor.rowcount
+    
+    def clear(self):
+        """모든 항목 삭제"""
+        with self._lock:
+            self._conn.execute("DELETE FROM cache")
+    
+    def close(self):
+        """연결 닫기"""
+        with self._lock:
+            self._conn.close()
+    
+    def __len__(self) -> int:
+        with self._lock:
+            return self._conn.execute("SELECT COUNT(*) FROM cache").fetchone()[0]
@@ -5,6 +5,8 @@
 다양한 오류 시나리오에 대한 복구 메커니즘을 제공합니다.
 """
 
+import re
+import random
 import logging
 import traceback
 from typing import Dict, Any, Optional, List, Callable
@@ -13,6 +15,48 @@ from dataclasses import dataclass
 import time
 import streamlit as st
 
+from config import config
+
+
+# API 오류 메시지에 포함된 재시도 대기 시간 (예: "Please retry in 13.5s", "Retry-After: 20")
+_RETRY_AFTER_RE = re.compile(r'retry(?:[-\s]after|\s+in)\D{0,3}(\d+(?:\.\d+)?)', re.IGNORECASE)
+
+
+def compute_retry_delay(attempt: int, error: Optional[BaseException] = None) -> float:
+    """
+    다음 재시도까지 대기할 시간(초) 계산
+    
+    서버가 알려준 대기 시간(응답의 Retry-After 헤더 또는 오류 메시지의 "retry in Ns")이
+    있으면 그 값을 따르고, 없으면 지터를 섞은 지수 백오프를 사용하여 동시에 실패한
+    요청들이 같은 시각에 몰려 재시도하지 않도록 합니다. 감싼 예외의 원인 예외도 확인합니다.
+    
+    Args:
+        attempt: 0부터 시작하는 실패한 시도 번호
+        error: 발생한 예외
+        
+    Returns:
+        대기 시간(초), 최대 config.RETRY_BACKOFF_MAX_SECONDS
+    """
+    seen = set()
+    while error is not None and id(error) not in seen:
+        seen.add(id(error))
+        retry_after = None
+        headers = getattr(getattr(error, "response", None), "headers", None)
+        if headers is not None:
+            retry_after = headers.get("retry-after")
+        if retry_after is None:
+            match = _RETRY_AFTER_RE.search(str(error))
+            retry_after = match.group(1) if match else None
+        if retry_after is not None:
+            try:
+                return min(float(retry_after), config.RETRY_BACKOFF_MAX_SECONDS)
+            except ValueError:
+                pass
+        error = error.__cause__ or error.__context__
+    
+    backoff = min(config.RETRY_BACKOFF_MAX_SECONDS, config.RETRY_BACKOFF_BASE_SECONDS * 2 ** attempt)
+    return backoff * (0.5 + random.random())
+
 
 class ErrorType(Enum):
     """범주화된 처리를 위한 오류 유형 열거형"""
@@ -35,7 +79,7 @@ class ErrorSeverity(Enum):
     CRITICAL = "critical"
 
 
-@dataclass
+@dataclass(slots=True)
 class ErrorInfo:
     """구조화된 오류 정보"""
     error_type: ErrorType
@@ -61,7 +105,6 @@ class ErrorHandler:
         """Initialize error handler with logging configuration."""
         self.logger = logging.getLogger(__name__)
         self.error_history: List[ErrorInfo] = []
-        self.retry_delays = [1, 2, 4, 8, 16]  # Exponential backoff delays
         
         # Configure logging if not already configured
         if not self.logger.handlers:
@@ -465,8 +508,9 @@ class ErrorHandler:
                 error_info = self.handle_error(e, error_type, context, retry_count=attempt)
                 
                 if attempt < max_retries and error_info.retry_possible:
-                    delay = self.retry_delays[min(attempt, len(self.retry_delays) - 1)]
-                    self.logger.info(f"Retrying in {delay} seconds... (attempt {attempt + 1}/{max_retries})")
+                    # 지터 백오프, 서버가 Retry-After를 알려주면 그 시간만큼 대기
+                    delay = compute_retry_delay(attempt, e)
+                    self.logger.info(f"Retrying in {delay:.1f} seconds... (attempt {attempt + 1}/{max_retries})")
                     time.sleep(delay)
                 else:
                     break
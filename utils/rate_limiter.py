@@ -0,0 +1,59 @@
+"""
+API 요청 속도 제한 유틸리티
+
+제공자별 분당 요청 한도(RPM)에 맞춰 요청 간격을 조절하는 토큰 버킷을 제공합니다.
+한도를 넘는 요청을 보내 429 오류와 재시도 대기를 반복하는 대신, 보내기 전에 필요한 만큼만 기다립니다.
+"""
+
+import time
+import threading
+from typing import Optional
+
+
+class RateLimiter:
+    """
+    스레드 안전 토큰 버킷
+    
+    토큰이 모자라면 다음 토큰이 채워질 시점까지 미리 예약하고 그만큼만 대기하므로,
+    여러 채점 스레드가 동시에 요청해도 도착 순서대로 일정한 간격으로 통과합니다.
+    """
+    
+    def __init__(self, requests_per_minute: float, burst: Optional[float] = None):
+        """
+        토큰 버킷을 초기화합니다.
+        
+        Args:
+            requests_per_minute: 분당 허용 요청 수, 0 이하이면 제한하지 않음
+            burst: 한꺼번에 보낼 수 있는 최대 요청 수 (기본값: 1초 분량, 최소 1)
+        """
+        self.rate = max(requests_per_minute, 0) / 60.0
+        self.capacity = burst if burst is not None else max(1.0, self.rate)
+        self._tokens = self.capacity
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+    
+    @property
+    def enabled(self) -> bool:
+        """속도 제한 사용 여부"""
+        return self.rate > 0
+    
+    def acquire(self) -> float:
+        """
+        요청 하나를 보낼 수 있을 때까지 대기
+        
+        Returns:
+            실제로 대기한 시간(초)
+        """
+        if not self.enabled:
+            return 0.0
+        
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+            self._updated = now
+            self._tokens -= 1
+            wait = -self._tokens / self.rate if self._tokens < 0 else 0.0
+        
+        if wait > 0:
+            time.sleep(wait)
+        return wait